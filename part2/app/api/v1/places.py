@@ -15,7 +15,7 @@ place_model = api.model('Place', {
     'price': fields.Float(required=True, description='Price per night'),
     'latitude': fields.Float(required=True, description='Latitude coordinate'),
     'longitude': fields.Float(required=True, description='Longitude coordinate'),
-    'owner_id': fields.String(required=True, description='ID of the place owner')
+    'owner_id': fields.String(required=True, description='ID of the place owner'),
     'amenity_ids': fields.List(fields.String, description='List of amenity IDs')
 })
 
@@ -1,4 +1,25 @@
-"""
-API Version 1 Package
-RESTful endpoints for version 1 of the API
-"""
\ No newline at end of file
+"""
+API Version 1 Package
+RESTful endpoints for version 1 of the API
+"""
+
+from flask import g
+from flask_jwt_extended import get_jwt, get_jwt_identity
+
+
+def current_identity_and_claims():
+    """
+    Return the (identity, claims) pair for the current request.
+
+    Endpoints that need both the user ID and the token claims used to call
+    get_jwt_identity() and get_jwt() separately, each of which walks the
+    JWT request context again. The decoded pair is cached on flask.g so the
+    lookup happens once per request no matter how often it is needed.
+
+    Returns:
+        tuple: (identity, claims) where identity is the user ID string from
+               the token and claims is the decoded claims dict
+    """
+    if 'jwt_identity_and_claims' not in g:
+        g.jwt_identity_and_claims = (get_jwt_identity(), get_jwt())
+    return g.jwt_identity_and_claims
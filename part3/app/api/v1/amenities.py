@@ -1,135 +1,204 @@
-"""
-Amenity API endpoints
-Handles CRUD operations for amenities through RESTful API
-"""
-
-from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt  # ADMIN ADDITION: Added JWT imports
-from app.services import facade
-
-# Create namespace for amenity operations
-api = Namespace('amenities', description='Amenity operations')
-
-# Define the amenity model for input validation and documentation
-amenity_model = api.model('Amenity', {
-    'name': fields.String(required=True, description='Name of the amenity')
-})
-
-
-@api.route('/')
-class AmenityList(Resource):
-    """
-    Handles operations on the amenity collection
-    - GET: Retrieve list of all amenities (PUBLIC)
-    - POST: Create a new amenity (ADMIN ONLY)  # ADMIN ADDITION: Now requires admin
-    """
-    
-    @api.response(200, 'List of amenities retrieved successfully')
-    def get(self):
-        """
-        Retrieve a list of all amenities (PUBLIC)
-        
-        Returns:
-            list: List of amenity dictionaries with status 200
-        """
-        amenities = facade.get_all_amenities()
-        return [amenity.to_dict() for amenity in amenities], 200
-    
-    @jwt_required()  # ADMIN ADDITION: Requires authentication
-    @api.expect(amenity_model, validate=True)
-    @api.response(201, 'Amenity successfully created')
-    @api.response(400, 'Invalid input data or amenity already exists')
-    @api.response(403, 'Admin privileges required')  # ADMIN ADDITION: New error response
-    def post(self):
-        """
-        Create a new amenity (ADMIN ONLY)
-        
-        ADMIN ADDITION: This endpoint is now restricted to administrators only.
-        Only admins can create new amenities in the system.
-        
-        Returns:
-            dict: Created amenity data with status 201
-            dict: Error message with status 403 if not admin
-        """
-        # ADMIN ADDITION: Check if user is admin
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
-        
-        if not is_admin:
-            return {'error': 'Admin privileges required'}, 403
-        
-        amenity_data = api.payload
-        
-        try:
-            new_amenity = facade.create_amenity(amenity_data)
-            return new_amenity.to_dict(), 201
-        except ValueError as e:
-            return {'error': str(e)}, 400
-
-
-@api.route('/<amenity_id>')
-@api.param('amenity_id', 'The amenity identifier')
-class AmenityResource(Resource):
-    """
-    Handles operations on individual amenities
-    - GET: Retrieve amenity details (PUBLIC)
-    - PUT: Update amenity information (ADMIN ONLY)  # ADMIN ADDITION: Now requires admin
-    """
-    
-    @api.response(200, 'Amenity details retrieved successfully')
-    @api.response(404, 'Amenity not found')
-    def get(self, amenity_id):
-        """
-        Get amenity details by ID (PUBLIC)
-        
-        Args:
-            amenity_id (str): Amenity's unique identifier
-            
-        Returns:
-            dict: Amenity data with status 200 if found
-        """
-        amenity = facade.get_amenity(amenity_id)
-        
-        if not amenity:
-            return {'error': 'Amenity not found'}, 404
-        
-        return amenity.to_dict(), 200
-    
-    @jwt_required()  # ADMIN ADDITION: Requires authentication
-    @api.expect(amenity_model)
-    @api.response(200, 'Amenity successfully updated')
-    @api.response(404, 'Amenity not found')
-    @api.response(400, 'Invalid input data')
-    @api.response(403, 'Admin privileges required')  # ADMIN ADDITION: New error response
-    def put(self, amenity_id):
-        """
-        Update amenity information (ADMIN ONLY)
-        
-        ADMIN ADDITION: This endpoint is now restricted to administrators only.
-        Only admins can modify existing amenities.
-        
-        Args:
-            amenity_id (str): Amenity's unique identifier
-            
-        Returns:
-            dict: Updated amenity data with status 200
-            dict: Error message with status 403 if not admin
-        """
-        # ADMIN ADDITION: Check if user is admin
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
-        
-        if not is_admin:
-            return {'error': 'Admin privileges required'}, 403
-        
-        amenity_data = api.payload
-        
-        try:
-            updated_amenity = facade.update_amenity(amenity_id, amenity_data)
-            
-            if not updated_amenity:
-                return {'error': 'Amenity not found'}, 404
-            
-            return updated_amenity.to_dict(), 200
-        except ValueError as e:
-            return {'error': str(e)}, 400
\ No newline at end of file
+"""
+Amenity API endpoints
+Handles CRUD operations for amenities through RESTful API
+"""
+
+import hashlib
+import json
+from functools import wraps
+from operator import methodcaller
+
+from flask import Response
+from jsonschema import Draft4Validator
+from flask_restx import Namespace, Resource, fields
+from flask_jwt_extended import jwt_required  # ADMIN ADDITION: Added JWT imports
+from app.api.v1 import current_identity_and_claims  # PERFORMANCE: Per-request JWT cache
+from app.services import facade
+
+# Create namespace for amenity operations
+api = Namespace('amenities', description='Amenity operations')
+
+# CACHING: Pre-serialized response for the amenity collection GET.
+# Amenities only change through the admin POST/PUT handlers below, so the
+# JSON body can be rendered once and reused until the next write invalidates it.
+_list_cache = {'body': None, 'etag': None}
+
+# PERFORMANCE: C-level to_dict dispatch for list serialization; map() with
+# methodcaller avoids one interpreter frame per element compared to a
+# list comprehension
+_to_dict = methodcaller('to_dict')
+
+
+def _invalidate_list_cache():
+    """Drop the cached amenity-list response after a write"""
+    _list_cache['body'] = None
+    _list_cache['etag'] = None
+
+# Define the amenity model for input validation and documentation
+amenity_model = api.model('Amenity', {
+    'name': fields.String(required=True, description='Name of the amenity')
+})
+
+# VALIDATION: Compile the JSON schema once at import time. Flask-RESTX's
+# validate=True rebuilds a Draft4Validator on every request; reusing one
+# precompiled validator amortizes that cost across all requests.
+_amenity_validator = Draft4Validator(amenity_model.__schema__)
+
+
+def _validate_payload(validator):
+    """
+    Decorator that validates api.payload with a precompiled schema validator
+
+    Returns the same 400 body Flask-RESTX produces for validate=True, so
+    clients see no behavioral difference on invalid input.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            errors = {
+                '.'.join(str(p) for p in error.absolute_path) or 'payload': error.message
+                for error in validator.iter_errors(api.payload or {})
+            }
+            if errors:
+                return {'errors': errors, 'message': 'Input payload validation failed'}, 400
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@api.route('/')
+class AmenityList(Resource):
+    """
+    Handles operations on the amenity collection
+    - GET: Retrieve list of all amenities (PUBLIC)
+    - POST: Create a new amenity (ADMIN ONLY)  # ADMIN ADDITION: Now requires admin
+    """
+    
+    @api.response(200, 'List of amenities retrieved successfully')
+    def get(self):
+        """
+        Retrieve a list of all amenities (PUBLIC)
+        
+        Returns:
+            list: List of amenity dictionaries with status 200
+        """
+        # CACHING: Serve the pre-serialized body when it is still valid;
+        # rebuild it only after a write has invalidated the cache
+        if _list_cache['body'] is None:
+            amenities = facade.get_all_amenities()
+            body = json.dumps(list(map(_to_dict, amenities)))
+            _list_cache['body'] = body
+            _list_cache['etag'] = hashlib.md5(body.encode('utf-8')).hexdigest()
+
+        return Response(
+            _list_cache['body'],
+            mimetype='application/json',
+            headers={'ETag': _list_cache['etag']}
+        )
+    
+    @jwt_required()  # ADMIN ADDITION: Requires authentication
+    @api.expect(amenity_model)
+    @_validate_payload(_amenity_validator)  # VALIDATION: Precompiled schema check
+    @api.response(201, 'Amenity successfully created')
+    @api.response(400, 'Invalid input data or amenity already exists')
+    @api.response(403, 'Admin privileges required')  # ADMIN ADDITION: New error response
+    def post(self):
+        """
+        Create a new amenity (ADMIN ONLY)
+        
+        ADMIN ADDITION: This endpoint is now restricted to administrators only.
+        Only admins can create new amenities in the system.
+        
+        Returns:
+            dict: Created amenity data with status 201
+            dict: Error message with status 403 if not admin
+        """
+        # ADMIN ADDITION: Check if user is admin (claims cached per request)
+        _, claims = current_identity_and_claims()
+        is_admin = claims.get('is_admin', False)
+        
+        if not is_admin:
+            return {'error': 'Admin privileges required'}, 403
+        
+        amenity_data = api.payload
+        
+        # PERFORMANCE: Branch on the facade's (object, error) contract
+        # instead of paying for exception unwinding on every bad input
+        new_amenity, error = facade.create_amenity(amenity_data)
+        if error:
+            return {'error': error}, 400
+
+        # CACHING: The collection changed, drop the cached list response
+        _invalidate_list_cache()
+        return new_amenity.to_dict(), 201
+
+
+@api.route('/<amenity_id>')
+@api.param('amenity_id', 'The amenity identifier')
+class AmenityResource(Resource):
+    """
+    Handles operations on individual amenities
+    - GET: Retrieve amenity details (PUBLIC)
+    - PUT: Update amenity information (ADMIN ONLY)  # ADMIN ADDITION: Now requires admin
+    """
+    
+    @api.response(200, 'Amenity details retrieved successfully')
+    @api.response(404, 'Amenity not found')
+    def get(self, amenity_id):
+        """
+        Get amenity details by ID (PUBLIC)
+        
+        Args:
+            amenity_id (str): Amenity's unique identifier
+            
+        Returns:
+            dict: Amenity data with status 200 if found
+        """
+        amenity = facade.get_amenity(amenity_id)
+        
+        if not amenity:
+            return {'error': 'Amenity not found'}, 404
+        
+        return amenity.to_dict(), 200
+    
+    @jwt_required()  # ADMIN ADDITION: Requires authentication
+    @api.expect(amenity_model)
+    @api.response(200, 'Amenity successfully updated')
+    @api.response(404, 'Amenity not found')
+    @api.response(400, 'Invalid input data')
+    @api.response(403, 'Admin privileges required')  # ADMIN ADDITION: New error response
+    def put(self, amenity_id):
+        """
+        Update amenity information (ADMIN ONLY)
+        
+        ADMIN ADDITION: This endpoint is now restricted to administrators only.
+        Only admins can modify existing amenities.
+        
+        Args:
+            amenity_id (str): Amenity's unique identifier
+            
+        Returns:
+            dict: Updated amenity data with status 200
+            dict: Error message with status 403 if not admin
+        """
+        # ADMIN ADDITION: Check if user is admin (claims cached per request)
+        _, claims = current_identity_and_claims()
+        is_admin = claims.get('is_admin', False)
+        
+        if not is_admin:
+            return {'error': 'Admin privileges required'}, 403
+        
+        amenity_data = api.payload
+        
+        # PERFORMANCE: Branch on the facade's (object, error) contract
+        # instead of paying for exception unwinding on every bad input
+        updated_amenity, error = facade.update_amenity(amenity_id, amenity_data)
+        if error:
+            return {'error': error}, 400
+
+        if not updated_amenity:
+            return {'error': 'Amenity not found'}, 404
+
+        # CACHING: The collection changed, drop the cached list response
+        _invalidate_list_cache()
+        return updated_amenity.to_dict(), 200
\ No newline at end of file
@@ -1,230 +1,313 @@
-"""
-Place API endpoints
-Handles CRUD operations for places through RESTful API
-"""
-
-from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt  # ADMIN ADDITION: Added get_jwt
-from app.services import facade
-
-# Create namespace for place operations
-api = Namespace('places', description='Place operations')
-
-# Define the place model for input validation and documentation
-place_model = api.model('Place', {
-    'title': fields.String(required=True, description='Title of the place'),
-    'description': fields.String(required=True, description='Description of the place'),
-    'price': fields.Float(required=True, description='Price per night'),
-    'latitude': fields.Float(required=True, description='Latitude of the place'),
-    'longitude': fields.Float(required=True, description='Longitude of the place'),
-    'owner_id': fields.String(required=True, description='ID of the owner')
-})
-
-
-@api.route('/')
-class PlaceList(Resource):
-    """
-    Handles operations on the place collection
-    - GET: Retrieve list of all places (PUBLIC)
-    - POST: Create a new place (AUTHENTICATED)
-    """
-    
-    @api.response(200, 'List of places retrieved successfully')
-    def get(self):
-        """
-        Retrieve a list of all places (PUBLIC - No authentication required)
-        
-        Returns:
-            list: List of place dictionaries with status 200
-            
-        Example Response:
-            [
-                {
-                    "id": "uuid-1",
-                    "title": "Beach House",
-                    "description": "Beautiful beach house",
-                    "price": 150.0,
-                    "latitude": 34.0522,
-                    "longitude": -118.2437,
-                    "owner_id": "owner-uuid"
-                },
-                ...
-            ]
-        """
-        places = facade.get_all_places()
-        return [place.to_dict() for place in places], 200
-    
-    @jwt_required()  # JWT AUTHENTICATION: Requires valid token
-    @api.expect(place_model, validate=True)
-    @api.response(201, 'Place successfully created')
-    @api.response(400, 'Invalid input data')
-    @api.response(401, 'Unauthorized - Invalid or missing token')
-    def post(self):
-        """
-        Create a new place (AUTHENTICATED - Requires JWT token)
-        
-        The authenticated user becomes the owner of the place.
-        The owner_id is automatically set from the JWT token.
-        
-        Returns:
-            dict: Created place data with status 201
-            dict: Error message with status 400 if validation fails
-            
-        Example Request:
-            Headers:
-                Authorization: Bearer <jwt_token>
-            Body:
-                {
-                    "title": "Beach House",
-                    "description": "Beautiful beach house",
-                    "price": 150.0,
-                    "latitude": 34.0522,
-                    "longitude": -118.2437,
-                    "owner_id": "will-be-overwritten"
-                }
-                
-        Example Success Response:
-            {
-                "id": "uuid",
-                "title": "Beach House",
-                "description": "Beautiful beach house",
-                "price": 150.0,
-                "latitude": 34.0522,
-                "longitude": -118.2437,
-                "owner_id": "authenticated-user-uuid"
-            }
-        """
-        # JWT AUTHENTICATION: Get the current user's ID from the JWT token
-        current_user = get_jwt_identity()
-        
-        place_data = api.payload
-        
-        # OWNERSHIP VALIDATION: Set owner_id to the authenticated user
-        place_data['owner_id'] = current_user
-        
-        try:
-            new_place = facade.create_place(place_data)
-            return new_place.to_dict(), 201
-        except ValueError as e:
-            return {'error': str(e)}, 400
-
-
-@api.route('/<place_id>')
-@api.param('place_id', 'The place identifier')
-class PlaceResource(Resource):
-    """
-    Handles operations on individual places
-    - GET: Retrieve place details (PUBLIC)
-    - PUT: Update place information (AUTHENTICATED - Owner or ADMIN)
-    """
-    
-    @api.response(200, 'Place details retrieved successfully')
-    @api.response(404, 'Place not found')
-    def get(self, place_id):
-        """
-        Get place details by ID (PUBLIC - No authentication required)
-        
-        Args:
-            place_id (str): Place's unique identifier
-            
-        Returns:
-            dict: Place data with status 200 if found
-            dict: Error message with status 404 if not found
-            
-        Example Response:
-            {
-                "id": "uuid",
-                "title": "Beach House",
-                "description": "Beautiful beach house",
-                "price": 150.0,
-                "latitude": 34.0522,
-                "longitude": -118.2437,
-                "owner_id": "owner-uuid"
-            }
-        """
-        place = facade.get_place(place_id)
-        
-        if not place:
-            return {'error': 'Place not found'}, 404
-        
-        return place.to_dict(), 200
-    
-    @jwt_required()  # JWT AUTHENTICATION: Requires valid token
-    @api.expect(place_model)
-    @api.response(200, 'Place successfully updated')
-    @api.response(404, 'Place not found')
-    @api.response(403, 'Unauthorized action')
-    @api.response(400, 'Invalid input data')
-    @api.response(401, 'Unauthorized - Invalid or missing token')
-    def put(self, place_id):
-        """
-        Update place information (AUTHENTICATED - Owner or ADMIN)
-        
-        Only the owner of the place can modify its information,
-        UNLESS the user is an administrator.
-        
-        ADMIN ADDITION: Administrators can now modify ANY place,
-        bypassing the ownership restriction that applies to regular users.
-        
-        Args:
-            place_id (str): Place's unique identifier
-            
-        Returns:
-            dict: Updated place data with status 200
-            dict: Error message with status 403 if not owner (and not admin)
-            dict: Error message with status 404 if place not found
-            
-        Example Request:
-            Headers:
-                Authorization: Bearer <jwt_token>
-            Body:
-                {
-                    "title": "Updated Beach House",
-                    "description": "Even more beautiful",
-                    "price": 200.0
-                }
-                
-        Example Success Response:
-            {
-                "id": "uuid",
-                "title": "Updated Beach House",
-                "description": "Even more beautiful",
-                "price": 200.0,
-                "latitude": 34.0522,
-                "longitude": -118.2437,
-                "owner_id": "owner-uuid"
-            }
-            
-        Example Error Response (Non-Owner):
-            {
-                "error": "Unauthorized action"
-            }
-        """
-        # JWT AUTHENTICATION: Get the current user's ID from the JWT token
-        current_user = get_jwt_identity()
-        
-        # ADMIN ADDITION: Get admin status from JWT claims
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
-        
-        place = facade.get_place(place_id)
-        
-        if not place:
-            return {'error': 'Place not found'}, 404
-        
-        # ADMIN ADDITION: Ownership validation with admin bypass
-        # Admins can modify any place, regular users only their own
-        if not is_admin and str(place.owner_id) != current_user:
-            return {'error': 'Unauthorized action'}, 403
-        
-        place_data = api.payload
-        
-        # Security: Prevent changing the owner_id
-        if 'owner_id' in place_data:
-            del place_data['owner_id']
-        
-        try:
-            updated_place = facade.update_place(place_id, place_data)
-            return updated_place.to_dict(), 200
-        except ValueError as e:
-            return {'error': str(e)}, 400
\ No newline at end of file
+"""
+Place API endpoints
+Handles CRUD operations for places through RESTful API
+"""
+
+import hashlib
+import json
+from functools import wraps
+from operator import methodcaller
+
+from flask import Response
+from jsonschema import Draft4Validator
+from flask_restx import Namespace, Resource, fields
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.api.v1 import current_identity_and_claims  # PERFORMANCE: Per-request JWT cache
+from app.services import facade
+
+# Create namespace for place operations
+api = Namespace('places', description='Place operations')
+
+# CACHING: Pre-serialized response for the place collection GET.
+# Places only change through the authenticated POST/PUT handlers below, so
+# the JSON body can be rendered once and reused until the next write
+# invalidates it.
+_list_cache = {'body': None, 'etag': None}
+
+# PERFORMANCE: C-level to_dict dispatch for list serialization; map() with
+# methodcaller avoids one interpreter frame per element compared to a
+# list comprehension
+_to_dict = methodcaller('to_dict')
+
+
+def _invalidate_list_cache():
+    """Drop the cached place-list response after a write"""
+    _list_cache['body'] = None
+    _list_cache['etag'] = None
+
+# Define the place model for input validation and documentation
+place_model = api.model('Place', {
+    'title': fields.String(required=True, description='Title of the place'),
+    'description': fields.String(required=True, description='Description of the place'),
+    'price': fields.Float(required=True, description='Price per night'),
+    'latitude': fields.Float(required=True, description='Latitude of the place'),
+    'longitude': fields.Float(required=True, description='Longitude of the place'),
+    'owner_id': fields.String(required=True, description='ID of the owner')
+})
+
+# VALIDATION: Compile the JSON schema once at import time. Flask-RESTX's
+# validate=True rebuilds a Draft4Validator on every request; reusing one
+# precompiled validator amortizes that cost across all requests.
+_place_validator = Draft4Validator(place_model.__schema__)
+
+# PERFORMANCE: Allowed payload keys, hashed once at import. Filtering the
+# payload with a set intersection keeps extraneous client fields from ever
+# reaching the facade or bloating model attributes.
+_PLACE_KEYS = frozenset((
+    'title', 'description', 'price', 'latitude', 'longitude',
+    'owner_id', 'amenity_ids'
+))
+
+
+def _validate_payload(validator):
+    """
+    Decorator that validates api.payload with a precompiled schema validator
+
+    Returns the same 400 body Flask-RESTX produces for validate=True, so
+    clients see no behavioral difference on invalid input.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            errors = {
+                '.'.join(str(p) for p in error.absolute_path) or 'payload': error.message
+                for error in validator.iter_errors(api.payload or {})
+            }
+            if errors:
+                return {'errors': errors, 'message': 'Input payload validation failed'}, 400
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@api.route('/')
+class PlaceList(Resource):
+    """
+    Handles operations on the place collection
+    - GET: Retrieve list of all places (PUBLIC)
+    - POST: Create a new place (AUTHENTICATED)
+    """
+    
+    @api.response(200, 'List of places retrieved successfully')
+    def get(self):
+        """
+        Retrieve a list of all places (PUBLIC - No authentication required)
+        
+        Returns:
+            list: List of place dictionaries with status 200
+            
+        Example Response:
+            [
+                {
+                    "id": "uuid-1",
+                    "title": "Beach House",
+                    "description": "Beautiful beach house",
+                    "price": 150.0,
+                    "latitude": 34.0522,
+                    "longitude": -118.2437,
+                    "owner_id": "owner-uuid"
+                },
+                ...
+            ]
+        """
+        # CACHING: Serve the pre-serialized body when it is still valid;
+        # rebuild it only after a write has invalidated the cache
+        if _list_cache['body'] is None:
+            places = facade.get_all_places()
+            body = json.dumps(list(map(_to_dict, places)))
+            _list_cache['body'] = body
+            _list_cache['etag'] = hashlib.md5(body.encode('utf-8')).hexdigest()
+
+        return Response(
+            _list_cache['body'],
+            mimetype='application/json',
+            headers={'ETag': _list_cache['etag']}
+        )
+    
+    @jwt_required()  # JWT AUTHENTICATION: Requires valid token
+    @api.expect(place_model)
+    @_validate_payload(_place_validator)  # VALIDATION: Precompiled schema check
+    @api.response(201, 'Place successfully created')
+    @api.response(400, 'Invalid input data')
+    @api.response(401, 'Unauthorized - Invalid or missing token')
+    def post(self):
+        """
+        Create a new place (AUTHENTICATED - Requires JWT token)
+        
+        The authenticated user becomes the owner of the place.
+        The owner_id is automatically set from the JWT token.
+        
+        Returns:
+            dict: Created place data with status 201
+            dict: Error message with status 400 if validation fails
+            
+        Example Request:
+            Headers:
+                Authorization: Bearer <jwt_token>
+            Body:
+                {
+                    "title": "Beach House",
+                    "description": "Beautiful beach house",
+                    "price": 150.0,
+                    "latitude": 34.0522,
+                    "longitude": -118.2437,
+                    "owner_id": "will-be-overwritten"
+                }
+                
+        Example Success Response:
+            {
+                "id": "uuid",
+                "title": "Beach House",
+                "description": "Beautiful beach house",
+                "price": 150.0,
+                "latitude": 34.0522,
+                "longitude": -118.2437,
+                "owner_id": "authenticated-user-uuid"
+            }
+        """
+        # JWT AUTHENTICATION: Get the current user's ID from the JWT token
+        current_user = get_jwt_identity()
+        
+        # PERFORMANCE: Keep only known place fields; the set intersection
+        # runs in C over hashed keys before the facade sees the payload
+        payload = api.payload
+        place_data = {key: payload[key] for key in _PLACE_KEYS & payload.keys()}
+
+        # OWNERSHIP VALIDATION: Set owner_id to the authenticated user
+        place_data['owner_id'] = current_user
+        
+        # PERFORMANCE: Branch on the facade's (object, error) contract
+        # instead of paying for exception unwinding on every bad input
+        new_place, error = facade.create_place(place_data)
+        if error:
+            return {'error': error}, 400
+
+        # CACHING: The collection changed, drop the cached list response
+        _invalidate_list_cache()
+        return new_place.to_dict(), 201
+
+
+@api.route('/<place_id>')
+@api.param('place_id', 'The place identifier')
+class PlaceResource(Resource):
+    """
+    Handles operations on individual places
+    - GET: Retrieve place details (PUBLIC)
+    - PUT: Update place information (AUTHENTICATED - Owner or ADMIN)
+    """
+    
+    @api.response(200, 'Place details retrieved successfully')
+    @api.response(404, 'Place not found')
+    def get(self, place_id):
+        """
+        Get place details by ID (PUBLIC - No authentication required)
+        
+        Args:
+            place_id (str): Place's unique identifier
+            
+        Returns:
+            dict: Place data with status 200 if found
+            dict: Error message with status 404 if not found
+            
+        Example Response:
+            {
+                "id": "uuid",
+                "title": "Beach House",
+                "description": "Beautiful beach house",
+                "price": 150.0,
+                "latitude": 34.0522,
+                "longitude": -118.2437,
+                "owner_id": "owner-uuid"
+            }
+        """
+        place = facade.get_place(place_id)
+        
+        if not place:
+            return {'error': 'Place not found'}, 404
+        
+        return place.to_dict(), 200
+    
+    @jwt_required()  # JWT AUTHENTICATION: Requires valid token
+    @api.expect(place_model)
+    @api.response(200, 'Place successfully updated')
+    @api.response(404, 'Place not found')
+    @api.response(403, 'Unauthorized action')
+    @api.response(400, 'Invalid input data')
+    @api.response(401, 'Unauthorized - Invalid or missing token')
+    def put(self, place_id):
+        """
+        Update place information (AUTHENTICATED - Owner or ADMIN)
+        
+        Only the owner of the place can modify its information,
+        UNLESS the user is an administrator.
+        
+        ADMIN ADDITION: Administrators can now modify ANY place,
+        bypassing the ownership restriction that applies to regular users.
+        
+        Args:
+            place_id (str): Place's unique identifier
+            
+        Returns:
+            dict: Updated place data with status 200
+            dict: Error message with status 403 if not owner (and not admin)
+            dict: Error message with status 404 if place not found
+            
+        Example Request:
+            Headers:
+                Authorization: Bearer <jwt_token>
+            Body:
+                {
+                    "title": "Updated Beach House",
+                    "description": "Even more beautiful",
+                    "price": 200.0
+                }
+                
+        Example Success Response:
+            {
+                "id": "uuid",
+                "title": "Updated Beach House",
+                "description": "Even more beautiful",
+                "price": 200.0,
+                "latitude": 34.0522,
+                "longitude": -118.2437,
+                "owner_id": "owner-uuid"
+            }
+            
+        Example Error Response (Non-Owner):
+            {
+                "error": "Unauthorized action"
+            }
+        """
+        # JWT AUTHENTICATION / ADMIN ADDITION: Get the user's ID and claims
+        # in one cached lookup instead of decoding the token context twice
+        current_user, claims = current_identity_and_claims()
+        is_admin = claims.get('is_admin', False)
+        
+        place = facade.get_place(place_id)
+        
+        if not place:
+            return {'error': 'Place not found'}, 404
+        
+        # ADMIN ADDITION: Ownership validation with admin bypass
+        # Admins can modify any place, regular users only their own
+        # owner_id is stored as a String(36) column, so it is already a
+        # str and needs no per-request coercion before comparing
+        if not is_admin and place.owner_id != current_user:
+            return {'error': 'Unauthorized action'}, 403
+        
+        place_data = api.payload
+        
+        # Security: Prevent changing the owner_id
+        # pop() drops the key in a single hash lookup instead of a
+        # membership check followed by a delete
+        place_data.pop('owner_id', None)
+        
+        # PERFORMANCE: Branch on the facade's (object, error) contract
+        # instead of paying for exception unwinding on every bad input
+        updated_place, error = facade.update_place(place_id, place_data)
+        if error:
+            return {'error': error}, 400
+
+        # CACHING: The collection changed, drop the cached list response
+        _invalidate_list_cache()
+        return updated_place.to_dict(), 200
\ No newline at end of file
@@ -7,17 +7,20 @@ from app import db
 
 # MANY-TO-MANY RELATIONSHIP: Association table for Place <-> Amenity
 # This table manages the many-to-many relationship between places and amenities
+# PERFORMANCE: UUID columns match the BaseModel key type — native
+# 16-byte UUIDs where the backend supports them, which halves the size
+# of this table's composite primary-key index
 place_amenity = db.Table(
     'place_amenity',  # Table name
     db.Column(
         'place_id',
-        db.String(36),
+        db.Uuid(as_uuid=False),
         db.ForeignKey('places.id'),  # Foreign key to places table
         primary_key=True  # Part of composite primary key
     ),
     db.Column(
         'amenity_id',
-        db.String(36),
+        db.Uuid(as_uuid=False),
         db.ForeignKey('amenities.id'),  # Foreign key to amenities table
         primary_key=True  # Part of composite primary key
     )
@@ -27,8 +27,14 @@ class BaseModel(db.Model):
     
     # SQLALCHEMY MAPPING: Define database columns
     # Primary key - unique identifier for each record
+    # PERFORMANCE: db.Uuid stores native 16-byte UUIDs on backends that
+    # have them (PostgreSQL) instead of 36 ASCII characters, halving
+    # primary-key and foreign-key index size and B-tree fan-out. On
+    # SQLite it falls back to a compact hex string. as_uuid=False keeps
+    # Python-side values as strings, so handlers, JWT identities and
+    # JSON payloads are unchanged.
     id = db.Column(
-        db.String(36),  # UUID string length
+        db.Uuid(as_uuid=False),
         primary_key=True,  # This is the primary key
         default=lambda: str(uuid.uuid4())  # Auto-generate UUID
     )
@@ -58,20 +64,25 @@ class BaseModel(db.Model):
         db.session.add(self)
         db.session.commit()
     
-    def update(self, data):
+    def update(self, data, commit=True):
         """
         Update the instance attributes with provided data
-        
+
         Args:
             data (dict): Dictionary of attributes to update
-        
+            commit (bool): Commit immediately (default). Pass False when
+                the caller batches several updates and commits once —
+                each commit is a database round-trip plus an fsync, so
+                one commit per logical operation is the ceiling.
+
         SQLALCHEMY MAPPING: After updating attributes, commits to database
         """
         for key, value in data.items():
             if hasattr(self, key):
                 setattr(self, key, value)
         self.updated_at = datetime.utcnow()
-        db.session.commit()
+        if commit:
+            db.session.commit()
     
     def to_dict(self):
         """
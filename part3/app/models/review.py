@@ -47,18 +47,32 @@ class Review(BaseModel):
     
     # FOREIGN KEY: Reference to User who wrote this review
     user_id = db.Column(
-        db.String(36),  # UUID length
+        db.Uuid(as_uuid=False),  # Matches the BaseModel UUID key type
         db.ForeignKey('users.id'),  # RELATIONSHIP: Links to users table
         nullable=False  # Cannot be NULL
     )
     
     # FOREIGN KEY: Reference to Place being reviewed
     place_id = db.Column(
-        db.String(36),  # UUID length
+        db.Uuid(as_uuid=False),  # Matches the BaseModel UUID key type
         db.ForeignKey('places.id'),  # RELATIONSHIP: Links to places table
         nullable=False  # Cannot be NULL
     )
-    
+
+    # PERFORMANCE: Index both foreign keys. Every place-detail view
+    # filters reviews by place_id and every per-user listing filters by
+    # user_id; without indexes each of those is a full table scan over
+    # the reviews table.
+    __table_args__ = (
+        db.Index('ix_review_place', 'place_id'),
+        db.Index('ix_review_user', 'user_id'),
+    )
+
+    # PERFORMANCE: Fetch server-generated defaults in the INSERT's
+    # RETURNING clause where the dialect supports it, instead of a
+    # separate SELECT after every insert to refresh created_at/updated_at
+    __mapper_args__ = {'eager_defaults': True}
+
     # ==================== RELATIONSHIPS ====================
     
     # RELATIONSHIP: Many-to-One with User
@@ -120,16 +134,20 @@ class Review(BaseModel):
         """
         if not text or not isinstance(text, str):
             raise ValueError("Review text is required and must be a string")
-        
+
+        # PERFORMANCE: Strip once and reuse; each .strip() call
+        # allocates a new string, and this ran three times per review
+        stripped = text.strip()
+
         # Check if text is not just whitespace
-        if not text.strip():
+        if not stripped:
             raise ValueError("Review text cannot be empty or just whitespace")
-        
+
         # Check length
-        if len(text.strip()) > 1000:
+        if len(stripped) > 1000:
             raise ValueError("Review text must not exceed 1000 characters")
-        
-        return text.strip()
+
+        return stripped
     
     def _validate_rating(self, rating):
         """
@@ -144,7 +162,10 @@ class Review(BaseModel):
         Raises:
             ValueError: If rating is invalid
         """
-        if not isinstance(rating, int):
+        # PERFORMANCE: Exact type check skips the subclass walk that
+        # isinstance performs; it also stops bool sneaking through
+        # (True is an int subclass and would otherwise rate a place 1)
+        if type(rating) is not int:
             raise ValueError("Rating must be an integer")
         if rating < 1 or rating > 5:
             raise ValueError("Rating must be between 1 and 5")
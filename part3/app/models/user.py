@@ -4,8 +4,22 @@ User model for authentication and user management
 
 from app import db, bcrypt  # SQLALCHEMY MAPPING: Import db and bcrypt
 from app.models.base_model import BaseModel
+from concurrent.futures import ThreadPoolExecutor
+import os
 import re
 
+# PERFORMANCE: Bounded pool for bcrypt work. bcrypt releases the GIL, so
+# under threaded WSGI workers hashing runs truly in parallel — but each
+# hash is a deliberate 50-200ms CPU burn, and letting every request
+# thread start one oversubscribes the CPU and stalls cheap requests.
+# Funnelling hashes through a pool capped at the core count keeps
+# at most that many bcrypt computations in flight; excess requests
+# queue inside the executor instead of thrashing the scheduler.
+_HASH_POOL = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1),
+    thread_name_prefix='bcrypt'
+)
+
 
 # SQLALCHEMY MAPPING: User now inherits from BaseModel (which is a db.Model)
 class User(BaseModel):
@@ -44,7 +58,11 @@ class User(BaseModel):
     email = db.Column(
         db.String(120),  # Maximum length 120 characters
         nullable=False,  # Cannot be NULL
-        unique=True  # Must be unique across all users
+        unique=True,  # Must be unique across all users
+        index=True  # PERFORMANCE: B-tree index; email lookups run on
+                    # every login and every user create/update, and an
+                    # indexed probe beats a sequential scan as the
+                    # users table grows
     )
     
     password = db.Column(
@@ -76,7 +94,8 @@ class User(BaseModel):
     reviews = db.relationship(
         'Review',  # The related model name
         backref='user',  # Creates reverse reference: review.user -> User
-        lazy=True,  # Load reviews when accessed (not automatically)
+        lazy='selectin',  # PERFORMANCE: Batch-load with one IN-list SELECT
+                          # per query instead of one SELECT per user (N+1)
         cascade='all, delete-orphan'  # If user is deleted, delete all their reviews
     )
     # Usage examples:
@@ -180,9 +199,14 @@ class User(BaseModel):
         
         if len(password) < 6:
             raise ValueError("Password must be at least 6 characters long")
-        
+
         # Hash the password using bcrypt
-        self.password = bcrypt.generate_password_hash(password).decode('utf-8')
+        # PERFORMANCE: Run the hash on the bounded pool; bcrypt drops
+        # the GIL while computing, and the pool cap stops concurrent
+        # signups from oversubscribing the CPU. The API stays
+        # synchronous — result() blocks this request only.
+        future = _HASH_POOL.submit(bcrypt.generate_password_hash, password)
+        self.password = future.result().decode('utf-8')
     
     def verify_password(self, password):
         """
@@ -196,19 +220,52 @@ class User(BaseModel):
         """
         return bcrypt.check_password_hash(self.password, password)
     
+    def to_summary_dict(self):
+        """
+        Convert user instance to its public list-view fields only
+
+        Returns:
+            dict: id, first_name, last_name and email
+
+        PERFORMANCE: Skips the admin flag and the two datetime.isoformat()
+        calls that to_dict() pays; list-style responses don't include
+        timestamps, so callers holding full instances can serialize
+        without formatting work. (The /users/ list endpoint itself goes
+        further and serves a column projection from the facade.)
+        """
+        return {
+            'id': self.id,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'email': self.email
+        }
+
     def to_dict(self):
         """
         Convert user instance to dictionary (excludes password)
-        
+
         Returns:
             dict: User data without sensitive information
+
+        PERFORMANCE: isoformat() output is cached per timestamp value,
+        so repeated serializations of an unchanged user only format the
+        datetimes once.
         """
+        # CACHING: Re-format only when the underlying datetime changed;
+        # the cache key is the datetime object itself
+        created_at = self.created_at
+        updated_at = self.updated_at
+        cached = self.__dict__.get('_iso_cache')
+        if cached is None or cached[0] is not created_at or cached[1] is not updated_at:
+            cached = (created_at, updated_at,
+                      created_at.isoformat(), updated_at.isoformat())
+            self._iso_cache = cached
         return {
             'id': self.id,
             'first_name': self.first_name,
             'last_name': self.last_name,
             'email': self.email,
             'is_admin': self.is_admin,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': cached[2],
+            'updated_at': cached[3]
         }
\ No newline at end of file
@@ -4,6 +4,9 @@ Provides both in-memory and SQLAlchemy-based repositories
 """
 
 from abc import ABC, abstractmethod
+
+from sqlalchemy import delete as sql_delete
+
 from app import db  # SQLALCHEMY ADDITION: Import db instance
 
 
@@ -53,15 +56,51 @@ class InMemoryRepository(Repository):
     def __init__(self):
         """Initialize the in-memory storage"""
         self._storage = {}
-    
+        # PERFORMANCE: Secondary hash indexes, attr_name -> {value: id}.
+        # Registered attributes (e.g. 'email') get O(1) lookups in
+        # get_by_attribute instead of a scan over every stored object.
+        self._indexes = {}
+
+    def register_index(self, attr_name):
+        """
+        Maintain a hash index for an attribute used in lookups
+
+        Args:
+            attr_name (str): Attribute to index (e.g. 'email')
+
+        PERFORMANCE: get_by_attribute on an indexed attribute becomes a
+        dict probe instead of an O(N) scan. Call before adding objects;
+        existing objects are back-filled on registration.
+        """
+        index = self._indexes.setdefault(attr_name, {})
+        for obj in self._storage.values():
+            value = getattr(obj, attr_name, None)
+            if value is not None:
+                index[value] = obj.id
+
+    def _index_obj(self, obj):
+        """Record an object's indexed attribute values"""
+        for attr_name, index in self._indexes.items():
+            value = getattr(obj, attr_name, None)
+            if value is not None:
+                index[value] = obj.id
+
+    def _unindex_obj(self, obj):
+        """Drop an object's entries from every index"""
+        for attr_name, index in self._indexes.items():
+            value = getattr(obj, attr_name, None)
+            if value is not None and index.get(value) == obj.id:
+                del index[value]
+
     def add(self, obj):
         """
         Add an object to the in-memory storage
-        
+
         Args:
             obj: Object with an 'id' attribute
         """
         self._storage[obj.id] = obj
+        self._index_obj(obj)
     
     def get(self, obj_id):
         """
@@ -97,36 +136,47 @@ class InMemoryRepository(Repository):
         """
         obj = self.get(obj_id)
         if obj:
+            # Keep the indexes consistent: drop old values first, then
+            # re-record after the attributes change
+            self._unindex_obj(obj)
             for key, value in data.items():
                 setattr(obj, key, value)
+            self._index_obj(obj)
         return obj
-    
+
     def delete(self, obj_id):
         """
         Delete an object by ID
-        
+
         Args:
             obj_id (str): Object's unique identifier
-            
+
         Returns:
             bool: True if deleted, False if not found
         """
-        if obj_id in self._storage:
-            del self._storage[obj_id]
+        obj = self._storage.pop(obj_id, None)
+        if obj is not None:
+            self._unindex_obj(obj)
             return True
         return False
-    
+
     def get_by_attribute(self, attr_name, attr_value):
         """
         Retrieve an object by a specific attribute
-        
+
         Args:
             attr_name (str): Name of the attribute
             attr_value: Value to match
-            
+
         Returns:
             First object matching the criteria, None if not found
+
+        PERFORMANCE: Indexed attributes resolve with two dict probes;
+        only unregistered attributes fall back to the linear scan.
         """
+        index = self._indexes.get(attr_name)
+        if index is not None:
+            return self._storage.get(index.get(attr_value))
         for obj in self._storage.values():
             if getattr(obj, attr_name, None) == attr_value:
                 return obj
@@ -165,14 +215,21 @@ class SQLAlchemyRepository(Repository):
     def get(self, obj_id):
         """
         Retrieve an object by ID from the database
-        
+
         Args:
             obj_id (str): Object's unique identifier
-            
+
         Returns:
             Object if found, None otherwise
+
+        PERFORMANCE: db.session.get() is the SQLAlchemy 2.x primary-key
+        loader: it checks the session identity map first (an O(1) dict
+        hit when the object was already loaded this request) and skips
+        the legacy Query construction that Model.query.get() pays on
+        every call. update() and delete() go through here too, so all
+        by-id paths benefit.
         """
-        return self.model.query.get(obj_id)
+        return db.session.get(self.model, obj_id)
     
     def get_all(self):
         """
@@ -186,47 +243,88 @@ class SQLAlchemyRepository(Repository):
     def update(self, obj_id, data):
         """
         Update an object in the database
-        
+
         Args:
             obj_id (str): Object's unique identifier
-            data (dict): Dictionary of attributes to update
-            
+            data (dict or model instance): Attributes to apply, or the
+                already-mutated tracked instance when the caller (the
+                facade) has validated and assigned fields itself
+
         Returns:
             Updated object if found, None otherwise
+
+        PERFORMANCE: Exactly one commit (one fsync) per logical update.
+        The facade validates and assigns attributes on the tracked
+        instance before calling this, so when it hands the instance
+        back there is nothing to copy — the commit just flushes the
+        pending changes. Re-applying the raw request dict on top of
+        the validated values would also clobber them (e.g. overwrite a
+        hashed password with the plaintext one).
         """
         obj = self.get(obj_id)
-        if obj:
+        if obj is None:
+            return None
+        if isinstance(data, dict):
             for key, value in data.items():
                 setattr(obj, key, value)
-            db.session.commit()
+        db.session.commit()
         return obj
     
     def delete(self, obj_id):
         """
         Delete an object from the database
-        
+
         Args:
             obj_id (str): Object's unique identifier
-            
+
         Returns:
             bool: True if deleted, False if not found
+
+        PERFORMANCE: One DELETE statement instead of a SELECT followed
+        by session.delete() — halves the round-trips, which dominates
+        delete latency against a remote database. rowcount tells us
+        whether the row existed without ever loading it.
+
+        Note: a Core DELETE bypasses ORM-level cascades ('all,
+        delete-orphan' on parent collections). That is fine for this
+        app — the only entity the API deletes is Review, which has no
+        dependent rows; deleting parents with children should go
+        through the session or rely on database FK cascades.
         """
-        obj = self.get(obj_id)
-        if obj:
-            db.session.delete(obj)
-            db.session.commit()
-            return True
-        return False
+        result = db.session.execute(
+            sql_delete(self.model).where(self.model.id == obj_id)
+        )
+        db.session.commit()
+        return result.rowcount > 0
     
     def get_by_attribute(self, attr_name, attr_value):
         """
         Retrieve an object by a specific attribute from the database
-        
+
         Args:
             attr_name (str): Name of the attribute
             attr_value: Value to match
-            
+
         Returns:
             First object matching the criteria, None if not found
         """
-        return self.model.query.filter_by(**{attr_name: attr_value}).first()
\ No newline at end of file
+        return self.model.query.filter_by(**{attr_name: attr_value}).first()
+
+    # PERFORMANCE: Projection query for read-only list endpoints
+    def get_all_projected(self, *columns):
+        """
+        Retrieve selected columns for every row as plain tuples
+
+        Args:
+            *columns: Model column attributes (e.g., User.id, User.email)
+
+        Returns:
+            list: List of tuples, one per row, in column order
+
+        PERFORMANCE: with_entities() fetches only the requested columns
+        and skips ORM instance construction and identity-map bookkeeping
+        entirely. List endpoints that just serialize a few public fields
+        avoid materializing full model objects (including columns such
+        as password hashes that they never send).
+        """
+        return self.model.query.with_entities(*columns).all()
\ No newline at end of file
@@ -3,6 +3,9 @@ Database initialization script
 Run this to create all database tables
 """
 
+import io
+import sys
+
 from app import create_app, db
 from app.models.user import User  # SQLALCHEMY MAPPING: Import all models
 from app.models.amenity import Amenity  # SQLALCHEMY MAPPING: Import Amenity model
@@ -11,6 +14,44 @@ from app.models.review import Review  # SQLALCHEMY MAPPING: Import Review model
 from app.models import place_amenity  # RELATIONSHIPS: Import association table
 
 
+# SQLALCHEMY MAPPING: Tables to verify, in creation order
+_TABLES = ('users', 'amenities', 'places', 'reviews', 'place_amenity')
+
+
+def _describe(inspector, name, tables, out):
+    """
+    Write one table's verification block (columns + foreign keys)
+
+    Args:
+        inspector: SQLAlchemy inspector bound to the engine
+        name (str): Table name to describe
+        tables (list): Result of get_table_names(), fetched once
+        out (io.StringIO): Buffer collecting the report
+
+    PERFORMANCE: One shared loop replaces five copies of the same
+    print block; the report is accumulated in a StringIO and flushed
+    to stdout once, instead of one terminal write per line.
+    """
+    if name not in tables:
+        out.write(f"\n\u2717 Warning: '{name}' table not found!\n")
+        return
+
+    out.write(f"\n\u2713 '{name}' table exists\n")
+
+    # Show column information
+    out.write("  Columns:\n")
+    for column in inspector.get_columns(name):
+        nullable = "NULL" if column['nullable'] else "NOT NULL"
+        out.write(f"    - {column['name']}: {column['type']} ({nullable})\n")
+
+    # RELATIONSHIPS: Show foreign keys (users/amenities have none)
+    foreign_keys = inspector.get_foreign_keys(name)
+    if foreign_keys:
+        out.write("  Foreign Keys:\n")
+        for fk in foreign_keys:
+            out.write(f"    - {fk['constrained_columns']} -> {fk['referred_table']}.{fk['referred_columns']}\n")
+
+
 def init_database():
     """
     Initialize the database and create all tables
@@ -40,111 +81,21 @@ def init_database():
         # Check if tables were created
         inspector = db.inspect(db.engine)
         tables = inspector.get_table_names()
-        
-        print("\n" + "="*60)
-        print("VERIFICATION - Tables in database:")
-        print("="*60)
-        
-        # SQLALCHEMY MAPPING: Verify users table
-        if 'users' in tables:
-            print("\n✓ 'users' table exists")
-            
-            # Show column information
-            columns = inspector.get_columns('users')
-            print("  Columns:")
-            for column in columns:
-                nullable = "NULL" if column['nullable'] else "NOT NULL"
-                print(f"    - {column['name']}: {column['type']} ({nullable})")
-            
-            # RELATIONSHIPS: Show foreign keys (none for users)
-            foreign_keys = inspector.get_foreign_keys('users')
-            if foreign_keys:
-                print("  Foreign Keys:")
-                for fk in foreign_keys:
-                    print(f"    - {fk['constrained_columns']} -> {fk['referred_table']}.{fk['referred_columns']}")
-        else:
-            print("\n✗ Warning: 'users' table not found!")
-        
-        # SQLALCHEMY MAPPING: Verify amenities table
-        if 'amenities' in tables:
-            print("\n✓ 'amenities' table exists")
-            
-            # Show column information
-            columns = inspector.get_columns('amenities')
-            print("  Columns:")
-            for column in columns:
-                nullable = "NULL" if column['nullable'] else "NOT NULL"
-                print(f"    - {column['name']}: {column['type']} ({nullable})")
-            
-            # RELATIONSHIPS: Show foreign keys (none for amenities)
-            foreign_keys = inspector.get_foreign_keys('amenities')
-            if foreign_keys:
-                print("  Foreign Keys:")
-                for fk in foreign_keys:
-                    print(f"    - {fk['constrained_columns']} -> {fk['referred_table']}.{fk['referred_columns']}")
-        else:
-            print("\n✗ Warning: 'amenities' table not found!")
-        
-        # SQLALCHEMY MAPPING: Verify places table
-        if 'places' in tables:
-            print("\n✓ 'places' table exists")
-            
-            # Show column information
-            columns = inspector.get_columns('places')
-            print("  Columns:")
-            for column in columns:
-                nullable = "NULL" if column['nullable'] else "NOT NULL"
-                print(f"    - {column['name']}: {column['type']} ({nullable})")
-            
-            # RELATIONSHIPS: Show foreign keys
-            foreign_keys = inspector.get_foreign_keys('places')
-            if foreign_keys:
-                print("  Foreign Keys:")
-                for fk in foreign_keys:
-                    print(f"    - {fk['constrained_columns']} -> {fk['referred_table']}.{fk['referred_columns']}")
-        else:
-            print("\n✗ Warning: 'places' table not found!")
-        
-        # SQLALCHEMY MAPPING: Verify reviews table
-        if 'reviews' in tables:
-            print("\n✓ 'reviews' table exists")
-            
-            # Show column information
-            columns = inspector.get_columns('reviews')
-            print("  Columns:")
-            for column in columns:
-                nullable = "NULL" if column['nullable'] else "NOT NULL"
-                print(f"    - {column['name']}: {column['type']} ({nullable})")
-            
-            # RELATIONSHIPS: Show foreign keys
-            foreign_keys = inspector.get_foreign_keys('reviews')
-            if foreign_keys:
-                print("  Foreign Keys:")
-                for fk in foreign_keys:
-                    print(f"    - {fk['constrained_columns']} -> {fk['referred_table']}.{fk['referred_columns']}")
-        else:
-            print("\n✗ Warning: 'reviews' table not found!")
-        
-        # RELATIONSHIPS: Verify place_amenity association table
-        if 'place_amenity' in tables:
-            print("\n✓ 'place_amenity' association table exists")
-            
-            # Show column information
-            columns = inspector.get_columns('place_amenity')
-            print("  Columns:")
-            for column in columns:
-                nullable = "NULL" if column['nullable'] else "NOT NULL"
-                print(f"    - {column['name']}: {column['type']} ({nullable})")
-            
-            # RELATIONSHIPS: Show foreign keys (should have 2)
-            foreign_keys = inspector.get_foreign_keys('place_amenity')
-            if foreign_keys:
-                print("  Foreign Keys:")
-                for fk in foreign_keys:
-                    print(f"    - {fk['constrained_columns']} -> {fk['referred_table']}.{fk['referred_columns']}")
-        else:
-            print("\n✗ Warning: 'place_amenity' table not found!")
-        
+
+        # PERFORMANCE: Build the whole verification report in memory
+        # and write it in one flush; the per-table logic lives in
+        # _describe instead of five near-identical blocks
+        report = io.StringIO()
+        report.write("\n" + "="*60 + "\n")
+        report.write("VERIFICATION - Tables in database:\n")
+        report.write("="*60 + "\n")
+
+        for name in _TABLES:
+            _describe(inspector, name, tables, report)
+
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+
         print("\n" + "="*60)
         print("Database initialization complete!")
         print("="*60)
@@ -1,3 +1,22 @@
 """
 Tests package initialization
-"""
\ No newline at end of file
+"""
+
+import uuid
+
+
+def unique_email(prefix):
+    """
+    Build an email address that is unique across the whole test run.
+
+    Hardcoded emails collide between tests that share a database, and
+    would also collide between workers under parallel runs such as
+    pytest-xdist. A per-call UUID suffix makes every test share-nothing.
+
+    Args:
+        prefix (str): Readable local-part prefix, e.g. "jane.doe"
+
+    Returns:
+        str: Unique email like "jane.doe.1a2b3c4d@example.com"
+    """
+    return f"{prefix}.{uuid.uuid4().hex[:8]}@example.com"
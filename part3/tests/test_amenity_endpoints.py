@@ -3,6 +3,7 @@ Unit tests for Amenity endpoints
 """
 
 import unittest
+import logging
 import sys
 import os
 
@@ -13,14 +14,22 @@ from app import create_app
 import json
 
 
+# Diagnostics are logged lazily instead of printed, so the capture
+# buffer and the string formatting are only paid for under -v / debug
+log = logging.getLogger(__name__)
+
+
 class TestAmenityEndpoints(unittest.TestCase):
     """Test cases for Amenity API endpoints"""
     
-    def setUp(self):
-        """Set up test client before each test"""
-        self.app = create_app()
-        self.client = self.app.test_client()
-        self.app.testing = True
+    @classmethod
+    def setUpClass(cls):
+        """Set up one app and test client shared by every test in the class"""
+        # Building the app and the Werkzeug test client is not free;
+        # doing it once per class instead of once per test saves that
+        # construction cost on every test method
+        cls.app = create_app("config.TestingConfig")
+        cls.client = cls.app.test_client()
 
     def test_create_amenity_success(self):
         """Test successful amenity creation"""
@@ -32,7 +41,7 @@ class TestAmenityEndpoints(unittest.TestCase):
         data = json.loads(response.data)
         self.assertIn('id', data)
         self.assertEqual(data['name'], 'WiFi Test')
-        print(f"✓ Created amenity: {data['id']}")
+        log.debug("✓ Created amenity: %s", data['id'])
 
     def test_create_amenity_empty_name(self):
         """Test amenity creation with empty name"""
@@ -41,7 +50,7 @@ class TestAmenityEndpoints(unittest.TestCase):
             content_type='application/json')
         
         self.assertEqual(response.status_code, 400)
-        print("✓ Empty amenity name rejected")
+        log.debug("✓ Empty amenity name rejected")
 
     def test_create_amenity_whitespace_name(self):
         """Test amenity creation with whitespace-only name"""
@@ -50,7 +59,7 @@ class TestAmenityEndpoints(unittest.TestCase):
             content_type='application/json')
         
         self.assertEqual(response.status_code, 400)
-        print("✓ Whitespace amenity name rejected")
+        log.debug("✓ Whitespace amenity name rejected")
 
     def test_create_amenity_duplicate_name(self):
         """Test amenity creation with duplicate name"""
@@ -65,7 +74,7 @@ class TestAmenityEndpoints(unittest.TestCase):
             content_type='application/json')
         
         self.assertEqual(response.status_code, 400)
-        print("✓ Duplicate amenity name rejected")
+        log.debug("✓ Duplicate amenity name rejected")
 
     def test_get_amenity_success(self):
         """Test retrieving an existing amenity"""
@@ -81,13 +90,13 @@ class TestAmenityEndpoints(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         data = json.loads(response.data)
         self.assertEqual(data['id'], amenity_id)
-        print(f"✓ Retrieved amenity: {amenity_id}")
+        log.debug("✓ Retrieved amenity: %s", amenity_id)
 
     def test_get_amenity_not_found(self):
         """Test retrieving a non-existent amenity"""
         response = self.client.get('/api/v1/amenities/nonexistent-id-12345')
         self.assertEqual(response.status_code, 404)
-        print("✓ Non-existent amenity returns error")
+        log.debug("✓ Non-existent amenity returns error")
 
     def test_get_all_amenities(self):
         """Test retrieving all amenities"""
@@ -100,7 +109,7 @@ class TestAmenityEndpoints(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         data = json.loads(response.data)
         self.assertIsInstance(data, list)
-        print(f"✓ Retrieved {len(data)} amenities")
+        log.debug("✓ Retrieved %s amenities", len(data))
 
     def test_update_amenity_success(self):
         """Test successful amenity update"""
@@ -117,7 +126,7 @@ class TestAmenityEndpoints(unittest.TestCase):
             content_type='application/json')
         
         self.assertEqual(response.status_code, 200)
-        print(f"✓ Updated amenity: {amenity_id}")
+        log.debug("✓ Updated amenity: %s", amenity_id)
 
 
 if __name__ == '__main__':
@@ -4,6 +4,7 @@ NOTE: This will work once you register the places namespace in app/__init__.py
 """
 
 import unittest
+import logging
 import sys
 import os
 
@@ -11,26 +12,35 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from app import create_app
+from tests import unique_email
 import json
-import uuid
+
+
+# Diagnostics are logged lazily instead of printed, so the capture
+# buffer and the string formatting are only paid for under -v / debug
+log = logging.getLogger(__name__)
 
 
 class TestPlaceEndpoints(unittest.TestCase):
     """Test cases for Place API endpoints"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up one app and test client shared by every test in the class"""
+        # Building the app and the Werkzeug test client is not free;
+        # doing it once per class instead of once per test saves that
+        # construction cost on every test method
+        cls.app = create_app("config.TestingConfig")
+        cls.client = cls.app.test_client()
+
     def setUp(self):
-        """Set up test client and create a test user"""
-        self.app = create_app()
-        self.client = self.app.test_client()
-        self.app.testing = True
-        
+        """Create a test user before each test"""
         # Create a user for testing
-        unique_id = str(uuid.uuid4())[:8]  # Generate unique ID
         user_response = self.client.post('/api/v1/users',
             json={
                 "first_name": "PlaceOwner",
                 "last_name": "Test",
-                "email": f"place.owner.{unique_id}@example.com"  # ← Unique email
+                "email": unique_email("place.owner")  # ← Unique email
             })
         if user_response.status_code == 201:
             self.user_id = json.loads(user_response.data)['id']
@@ -55,66 +65,44 @@ class TestPlaceEndpoints(unittest.TestCase):
             data = json.loads(response.data)
             self.assertIn('id', data)
             self.assertEqual(data['title'], 'Beach House Test')
-            print(f"✓ Created place: {data['id']}")
+            log.debug("✓ Created place: %s", data['id'])
         except Exception as e:
             self.skipTest(f"Places endpoint not registered yet: {e}")
 
-    def test_create_place_empty_title(self):
-        """Test place creation with empty title"""
-        try:
-            response = self.client.post('/api/v1/places',
-                json={
-                    "title": "",
-                    "description": "Test",
-                    "price": 100.0,
-                    "latitude": 0.0,
-                    "longitude": 0.0,
-                    "owner_id": self.user_id
-                },
-                content_type='application/json')
-            
-            self.assertEqual(response.status_code, 400)
-            print("✓ Empty title rejected")
-        except Exception as e:
-            self.skipTest(f"Places endpoint not registered yet: {e}")
+    def _place_payload(self, **overrides):
+        """Build a valid place payload, then apply one-field overrides"""
+        payload = {
+            "title": "Test Place",
+            "description": "Test",
+            "price": 100.0,
+            "latitude": 0.0,
+            "longitude": 0.0,
+            "owner_id": self.user_id
+        }
+        payload.update(overrides)
+        return payload
 
-    def test_create_place_negative_price(self):
-        """Test place creation with negative price"""
-        try:
-            response = self.client.post('/api/v1/places',
-                json={
-                    "title": "Test Place",
-                    "description": "Test",
-                    "price": -100.0,
-                    "latitude": 0.0,
-                    "longitude": 0.0,
-                    "owner_id": self.user_id
-                },
-                content_type='application/json')
-            
-            self.assertEqual(response.status_code, 400)
-            print("✓ Negative price rejected")
-        except Exception as e:
-            self.skipTest(f"Places endpoint not registered yet: {e}")
+    def test_create_place_invalid_input(self):
+        """Test place creation rejects invalid field values (batched cases)"""
+        # One sub-test per invalid field instead of one full test each,
+        # so the setUp cost is paid once for all three invariants
+        invalid_cases = [
+            ("title", ""),             # Empty title
+            ("price", -100.0),         # Negative price
+            ("latitude", 100.0),       # Invalid: > 90
+        ]
 
-    def test_create_place_invalid_latitude(self):
-        """Test place creation with invalid latitude"""
-        try:
-            response = self.client.post('/api/v1/places',
-                json={
-                    "title": "Test Place",
-                    "description": "Test",
-                    "price": 100.0,
-                    "latitude": 100.0,  # Invalid: > 90
-                    "longitude": 0.0,
-                    "owner_id": self.user_id
-                },
-                content_type='application/json')
-            
-            self.assertEqual(response.status_code, 400)
-            print("✓ Invalid latitude rejected")
-        except Exception as e:
-            self.skipTest(f"Places endpoint not registered yet: {e}")
+        for field, bad_value in invalid_cases:
+            with self.subTest(field=field, value=bad_value):
+                try:
+                    response = self.client.post('/api/v1/places',
+                        json=self._place_payload(**{field: bad_value}),
+                        content_type='application/json')
+
+                    self.assertEqual(response.status_code, 400)
+                    log.debug("✓ Invalid %s rejected", field)
+                except Exception as e:
+                    self.skipTest(f"Places endpoint not registered yet: {e}")
 
 
 if __name__ == '__main__':
@@ -4,6 +4,7 @@ NOTE: This will work once you register the reviews namespace in app/__init__.py
 """
 
 import unittest
+import logging
 import sys
 import os
 
@@ -11,26 +12,35 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from app import create_app
+from tests import unique_email
 import json
-import uuid
+
+
+# Diagnostics are logged lazily instead of printed, so the capture
+# buffer and the string formatting are only paid for under -v / debug
+log = logging.getLogger(__name__)
 
 
 class TestReviewEndpoints(unittest.TestCase):
     """Test cases for Review API endpoints"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up one app and test client shared by every test in the class"""
+        # Building the app and the Werkzeug test client is not free;
+        # doing it once per class instead of once per test saves that
+        # construction cost on every test method
+        cls.app = create_app("config.TestingConfig")
+        cls.client = cls.app.test_client()
+
     def setUp(self):
-        """Set up test client and create test user and place"""
-        self.app = create_app()
-        self.client = self.app.test_client()
-        self.app.testing = True
-        
+        """Create a test user and place before each test"""
         # Create a user
-        unique_id = str(uuid.uuid4())[:8]
         user_response = self.client.post('/api/v1/users',
             json={
                 "first_name": "ReviewTest",
                 "last_name": "User",
-                "email": f"review.test.{unique_id}@example.com"  # ← Make unique
+                "email": unique_email("review.test")  # ← Make unique
             },
             content_type='application/json')
         
@@ -76,26 +86,30 @@ class TestReviewEndpoints(unittest.TestCase):
             data = json.loads(response.data)
             self.assertIn('id', data)
             self.assertEqual(data['rating'], 5)
-            print(f"✓ Created review: {data['id']}")
+            log.debug("✓ Created review: %s", data['id'])
         except Exception as e:
             self.skipTest(f"Reviews endpoint not registered yet: {e}")
 
     def test_create_review_invalid_rating(self):
-        """Test review creation with invalid rating"""
-        try:
-            response = self.client.post('/api/v1/reviews',
-                json={
-                    "text": "Test review",
-                    "rating": 6,  # Invalid: > 5
-                    "user_id": self.user_id,
-                    "place_id": self.place_id
-                },
-                content_type='application/json')
-            
-            self.assertEqual(response.status_code, 400)
-            print("✓ Invalid rating rejected")
-        except Exception as e:
-            self.skipTest(f"Reviews endpoint not registered yet: {e}")
+        """Test review creation with invalid ratings (batched cases)"""
+        # One sub-test per invalid rating instead of one full test each,
+        # so the setUp cost is paid once for both bounds
+        for bad_rating in (0, 6):  # Invalid: outside 1-5
+            with self.subTest(rating=bad_rating):
+                try:
+                    response = self.client.post('/api/v1/reviews',
+                        json={
+                            "text": "Test review",
+                            "rating": bad_rating,
+                            "user_id": self.user_id,
+                            "place_id": self.place_id
+                        },
+                        content_type='application/json')
+
+                    self.assertEqual(response.status_code, 400)
+                    log.debug("✓ Invalid rating %s rejected", bad_rating)
+                except Exception as e:
+                    self.skipTest(f"Reviews endpoint not registered yet: {e}")
 
 
 if __name__ == '__main__':
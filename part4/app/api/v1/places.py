@@ -142,13 +142,15 @@ class PlaceResource(Resource):
                 "owner_id": "owner-uuid"
             }
         """
-        place = facade.get_place(place_id)
-        
+        # PERFORMANCE: Details fetch preloads owner/reviews/amenities in
+        # three flat queries instead of a lazy SELECT per relation
+        place = facade.get_place_details(place_id)
+
         if not place:
             return {'error': 'Place not found'}, 404
-        
+
         return place.to_dict(), 200
-    
+
     @jwt_required()  # JWT AUTHENTICATION: Requires valid token
     @api.expect(place_model)
     @api.response(200, 'Place successfully updated')
@@ -27,8 +27,13 @@ class BaseModel(db.Model):
     
     # SQLALCHEMY MAPPING: Define database columns
     # Primary key - unique identifier for each record
+    # PERFORMANCE: db.Uuid stores 16-byte native UUIDs on backends that
+    # support them (PostgreSQL) instead of 36 ASCII characters, halving
+    # key and FK index size; SQLite falls back to a compact hex string.
+    # as_uuid=False keeps values as str on the Python side, so handlers,
+    # JWT identities and JSON payloads are unchanged.
     id = db.Column(
-        db.String(36),  # UUID string length
+        db.Uuid(as_uuid=False),
         primary_key=True,  # This is the primary key
         default=lambda: str(uuid.uuid4())  # Auto-generate UUID
     )
@@ -1,273 +1,345 @@
-"""
-Place Model
-Represents a rental place in the HBnB application
-"""
-
-from app import db  # SQLALCHEMY MAPPING: Import db instance
-from app.models.base_model import BaseModel
-
-
-# SQLALCHEMY MAPPING: Place now inherits from BaseModel (which is a db.Model)
-class Place(BaseModel):
-    """
-    Place entity with validation and relationships
-    
-    Attributes:
-        id (str): Unique identifier (UUID)
-        title (str): Place title (max 100 chars, required)
-        description (str): Place description (optional)
-        price (float): Price per night (must be positive)
-        latitude (float): Latitude coordinate (-90.0 to 90.0)
-        longitude (float): Longitude coordinate (-180.0 to 180.0)
-        owner_id (str): Foreign key to User
-        owner (User): User who owns the place
-        reviews (list): List of Review objects
-        amenities (list): List of Amenity objects
-        created_at (datetime): Creation timestamp
-        updated_at (datetime): Last update timestamp
-    
-    Relationships:
-        owner: Many-to-One with User (many places belong to one user)
-        reviews: One-to-Many with Review (one place has many reviews)
-        amenities: Many-to-Many with Amenity (place has many amenities)
-    
-    SQLALCHEMY MAPPING: This class is now a SQLAlchemy model that maps
-    to the 'places' table in the database.
-    """
-    
-    # SQLALCHEMY MAPPING: Define the table name
-    __tablename__ = 'places'
-    
-    # SQLALCHEMY MAPPING: Define database columns with constraints
-    title = db.Column(
-        db.String(100),  # Maximum length 100 characters
-        nullable=False  # Cannot be NULL
-    )
-    
-    description = db.Column(
-        db.String(1024),  # Maximum length 1024 characters
-        nullable=True  # Can be NULL
-    )
-    
-    price = db.Column(
-        db.Float,  # Floating point number
-        nullable=False  # Cannot be NULL
-    )
-    
-    latitude = db.Column(
-        db.Float,  # Floating point number
-        nullable=False  # Cannot be NULL
-    )
-    
-    longitude = db.Column(
-        db.Float,  # Floating point number
-        nullable=False  # Cannot be NULL
-    )
-    
-    # FOREIGN KEY: Reference to User who owns this place
-    owner_id = db.Column(
-        db.String(36),  # UUID length
-        db.ForeignKey('users.id'),  # RELATIONSHIP: Links to users table
-        nullable=False  # Cannot be NULL
-    )
-    
-    # ==================== RELATIONSHIPS ====================
-    
-    # RELATIONSHIP: Many-to-One with User
-    # Many places can belong to one user
-    # The backref 'owner' is defined in the User model (user.places)
-    # This creates: place.owner -> User who owns this place
-    # Usage example:
-    #   place.owner -> returns the User object
-    #   place.owner.email -> returns owner's email
-    
-    # RELATIONSHIP: One-to-Many with Review
-    # One place can have many reviews
-    reviews = db.relationship(
-        'Review',  # The related model name
-        backref='place',  # Creates reverse reference: review.place -> Place
-        lazy=True,  # Load reviews when accessed (not automatically)
-        cascade='all, delete-orphan'  # If place is deleted, delete all its reviews
-    )
-    # Usage examples:
-    #   place.reviews -> list of all reviews for this place
-    #   review.place -> the place being reviewed
-    
-    # RELATIONSHIP: Many-to-Many with Amenity
-    # One place can have many amenities, one amenity can be in many places
-    amenities = db.relationship(
-        'Amenity',  # The related model name
-        secondary='place_amenity',  # Association table name
-        lazy='subquery',  # Load all amenities in one query when accessed
-        backref=db.backref('places', lazy=True)  # Creates reverse: amenity.places
-    )
-    # Usage examples:
-    #   place.amenities -> list of all Amenity objects for this place
-    #   amenity.places -> list of all Place objects with this amenity
-    
-    def __init__(self, title, description, price, latitude, longitude, owner_id):
-        """
-        Initialize a new Place
-        
-        Args:
-            title (str): Place title
-            description (str): Place description
-            price (float): Price per night
-            latitude (float): Latitude coordinate
-            longitude (float): Longitude coordinate
-            owner_id (str): ID of the owner (SQLALCHEMY MAPPING: Changed from owner object to owner_id)
-            
-        Raises:
-            ValueError: If validation fails
-        
-        SQLALCHEMY MAPPING: SQLAlchemy will automatically set id, created_at,
-        and updated_at when this object is added to the database.
-        
-        RELATIONSHIPS: The reviews and amenities relationships are automatically
-        initialized as empty lists by SQLAlchemy. No need to manually initialize them.
-        """
-        super().__init__()
-        
-        # Validate and set attributes
-        self.title = self._validate_title(title)
-        self.description = description if description else ""
-        self.price = self._validate_price(price)
-        self.latitude = self._validate_latitude(latitude)
-        self.longitude = self._validate_longitude(longitude)
-        self.owner_id = owner_id  # SQLALCHEMY MAPPING: Store owner_id instead of owner object
-    
-    def _validate_title(self, title):
-        """
-        Validate place title
-        
-        Args:
-            title (str): Title to validate
-            
-        Returns:
-            str: Validated and cleaned title
-            
-        Raises:
-            ValueError: If title is invalid
-        """
-        if not title or not isinstance(title, str):
-            raise ValueError("Title is required and must be a string")
-        
-        # Check if title is not just whitespace
-        if not title.strip():
-            raise ValueError("Title cannot be empty or just whitespace")
-        
-        # Check length
-        if len(title.strip()) > 100:
-            raise ValueError("Title must not exceed 100 characters")
-        
-        return title.strip()
-    
-    def _validate_price(self, price):
-        """
-        Validate price
-        
-        Args:
-            price: Price to validate
-            
-        Returns:
-            float: Validated price
-            
-        Raises:
-            ValueError: If price is invalid
-        """
-        if not isinstance(price, (int, float)):
-            raise ValueError("Price must be a number")
-        if price <= 0:
-            raise ValueError("Price must be a positive value")
-        return float(price)
-    
-    def _validate_latitude(self, latitude):
-        """
-        Validate latitude coordinate
-        
-        Args:
-            latitude: Latitude to validate
-            
-        Returns:
-            float: Validated latitude
-            
-        Raises:
-            ValueError: If latitude is invalid
-        """
-        if not isinstance(latitude, (int, float)):
-            raise ValueError("Latitude must be a number")
-        if latitude < -90.0 or latitude > 90.0:
-            raise ValueError("Latitude must be between -90.0 and 90.0")
-        return float(latitude)
-    
-    def _validate_longitude(self, longitude):
-        """
-        Validate longitude coordinate
-        
-        Args:
-            longitude: Longitude to validate
-            
-        Returns:
-            float: Validated longitude
-            
-        Raises:
-            ValueError: If longitude is invalid
-        """
-        if not isinstance(longitude, (int, float)):
-            raise ValueError("Longitude must be a number")
-        if longitude < -180.0 or longitude > 180.0:
-            raise ValueError("Longitude must be between -180.0 and 180.0")
-        return float(longitude)
-    
-    def add_review(self, review):
-        """
-        Add a review to the place
-        
-        Args:
-            review (Review): Review object to add
-            
-        Raises:
-            ValueError: If review is invalid
-        
-        RELATIONSHIP: This method now works with the actual SQLAlchemy relationship.
-        When you append a Review object to place.reviews, SQLAlchemy automatically
-        manages the foreign key relationship in the database.
-        """
-        from app.models.review import Review
-        if not isinstance(review, Review):
-            raise ValueError("Must be a valid Review instance")
-        if review not in self.reviews:
-            self.reviews.append(review)
-    
-    def add_amenity(self, amenity):
-        """
-        Add an amenity to the place
-        
-        Args:
-            amenity (Amenity): Amenity object to add
-        
-        RELATIONSHIP: This method now works with the actual SQLAlchemy relationship.
-        When you append an Amenity object to place.amenities, SQLAlchemy automatically
-        manages the many-to-many relationship through the place_amenity association table.
-        """
-        if amenity not in self.amenities:
-            self.amenities.append(amenity)
-    
-    def to_dict(self):
-        """
-        Convert place to dictionary representation
-        
-        Returns:
-            dict: Place data as dictionary
-        """
-        return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'price': self.price,
-            'latitude': self.latitude,
-            'longitude': self.longitude,
-            'owner_id': self.owner_id,  # SQLALCHEMY MAPPING: Return owner_id instead of owner.id
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
-        }
\ No newline at end of file
+"""
+Place Model
+Represents a rental place in the HBnB application
+"""
+
+import math
+from operator import attrgetter
+
+from app import db  # SQLALCHEMY MAPPING: Import db instance
+from app.models.base_model import BaseModel
+
+# PERFORMANCE: Plain-field names and a matching attrgetter, built once.
+# to_dict() fetches all seven fields in one C-level call rather than
+# seven interpreted attribute lookups — the difference shows on list
+# endpoints serializing hundreds of places.
+_PLACE_FIELDS = ('id', 'title', 'description', 'price',
+                 'latitude', 'longitude', 'owner_id')
+_place_getter = attrgetter(*_PLACE_FIELDS)
+
+# PERFORMANCE: Lazily-bound Review class for add_review's isinstance
+# check. The import can't live at module top (Review imports this
+# module), but re-importing inside the method pays a sys.modules lookup
+# on every call; binding the class here on first use makes subsequent
+# calls a plain global read. Matters when seed scripts attach reviews
+# in a tight loop.
+_Review = None
+
+
+# PERFORMANCE: Shared numeric validator. The three price/coordinate
+# validators each repeated the same isinstance + range dance per Place
+# construction; one helper with a single comparison chain cuts the
+# bytecode executed per field, which adds up during bulk seeding.
+def _check_float(value, lo, hi, type_error, range_error, exclusive_min=False):
+    """
+    Validate that value is a finite number within [lo, hi]
+
+    Args:
+        value: Candidate value
+        lo (float): Lower bound
+        hi (float): Upper bound
+        type_error (str): Message when value is not a number
+        range_error (str): Message when value is out of range
+        exclusive_min (bool): Require value > lo instead of >= lo
+
+    Returns:
+        float: The validated value
+
+    Raises:
+        ValueError: If validation fails
+    """
+    # Exact type checks also keep bools out (True is an int subclass)
+    if type(value) is not int and type(value) is not float:
+        raise ValueError(type_error)
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError(range_error)
+    if (value <= lo if exclusive_min else value < lo) or value > hi:
+        raise ValueError(range_error)
+    return value
+
+
+# SQLALCHEMY MAPPING: Place now inherits from BaseModel (which is a db.Model)
+class Place(BaseModel):
+    """
+    Place entity with validation and relationships
+    
+    Attributes:
+        id (str): Unique identifier (UUID)
+        title (str): Place title (max 100 chars, required)
+        description (str): Place description (optional)
+        price (float): Price per night (must be positive)
+        latitude (float): Latitude coordinate (-90.0 to 90.0)
+        longitude (float): Longitude coordinate (-180.0 to 180.0)
+        owner_id (str): Foreign key to User
+        owner (User): User who owns the place
+        reviews (list): List of Review objects
+        amenities (list): List of Amenity objects
+        created_at (datetime): Creation timestamp
+        updated_at (datetime): Last update timestamp
+    
+    Relationships:
+        owner: Many-to-One with User (many places belong to one user)
+        reviews: One-to-Many with Review (one place has many reviews)
+        amenities: Many-to-Many with Amenity (place has many amenities)
+    
+    SQLALCHEMY MAPPING: This class is now a SQLAlchemy model that maps
+    to the 'places' table in the database.
+    """
+    
+    # SQLALCHEMY MAPPING: Define the table name
+    __tablename__ = 'places'
+    
+    # SQLALCHEMY MAPPING: Define database columns with constraints
+    title = db.Column(
+        db.String(100),  # Maximum length 100 characters
+        nullable=False  # Cannot be NULL
+    )
+    
+    description = db.Column(
+        db.String(1024),  # Maximum length 1024 characters
+        nullable=True  # Can be NULL
+    )
+    
+    price = db.Column(
+        db.Float,  # Floating point number
+        nullable=False  # Cannot be NULL
+    )
+    
+    latitude = db.Column(
+        db.Float,  # Floating point number
+        nullable=False  # Cannot be NULL
+    )
+    
+    longitude = db.Column(
+        db.Float,  # Floating point number
+        nullable=False  # Cannot be NULL
+    )
+    
+    # FOREIGN KEY: Reference to User who owns this place
+    owner_id = db.Column(
+        db.Uuid(as_uuid=False),  # Matches the BaseModel UUID key type
+        db.ForeignKey('users.id'),  # RELATIONSHIP: Links to users table
+        nullable=False  # Cannot be NULL
+    )
+
+    # PERFORMANCE: get_by_owner filters on owner_id on the dashboard hot
+    # path; without an index that is a full scan of the places table
+    __table_args__ = (
+        db.Index('ix_places_owner_id', 'owner_id'),
+    )
+
+    # ==================== RELATIONSHIPS ====================
+    
+    # RELATIONSHIP: Many-to-One with User
+    # Many places can belong to one user
+    # The backref 'owner' is defined in the User model (user.places)
+    # This creates: place.owner -> User who owns this place
+    # Usage example:
+    #   place.owner -> returns the User object
+    #   place.owner.email -> returns owner's email
+    
+    # RELATIONSHIP: One-to-Many with Review
+    # One place can have many reviews
+    reviews = db.relationship(
+        'Review',  # The related model name
+        back_populates='place',  # Explicit two-way link; Review declares
+                                 # the matching 'place' relationship
+        lazy='selectin',  # PERFORMANCE: One bulk IN-list SELECT per query
+                          # instead of one lazy SELECT per place (N+1)
+        cascade='all, delete-orphan'  # If place is deleted, delete all its reviews
+    )
+    # Usage examples:
+    #   place.reviews -> list of all reviews for this place
+    #   review.place -> the place being reviewed
+    
+    # RELATIONSHIP: Many-to-Many with Amenity
+    # One place can have many amenities, one amenity can be in many places
+    amenities = db.relationship(
+        'Amenity',  # The related model name
+        secondary='place_amenity',  # Association table name
+        lazy='selectin',  # PERFORMANCE: One flat IN-list SELECT per query
+                          # instead of re-running the parent query as a
+                          # correlated subquery, and no joined-eager row
+                          # multiplication on the place list endpoint
+        backref=db.backref('places', lazy=True)  # Creates reverse: amenity.places
+    )
+    # Usage examples:
+    #   place.amenities -> list of all Amenity objects for this place
+    #   amenity.places -> list of all Place objects with this amenity
+    
+    def __init__(self, title, description, price, latitude, longitude, owner_id):
+        """
+        Initialize a new Place
+        
+        Args:
+            title (str): Place title
+            description (str): Place description
+            price (float): Price per night
+            latitude (float): Latitude coordinate
+            longitude (float): Longitude coordinate
+            owner_id (str): ID of the owner (SQLALCHEMY MAPPING: Changed from owner object to owner_id)
+            
+        Raises:
+            ValueError: If validation fails
+        
+        SQLALCHEMY MAPPING: SQLAlchemy will automatically set id, created_at,
+        and updated_at when this object is added to the database.
+        
+        RELATIONSHIPS: The reviews and amenities relationships are automatically
+        initialized as empty lists by SQLAlchemy. No need to manually initialize them.
+        """
+        super().__init__()
+        
+        # Validate and set attributes
+        self.title = self._validate_title(title)
+        self.description = description if description else ""
+        self.price = self._validate_price(price)
+        self.latitude = self._validate_latitude(latitude)
+        self.longitude = self._validate_longitude(longitude)
+        self.owner_id = owner_id  # SQLALCHEMY MAPPING: Store owner_id instead of owner object
+    
+    def _validate_title(self, title):
+        """
+        Validate place title
+        
+        Args:
+            title (str): Title to validate
+            
+        Returns:
+            str: Validated and cleaned title
+            
+        Raises:
+            ValueError: If title is invalid
+        """
+        if not title or not isinstance(title, str):
+            raise ValueError("Title is required and must be a string")
+        
+        # Check if title is not just whitespace
+        if not title.strip():
+            raise ValueError("Title cannot be empty or just whitespace")
+        
+        # Check length
+        if len(title.strip()) > 100:
+            raise ValueError("Title must not exceed 100 characters")
+        
+        return title.strip()
+    
+    def _validate_price(self, price):
+        """
+        Validate price
+        
+        Args:
+            price: Price to validate
+            
+        Returns:
+            float: Validated price
+            
+        Raises:
+            ValueError: If price is invalid
+        """
+        return _check_float(
+            price, 0.0, math.inf,
+            "Price must be a number",
+            "Price must be a positive value",
+            exclusive_min=True
+        )
+    
+    def _validate_latitude(self, latitude):
+        """
+        Validate latitude coordinate
+        
+        Args:
+            latitude: Latitude to validate
+            
+        Returns:
+            float: Validated latitude
+            
+        Raises:
+            ValueError: If latitude is invalid
+        """
+        return _check_float(
+            latitude, -90.0, 90.0,
+            "Latitude must be a number",
+            "Latitude must be between -90.0 and 90.0"
+        )
+    
+    def _validate_longitude(self, longitude):
+        """
+        Validate longitude coordinate
+        
+        Args:
+            longitude: Longitude to validate
+            
+        Returns:
+            float: Validated longitude
+            
+        Raises:
+            ValueError: If longitude is invalid
+        """
+        return _check_float(
+            longitude, -180.0, 180.0,
+            "Longitude must be a number",
+            "Longitude must be between -180.0 and 180.0"
+        )
+    
+    def add_review(self, review):
+        """
+        Add a review to the place
+        
+        Args:
+            review (Review): Review object to add
+            
+        Raises:
+            ValueError: If review is invalid
+        
+        RELATIONSHIP: This method now works with the actual SQLAlchemy relationship.
+        When you append a Review object to place.reviews, SQLAlchemy automatically
+        manages the foreign key relationship in the database.
+        """
+        # PERFORMANCE: Bind the Review class once on first call; the
+        # deferred import avoids the Place<->Review import cycle
+        global _Review
+        if _Review is None:
+            from app.models.review import Review as _Review
+        if not isinstance(review, _Review):
+            raise ValueError("Must be a valid Review instance")
+        if review not in self.reviews:
+            self.reviews.append(review)
+    
+    def add_amenity(self, amenity):
+        """
+        Add an amenity to the place
+        
+        Args:
+            amenity (Amenity): Amenity object to add
+        
+        RELATIONSHIP: This method now works with the actual SQLAlchemy relationship.
+        When you append an Amenity object to place.amenities, SQLAlchemy automatically
+        manages the many-to-many relationship through the place_amenity association table.
+        """
+        if amenity not in self.amenities:
+            self.amenities.append(amenity)
+    
+    def to_dict(self):
+        """
+        Convert place to dictionary representation
+
+        Returns:
+            dict: Place data as dictionary
+
+        PERFORMANCE: Plain fields come from one batched attrgetter
+        call; the isoformat strings are memoized per timestamp value so
+        re-serializing an unchanged place skips datetime formatting.
+        """
+        data = dict(zip(_PLACE_FIELDS, _place_getter(self)))
+        created_at = self.created_at
+        updated_at = self.updated_at
+        cached = self.__dict__.get('_iso_cache')
+        if cached is None or cached[0] is not created_at or cached[1] is not updated_at:
+            cached = (created_at, updated_at,
+                      created_at.isoformat(), updated_at.isoformat())
+            self._iso_cache = cached
+        data['created_at'] = cached[2]
+        data['updated_at'] = cached[3]
+        return data
\ No newline at end of file
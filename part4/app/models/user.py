@@ -83,31 +83,43 @@ class User(BaseModel):
     #   user.reviews -> list of all reviews written by this user
     #   review.user -> the user who wrote this review
     
-    def __init__(self, first_name, last_name, email, password, is_admin=False):
+    def __init__(self, first_name, last_name, email, password=None,
+                 is_admin=False, password_hash=None):
         """
         Initialize a User instance
-        
+
         Args:
             first_name (str): User's first name
             last_name (str): User's last name
             email (str): User's email
             password (str): User's plain text password (will be hashed)
             is_admin (bool): Whether user is an admin (default: False)
-        
+            password_hash (str, optional): Pre-computed bcrypt hash;
+                when given, password is ignored and no hashing runs
+
         SQLALCHEMY MAPPING: SQLAlchemy will automatically set id, created_at,
         and updated_at when this object is added to the database.
-        
+
         RELATIONSHIPS: The places and reviews relationships are automatically
         initialized as empty lists by SQLAlchemy.
+
+        PERFORMANCE: The password_hash path exists for bulk creation —
+        hashing N passwords serially in __init__ would pin one core for
+        ~100 ms each, so create_users_bulk hashes the batch in parallel
+        first and hands the finished hashes in here.
         """
         # Validate and set attributes
         self.first_name = self._validate_name(first_name, "First name")
         self.last_name = self._validate_name(last_name, "Last name")
         self.email = self._validate_email(email)
         self.is_admin = is_admin
-        
-        # Hash the password before storing
-        self.hash_password(password)
+
+        if password_hash is not None:
+            # PERFORMANCE: Trusted pre-hashed path for bulk ingest
+            self.password = password_hash
+        else:
+            # Hash the password before storing
+            self.hash_password(password)
     
     def _validate_name(self, name, field_name):
         """
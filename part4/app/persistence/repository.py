@@ -162,17 +162,45 @@ class SQLAlchemyRepository(Repository):
         db.session.add(obj)
         db.session.commit()
     
+    def add_many(self, objs, batch_size=1000):
+        """
+        Add many objects to the database in executemany batches
+
+        Args:
+            objs (list): SQLAlchemy model instances to persist
+            batch_size (int): Rows per bulk statement (default 1000)
+
+        PERFORMANCE: add() pays one INSERT + commit per object — O(N)
+        round-trips on ingest paths (fixture loads, batch imports).
+        bulk_save_objects skips per-instance unit-of-work bookkeeping
+        and lets the driver batch each chunk through executemany, then
+        a single commit flushes everything; SQLAlchemy's performance
+        FAQ puts this at 10x+ over per-object add/commit.
+
+        Example:
+            user_repo.add_many([user1, user2, user3])
+        """
+        for start in range(0, len(objs), batch_size):
+            db.session.bulk_save_objects(objs[start:start + batch_size])
+        db.session.commit()
+
     def get(self, obj_id):
         """
         Retrieve an object by ID from the database
-        
+
         Args:
             obj_id (str): Object's unique identifier
-            
+
         Returns:
             Object if found, None otherwise
+
+        PERFORMANCE: db.session.get checks the session's identity map
+        before touching the database, so repeated lookups of the same
+        ID within a request (place validation, ownership checks) are
+        memory-only after the first. It is also the SQLAlchemy 2.x
+        replacement for the legacy (and deprecated) Query.get.
         """
-        return self.model.query.get(obj_id)
+        return db.session.get(self.model, obj_id)
     
     def get_all(self):
         """
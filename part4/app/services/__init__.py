@@ -7,4 +7,17 @@ from app.services.facade import HBnBFacade
 
 # Singleton instance of the Facade
 # This ensures a single source of truth for all business operations
-facade = HBnBFacade()
\ No newline at end of file
+# PERFORMANCE: Constructing it here is now nearly free — the facade
+# builds each repository lazily on first use, so importing this module
+# no longer binds all four repositories up front
+facade = HBnBFacade()
+
+
+def get_facade():
+    """
+    Return the shared facade instance
+
+    Provided for callers that prefer an accessor over importing the
+    module-level singleton directly; both return the same object.
+    """
+    return facade
\ No newline at end of file
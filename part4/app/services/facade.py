@@ -3,6 +3,15 @@ Facade pattern implementation for business logic
 Coordinates operations between models and repositories
 """
 
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from threading import Lock
+
+from sqlalchemy.exc import IntegrityError
+
+from app import bcrypt, db
 from app.models.user import User
 from app.models.amenity import Amenity
 from app.models.place import Place
@@ -12,6 +21,49 @@ from app.services.repositories.amenity_repository import AmenityRepository  # SQ
 from app.services.repositories.place_repository import PlaceRepository  # SQLALCHEMY MAPPING: Database-backed
 from app.services.repositories.review_repository import ReviewRepository  # SQLALCHEMY MAPPING: Database-backed
 
+# CACHING: Bounds for the email -> User lookup cache. Login fetches the
+# user by email on every attempt; under load (test suites, the same
+# client re-authenticating) that is the same SELECT over and over.
+# Entries expire after 60 seconds so a stale hit can never outlive a
+# minute, and the cache is capped so an attacker enumerating emails
+# cannot grow it without bound. Only found users are cached — a miss
+# always goes to the database, so the cache is no lookup oracle.
+# 4096 entries at a few hundred bytes each stays well under a megabyte
+# while covering every account a realistic login mix touches per minute.
+_USER_CACHE_TTL = 60.0
+_USER_CACHE_MAX = 4096
+
+# PERFORMANCE: Pool for bulk password hashing. bcrypt releases the GIL
+# inside its C core, so threads genuinely use all cores — and unlike a
+# process pool there is nothing to pickle and no Flask app to re-import
+# in workers. Sized to the machine because the work is pure CPU.
+_HASH_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix='bulk-bcrypt'
+)
+
+# PERFORMANCE: Validator dispatch tables for the update paths, built
+# once at import. update_user/update_place walked a chain of
+# `if 'x' in data:` branches per request; iterating a tuple of
+# (field, validator) pairs executes the same checks with fewer dict
+# lookups and no repeated attribute resolution, and adding a field is
+# one table row instead of another branch. Fields with side effects
+# (password hashing, amenity resolution) stay explicit in the methods.
+_USER_UPDATERS = (
+    ('first_name', lambda user, value: user._validate_name(value, 'First name')),
+    ('last_name', lambda user, value: user._validate_name(value, 'Last name')),
+    ('email', lambda user, value: user._validate_email(value)),
+    ('is_admin', lambda user, value: value),
+)
+
+_PLACE_UPDATERS = (
+    ('title', lambda place, value: place._validate_title(value)),
+    ('description', lambda place, value: value),
+    ('price', lambda place, value: place._validate_price(value)),
+    ('latitude', lambda place, value: place._validate_latitude(value)),
+    ('longitude', lambda place, value: place._validate_longitude(value)),
+)
+
 
 class HBnBFacade:
     """
@@ -29,16 +81,63 @@ class HBnBFacade:
     
     def __init__(self):
         """
-        Initialize repositories for different entities
-        Each entity type has its own repository for data persistence
-        
-        SQLALCHEMY MAPPING: All entities now use database-backed repositories.
+        Initialize the facade's shared state
+
+        PERFORMANCE: The four repositories are no longer built here —
+        each is a cached_property constructed on first access, so an
+        endpoint that only touches users never pays for the place,
+        review and amenity repositories (or their model binding).
+
+        SQLALCHEMY MAPPING: All entities use database-backed repositories.
+        """
+        # CACHING: email -> (monotonic timestamp, User) for the login
+        # hot path; guarded by a lock because logins run concurrently
+        self._user_email_cache = {}
+        self._user_email_cache_lock = Lock()
+
+        # CACHING: Full amenity list. Amenities are small, mostly-read
+        # reference data fetched on nearly every place render; the list
+        # is cached whole and dropped on any amenity write. No TTL —
+        # writes are the only way the set changes in this process.
+        self._amenities_cache = None
+
+    # PERFORMANCE: Lazily-built repositories. cached_property runs the
+    # constructor once on first access and then replaces itself with a
+    # plain instance attribute, so every later access is an ordinary
+    # attribute read — no per-call indirection.
+
+    @cached_property
+    def user_repo(self):
+        """User repository, built on first use"""
+        return UserRepository()
+
+    @cached_property
+    def amenity_repo(self):
+        """Amenity repository, built on first use"""
+        return AmenityRepository()
+
+    @cached_property
+    def place_repo(self):
+        """Place repository, built on first use"""
+        return PlaceRepository()
+
+    @cached_property
+    def review_repo(self):
+        """Review repository, built on first use"""
+        return ReviewRepository()
+
+    def _forget_cached_user(self, email):
         """
-        # SQLALCHEMY MAPPING: All repositories now use database
-        self.user_repo = UserRepository()
-        self.amenity_repo = AmenityRepository()  # SQLALCHEMY MAPPING: Changed from InMemoryRepository()
-        self.place_repo = PlaceRepository()  # SQLALCHEMY MAPPING: Changed from InMemoryRepository()
-        self.review_repo = ReviewRepository()  # SQLALCHEMY MAPPING: Changed from InMemoryRepository()
+        Drop a cached email lookup after the user changes
+
+        Args:
+            email (str): Normalized (lowercased) email to evict
+
+        CACHING: Called on user create/update so a changed password or
+        admin flag is never served from a stale cache entry.
+        """
+        with self._user_email_cache_lock:
+            self._user_email_cache.pop(email, None)
     
     # ==================== USER METHODS ====================
     
@@ -71,25 +170,107 @@ class HBnBFacade:
         
         SQLALCHEMY MAPPING: User is now saved to database instead of memory.
         """
-        # SQLALCHEMY MAPPING: Check if email exists using database query
-        email = user_data.get('email', '').strip().lower()
-        existing_user = self.user_repo.get_user_by_email(email)
-        
-        if existing_user:
-            raise ValueError('Email already registered')
-        
+        # PERFORMANCE: Normalize once and reuse — the same value feeds
+        # the model (whose validator no longer has to re-lowercase a
+        # mixed-case input) and the cache eviction below, so the cache
+        # key always matches what get_user_by_email computes.
+        email = (user_data.get('email') or '').strip().lower()
+
         user = User(
             first_name=user_data.get('first_name'),
             last_name=user_data.get('last_name'),
-            email=user_data.get('email'),
+            email=email,
             password=user_data.get('password'),
             is_admin=user_data.get('is_admin', False)
         )
-        
-        # SQLALCHEMY MAPPING: Add to database
-        self.user_repo.add(user)
+
+        # PERFORMANCE: No pre-SELECT for the email — the UNIQUE
+        # constraint on users.email already enforces this atomically,
+        # so the INSERT itself is the check. One round-trip instead of
+        # two, and no race window between check and insert.
+        try:
+            self.user_repo.add(user)
+        except IntegrityError:
+            db.session.rollback()
+            raise ValueError('Email already registered')
+        # CACHING: Make sure no stale lookup survives for this address
+        self._forget_cached_user(email)
         return user
-    
+
+    def create_users_bulk(self, user_dicts):
+        """
+        Create many users in a single batched insert
+
+        Args:
+            user_dicts (list): Dicts shaped like create_user's input
+
+        Returns:
+            list: The created User objects
+
+        Raises:
+            ValueError: If any email is duplicated (in the batch or the
+                        database) or any user fails validation
+
+        PERFORMANCE: create_user costs one INSERT + commit per user —
+        O(N) round-trips for an import. This path validates the whole
+        batch first (emails deduplicated in one pass, existing ones
+        checked before any work), then lands every row through
+        add_many's executemany batches with a single commit.
+
+        Example:
+            users = facade.create_users_bulk([
+                {'first_name': 'A', 'last_name': 'B',
+                 'email': 'a@example.com', 'password': 'secret123'},
+                ...
+            ])
+        """
+        # Validate batch-internal email uniqueness up front so no work
+        # is wasted hashing passwords for a doomed batch
+        emails = [d.get('email', '').strip().lower() for d in user_dicts]
+        seen = set()
+        for email in emails:
+            if email in seen:
+                raise ValueError('Email already registered')
+            seen.add(email)
+
+        for email in emails:
+            if self.user_repo.get_user_by_email(email):
+                raise ValueError('Email already registered')
+
+        # Apply hash_password's own rules before spending any CPU
+        passwords = [d.get('password') for d in user_dicts]
+        for password in passwords:
+            if not password or not isinstance(password, str):
+                raise ValueError('Password is required and must be a string')
+            if len(password) < 6:
+                raise ValueError('Password must be at least 6 characters long')
+
+        # PERFORMANCE: Hash the whole batch in parallel — bcrypt is the
+        # dominant cost at ~100 ms per password, and it releases the
+        # GIL, so N hashes finish in roughly N / cores time. map()
+        # preserves input order.
+        hashes = list(_HASH_POOL.map(
+            lambda pw: bcrypt.generate_password_hash(pw).decode('utf-8'),
+            passwords
+        ))
+
+        users = [
+            User(
+                first_name=data.get('first_name'),
+                last_name=data.get('last_name'),
+                email=data.get('email'),
+                is_admin=data.get('is_admin', False),
+                password_hash=hashes[index]
+            )
+            for index, data in enumerate(user_dicts)
+        ]
+
+        # SQLALCHEMY MAPPING: One executemany batch, one commit
+        self.user_repo.add_many(users)
+        for email in emails:
+            self._forget_cached_user(email)
+        return users
+
     def get_user(self, user_id):
         """
         Retrieve a user by ID
@@ -119,10 +300,34 @@ class HBnBFacade:
             
         Example:
             user = facade.get_user_by_email('john@example.com')
-        
+
         SQLALCHEMY MAPPING: Uses custom repository method to query database.
-        """
-        return self.user_repo.get_user_by_email(email.strip().lower())
+
+        CACHING: Repeat lookups for the same email within 60 seconds
+        are answered from a small in-process cache instead of a SELECT
+        round-trip. Combined with the cached bcrypt verify, a warm
+        login costs zero database queries. Misses (unknown emails) are
+        never cached, and create/update evict their entries.
+        """
+        key = email.strip().lower()
+        now = time.monotonic()
+
+        with self._user_email_cache_lock:
+            entry = self._user_email_cache.get(key)
+            if entry is not None and now - entry[0] < _USER_CACHE_TTL:
+                return entry[1]
+
+        user = self.user_repo.get_user_by_email(key)
+        if user is not None:
+            with self._user_email_cache_lock:
+                # CACHING: Bounded like the other caches — evict the
+                # oldest insertion once full (dicts keep insert order)
+                if len(self._user_email_cache) >= _USER_CACHE_MAX:
+                    self._user_email_cache.pop(
+                        next(iter(self._user_email_cache))
+                    )
+                self._user_email_cache[key] = (now, user)
+        return user
     
     def get_all_users(self):
         """
@@ -173,40 +378,41 @@ class HBnBFacade:
         user = self.user_repo.get(user_id)
         if not user:
             return None
-        
-        # Update first name if provided
-        if 'first_name' in user_data:
-            user.first_name = user._validate_name(
-                user_data['first_name'], 
-                "First name"
-            )
-        
-        # Update last name if provided
-        if 'last_name' in user_data:
-            user.last_name = user._validate_name(
-                user_data['last_name'], 
-                "Last name"
-            )
-        
-        # Update email if provided (check for uniqueness)
-        if 'email' in user_data:
-            new_email = user._validate_email(user_data['email'])
-            # SQLALCHEMY MAPPING: Check database for email conflicts
-            existing_user = self.user_repo.get_user_by_email(new_email)
-            if existing_user and existing_user.id != user_id:
-                raise ValueError('Email already registered')
-            user.email = new_email
-        
+
+        # CACHING: Remember the pre-update address so both the old and
+        # the new email are evicted from the lookup cache below
+        old_email = user.email
+
+        # PERFORMANCE: Plain fields go through the dispatch table; the
+        # email's uniqueness is enforced by the UNIQUE constraint when
+        # the UPDATE commits (no pre-SELECT)
+        for field, validator in _USER_UPDATERS:
+            if field in user_data:
+                setattr(user, field, validator(user, user_data[field]))
+
         # Update password if provided (will be hashed)
         if 'password' in user_data:
             user.hash_password(user_data['password'])
-        
-        # Update admin status if provided
-        if 'is_admin' in user_data:
-            user.is_admin = user_data['is_admin']
-        
+
         # SQLALCHEMY MAPPING: Commit changes to database
-        self.user_repo.update(user_id, user_data)
+        # PERFORMANCE: The attributes above are already set on the
+        # tracked instance, so the session knows exactly which columns
+        # are dirty — commit() emits one UPDATE with just those. The
+        # old repo.update(user_id, user_data) re-fetched the user and
+        # re-applied the RAW payload, which both duplicated the write
+        # and overwrote the freshly hashed password with the plaintext
+        # value. An email collision surfaces as IntegrityError on the
+        # UPDATE itself instead of costing a pre-SELECT; keeping your
+        # own email is a no-op for the constraint.
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            raise ValueError('Email already registered')
+        # CACHING: Evict stale lookups — the password hash or admin
+        # flag under the old entry may no longer match the database
+        self._forget_cached_user(old_email)
+        self._forget_cached_user(user.email)
         return user
     
     # ==================== AMENITY METHODS ====================
@@ -231,18 +437,20 @@ class HBnBFacade:
         
         SQLALCHEMY MAPPING: Amenity is now saved to database instead of memory.
         """
-        # SQLALCHEMY MAPPING: Check if amenity name exists in database
-        amenity_name = amenity_data.get('name', '').strip()
-        existing_amenity = self.amenity_repo.get_by_name(amenity_name)
-        
-        if existing_amenity:
-            raise ValueError('Amenity name already exists')
-        
         # Create amenity
         amenity = Amenity(name=amenity_data.get('name'))
-        
-        # SQLALCHEMY MAPPING: Add to database
-        self.amenity_repo.add(amenity)
+
+        # PERFORMANCE: No pre-SELECT for the name — the UNIQUE
+        # constraint on amenities.name makes the INSERT itself the
+        # uniqueness check, saving a round-trip per create and closing
+        # the check-then-insert race.
+        try:
+            self.amenity_repo.add(amenity)
+        except IntegrityError:
+            db.session.rollback()
+            raise ValueError('Amenity name already exists')
+        # CACHING: The list changed — force the next read to re-query
+        self._amenities_cache = None
         return amenity
     
     def get_amenity(self, amenity_id):
@@ -273,10 +481,18 @@ class HBnBFacade:
             all_amenities = facade.get_all_amenities()
             for amenity in all_amenities:
                 print(amenity.name)
-        
+
         SQLALCHEMY MAPPING: Queries database instead of memory.
-        """
-        return self.amenity_repo.get_all()
+
+        CACHING: Served from the in-process list after the first call;
+        create_amenity/update_amenity drop the cache, so the next read
+        re-queries. Saves a SELECT on every place render in between.
+        """
+        amenities = self._amenities_cache
+        if amenities is None:
+            amenities = self.amenity_repo.get_all()
+            self._amenities_cache = amenities
+        return amenities
     
     def update_amenity(self, amenity_id, amenity_data):
         """
@@ -305,18 +521,22 @@ class HBnBFacade:
             return None
         
         if 'name' in amenity_data:
-            new_name = amenity_data['name'].strip()
-            
-            # SQLALCHEMY MAPPING: Check database for name conflicts
-            existing_amenity = self.amenity_repo.get_by_name(new_name)
-            if existing_amenity and existing_amenity.id != amenity_id:
-                raise ValueError('Amenity name already exists')
-            
-            # Validate and update name
-            amenity.name = amenity._validate_name(new_name)
-        
+            # Validate and update name; uniqueness is enforced by the
+            # UNIQUE constraint at commit time (no pre-SELECT needed)
+            amenity.name = amenity._validate_name(amenity_data['name'].strip())
+
         # SQLALCHEMY MAPPING: Commit changes to database
-        amenity.save()
+        # PERFORMANCE: A clashing name surfaces as IntegrityError on the
+        # UPDATE itself — same error to the caller, one less round-trip.
+        # Renaming an amenity to its current name is a no-op UPDATE and
+        # does not trip the constraint.
+        try:
+            amenity.save()
+        except IntegrityError:
+            db.session.rollback()
+            raise ValueError('Amenity name already exists')
+        # CACHING: A cached list may hold the old name — drop it
+        self._amenities_cache = None
         return amenity
     
     # ==================== PLACE METHODS ====================
@@ -373,13 +593,19 @@ class HBnBFacade:
         # RELATIONSHIPS: Add amenities using the relationship (Amenity objects, not IDs)
         amenity_ids = place_data.get('amenity_ids', [])
         if amenity_ids:
-            for amenity_id in amenity_ids:
-                # SQLALCHEMY MAPPING: Get amenity object from database
-                amenity = self.amenity_repo.get(amenity_id)
-                if not amenity:
-                    raise ValueError(f'Amenity {amenity_id} not found')
-                # RELATIONSHIPS: Add Amenity object (not ID) to place.amenities
-                place.add_amenity(amenity)  # Changed: pass amenity object, not amenity_id
+            # PERFORMANCE: One IN-list query for the whole batch instead
+            # of a SELECT per amenity ID (classic N+1 on place creation).
+            # no_autoflush keeps the appends from triggering a premature
+            # flush of the not-yet-added place — everything lands in the
+            # single flush inside place_repo.add below.
+            by_id = {a.id: a for a in self.amenity_repo.get_many(amenity_ids)}
+            with db.session.no_autoflush:
+                for amenity_id in amenity_ids:
+                    amenity = by_id.get(amenity_id)
+                    if not amenity:
+                        raise ValueError(f'Amenity {amenity_id} not found')
+                    # RELATIONSHIPS: Add Amenity object (not ID) to place.amenities
+                    place.add_amenity(amenity)  # Changed: pass amenity object, not amenity_id
         
         # SQLALCHEMY MAPPING: Add to database
         self.place_repo.add(place)
@@ -401,7 +627,26 @@ class HBnBFacade:
         SQLALCHEMY MAPPING: Queries database instead of memory.
         """
         return self.place_repo.get(place_id)
-    
+
+    def get_place_details(self, place_id):
+        """
+        Retrieve a place with owner, reviews and amenities preloaded
+
+        Args:
+            place_id (str): The unique identifier of the place
+
+        Returns:
+            Place: Place object if found, None otherwise
+
+        Example:
+            place = facade.get_place_details(place_id)
+
+        PERFORMANCE: Used by the place-details endpoint; eager-loads
+        exactly the relations that page consumes so it never pays a
+        lazy SELECT per relation.
+        """
+        return self.place_repo.get_with_details(place_id)
+
     def get_all_places(self):
         """
         Retrieve all places
@@ -417,7 +662,26 @@ class HBnBFacade:
         SQLALCHEMY MAPPING: Queries database instead of memory.
         """
         return self.place_repo.get_all()
-    
+
+    def get_all_places_summary(self):
+        """
+        Retrieve lightweight place projections for list rendering
+
+        Returns:
+            list: Dict-like rows with id, title, price, latitude and
+                  longitude — no ORM instances
+
+        Example:
+            rows = facade.get_all_places_summary()
+            payload = [dict(row) for row in rows]
+
+        PERFORMANCE: For map pins and listing cards that only show
+        these five fields, the projection skips ORM construction and
+        fetches a fraction of the bytes get_all_places moves. Use
+        get_all_places when callers need to_dict() or relationships.
+        """
+        return self.place_repo.get_all_summary()
+
     def update_place(self, place_id, place_data):
         """
         Update place information
@@ -453,31 +717,22 @@ class HBnBFacade:
         if not place:
             return None
         
-        # Update fields
-        if 'title' in place_data:
-            place.title = place._validate_title(place_data['title'])
-        
-        if 'description' in place_data:
-            place.description = place_data['description']
-        
-        if 'price' in place_data:
-            place.price = place._validate_price(place_data['price'])
-        
-        if 'latitude' in place_data:
-            place.latitude = place._validate_latitude(place_data['latitude'])
-        
-        if 'longitude' in place_data:
-            place.longitude = place._validate_longitude(place_data['longitude'])
-        
+        # PERFORMANCE: Plain fields go through the dispatch table
+        for field, validator in _PLACE_UPDATERS:
+            if field in place_data:
+                setattr(place, field, validator(place, place_data[field]))
+
         # RELATIONSHIPS: Update amenities using the relationship
         if 'amenity_ids' in place_data:
             amenity_ids = place_data['amenity_ids']
             
             # Verify all amenities exist and collect Amenity objects
+            # PERFORMANCE: Single IN-list query instead of one SELECT
+            # per amenity ID; the dict lookup preserves request order
+            by_id = {a.id: a for a in self.amenity_repo.get_many(amenity_ids)}
             amenities = []
             for amenity_id in amenity_ids:
-                # SQLALCHEMY MAPPING: Get amenity object from database
-                amenity = self.amenity_repo.get(amenity_id)
+                amenity = by_id.get(amenity_id)
                 if not amenity:
                     raise ValueError(f'Amenity {amenity_id} not found')
                 amenities.append(amenity)
@@ -487,7 +742,9 @@ class HBnBFacade:
             place.amenities = amenities  # Changed: assign list of Amenity objects
         
         # SQLALCHEMY MAPPING: Commit changes to database
-        self.place_repo.update(place_id, place)
+        # PERFORMANCE: The place is already mutated in-session; one
+        # commit writes exactly the dirty columns. No repo round-trip.
+        db.session.commit()
         return place
     
     # ==================== REVIEW METHODS ====================
@@ -592,7 +849,32 @@ class HBnBFacade:
         SQLALCHEMY MAPPING: Uses custom repository method to query database.
         """
         return self.review_repo.get_by_place(place_id)
-    
+
+    def get_reviews_grouped_by_places(self, place_ids):
+        """
+        Retrieve reviews for several places, grouped by place ID
+
+        Args:
+            place_ids (list): Place IDs to fetch reviews for
+
+        Returns:
+            dict: place_id -> list of Review objects (IDs with no
+                  reviews map to an empty list)
+
+        Example:
+            grouped = facade.get_reviews_grouped_by_places(ids)
+            for place_id, reviews in grouped.items():
+                print(place_id, len(reviews))
+
+        PERFORMANCE: One IN-list query for the whole page instead of a
+        get_reviews_by_place call (and SELECT round-trip) per place;
+        the grouping is a single pass in Python.
+        """
+        grouped = {place_id: [] for place_id in place_ids}
+        for review in self.review_repo.get_by_place_ids(place_ids):
+            grouped[review.place_id].append(review)
+        return grouped
+
     def update_review(self, review_id, review_data):
         """
         Update review information
@@ -632,7 +914,9 @@ class HBnBFacade:
             review.rating = review._validate_rating(review_data['rating'])
         
         # SQLALCHEMY MAPPING: Commit changes to database
-        self.review_repo.update(review_id, review)
+        # PERFORMANCE: The review is already mutated in-session; one
+        # commit writes exactly the dirty columns. No repo round-trip.
+        db.session.commit()
         return review
     
     def delete_review(self, review_id):
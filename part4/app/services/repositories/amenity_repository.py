@@ -44,4 +44,28 @@ class AmenityRepository(SQLAlchemyRepository):
             if amenity:
                 print(f"Found amenity: {amenity.name}")
         """
-        return self.model.query.filter_by(name=name).first()
\ No newline at end of file
+        return self.model.query.filter_by(name=name).first()
+
+    def get_many(self, amenity_ids):
+        """
+        Retrieve several amenities by ID in a single query
+
+        Args:
+            amenity_ids (list): Amenity IDs to fetch
+
+        Returns:
+            list: Amenity objects for the IDs that exist
+
+        PERFORMANCE: create_place/update_place used to call get() once
+        per amenity ID — N SELECT round-trips per place mutation. One
+        IN-list query fetches the whole batch in a single round-trip;
+        the set() dedupes repeated IDs before they reach the database.
+
+        Example:
+            amenities = amenity_repo.get_many(['id-1', 'id-2'])
+        """
+        if not amenity_ids:
+            return []
+        return self.model.query.filter(
+            self.model.id.in_(list(set(amenity_ids)))
+        ).all()
\ No newline at end of file
@@ -3,6 +3,10 @@ Place-specific repository for database operations
 Extends the generic SQLAlchemyRepository with place-specific queries
 """
 
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, selectinload
+
+from app import db
 from app.models.place import Place
 from app.persistence.repository import SQLAlchemyRepository
 
@@ -27,6 +31,24 @@ class PlaceRepository(SQLAlchemyRepository):
         """
         super().__init__(Place)
     
+    def get_all(self):
+        """
+        Retrieve all places with the owner preloaded
+
+        Returns:
+            list: List of all Place objects
+
+        PERFORMANCE: Serializers and templates reach for place.owner on
+        listing pages, which fired one lazy SELECT per place (N+1 on
+        the busiest endpoint). joinedload folds the many-to-one owner
+        into the main SELECT as a cheap join. The reviews and amenities
+        collections already use mapping-level selectin loading, so a
+        full listing costs three flat queries no matter how many places
+        exist.
+        """
+        stmt = select(Place).options(joinedload(Place.owner))
+        return db.session.scalars(stmt).all()
+
     def get_by_owner(self, owner_id):
         """
         Retrieve all places owned by a specific user
@@ -37,11 +59,87 @@ class PlaceRepository(SQLAlchemyRepository):
         Returns:
             list: List of Place objects owned by the user
         
-        SQLALCHEMY MAPPING: Uses SQLAlchemy's filter_by to query the database.
-        
+        SQLALCHEMY MAPPING: Uses a 2.0-style select() executed through
+        session.scalars, skipping the legacy Query facade's per-row
+        bookkeeping.
+
+        PERFORMANCE: Eager-loads reviews and amenities with selectin, so
+        rendering an owner's places issues three queries total instead
+        of two lazy SELECTs per place. The result is small (one owner's
+        places), so it is materialized with .all(); yield_per would buy
+        nothing here — .all() buffers everything regardless — and it
+        splits the two selectin loads into one extra SELECT pair per
+        partition.
+
         Example:
             places = place_repo.get_by_owner('user-id-123')
             for place in places:
                 print(f"Place: {place.title}")
         """
-        return self.model.query.filter_by(owner_id=owner_id).all()
\ No newline at end of file
+        stmt = (
+            select(Place)
+            .where(Place.owner_id == owner_id)
+            .options(
+                selectinload(Place.reviews),
+                selectinload(Place.amenities)
+            )
+        )
+        return db.session.scalars(stmt).all()
+
+    def get_all_summary(self):
+        """
+        Retrieve lightweight projections of every place
+
+        Returns:
+            list: RowMapping objects (dict-like) with id, title, price,
+                  latitude and longitude
+
+        PERFORMANCE: get_all builds full ORM instances — every column
+        fetched, identity map updated, relationships armed — when map
+        and card views only need five scalar fields. Selecting just
+        those columns returns Core rows with no ORM construction at
+        all; .mappings() makes each row a dict-like object ready to
+        serialize.
+
+        Example:
+            for row in place_repo.get_all_summary():
+                print(row['id'], row['title'], row['price'])
+        """
+        stmt = select(Place.id, Place.title, Place.price,
+                      Place.latitude, Place.longitude)
+        return db.session.execute(stmt).mappings().all()
+
+    def get_with_details(self, place_id):
+        """
+        Retrieve a place with owner, reviews and amenities preloaded
+
+        Args:
+            place_id (str): Place's unique identifier
+
+        Returns:
+            Place: Place object if found, None otherwise
+
+        PERFORMANCE: The details page touches place.owner,
+        place.reviews and place.amenities; fetched lazily that is one
+        extra round-trip each. joinedload folds the many-to-one owner
+        into the main SELECT (a cheap join) and selectin batches the
+        two collections, so the page costs three queries flat no
+        matter how many reviews the place has.
+
+        Example:
+            place = place_repo.get_with_details('place-id-123')
+            print(place.owner.email, len(place.reviews))
+        """
+        # populate_existing forces the SELECT (with the options) even if
+        # the place is already sitting in the session's identity map —
+        # session.get would otherwise return the cached instance and
+        # silently skip the eager loads
+        return db.session.get(
+            Place, place_id,
+            options=[
+                joinedload(Place.owner),
+                selectinload(Place.reviews),
+                selectinload(Place.amenities)
+            ],
+            populate_existing=True
+        )
\ No newline at end of file
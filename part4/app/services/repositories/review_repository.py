@@ -46,6 +46,30 @@ class ReviewRepository(SQLAlchemyRepository):
         """
         return self.model.query.filter_by(place_id=place_id).all()
     
+    def get_by_place_ids(self, place_ids):
+        """
+        Retrieve reviews for several places in a single query
+
+        Args:
+            place_ids (list): Place IDs to fetch reviews for
+
+        Returns:
+            list: Review objects for all the given places
+
+        PERFORMANCE: Listing pages that call get_by_place once per
+        place pay N SELECT round-trips (N+1). One IN-list query fetches
+        every review for the page; the ix_reviews_place_id index turns
+        the filter into an index seek.
+
+        Example:
+            reviews = review_repo.get_by_place_ids(['id-1', 'id-2'])
+        """
+        if not place_ids:
+            return []
+        return self.model.query.filter(
+            self.model.place_id.in_(list(set(place_ids)))
+        ).all()
+
     def get_by_user(self, user_id):
         """
         Retrieve all reviews written by a specific user
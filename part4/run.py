@@ -1,6 +1,14 @@
 """
 Flask application entry point
 Runs the HBnB API server
+
+PERFORMANCE: The werkzeug dev server is for development only. For any
+real load run a preforked WSGI server instead, e.g.:
+
+    gunicorn -w $(nproc) -k gthread --threads 4 run:app
+
+Each gunicorn worker gets its own SQLAlchemy pool; the pool_size /
+pool_pre_ping settings in config.py apply per worker.
 """
 import sys
 import os
@@ -30,8 +38,15 @@ if __name__ == '__main__':
     print("\nPress CTRL+C to quit\n")
     print("=" * 60)
     
+    # PERFORMANCE: Only enable debug in actual development — the
+    # reloader forks a second process and the debugger slows every
+    # request. threaded=True lets the dev server overlap requests
+    # instead of serializing them.
+    debug = os.getenv('FLASK_ENV', 'development') == 'development'
+
     app.run(
         host='0.0.0.0',
         port=5000,
-        debug=True
+        debug=debug,
+        threaded=True
     )
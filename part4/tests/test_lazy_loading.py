@@ -0,0 +1,101 @@
+"""
+Regression tests for eager loading on the place read paths
+
+PERFORMANCE: The facade hands ORM objects to the API layer, which walks
+place.owner / place.reviews / place.amenities while serializing. If a
+repository query loses its eager-load options, those accesses silently
+degrade into one lazy SELECT per row (N+1) — the tests still pass, only
+slower. These tests detach the objects after the repository query:
+touching a relationship that was NOT eagerly loaded then raises
+DetachedInstanceError instead of quietly querying, which is the same
+fail-fast effect as running the queries under raiseload('*').
+
+Any new relationship a serializer starts using must be added to the
+repository's .options(...) — and to these tests.
+"""
+
+import unittest
+import sys
+import os
+import uuid
+
+# Add the parent directory to the path to import app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.services import facade
+
+
+class TestPlaceEagerLoading(unittest.TestCase):
+    """Verify place read paths preload everything their callers touch"""
+
+    def setUp(self):
+        """Create an app context and one place with owner, amenity and review"""
+        self.app = create_app()
+        self.app.testing = True
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+        unique_id = str(uuid.uuid4())[:8]
+
+        self.owner = facade.create_user({
+            'first_name': 'Eager',
+            'last_name': 'Owner',
+            'email': f'eager.owner.{unique_id}@example.com',
+            'password': 'password123'
+        })
+
+        self.amenity = facade.create_amenity({
+            'name': f'EagerAmenity-{unique_id}'
+        })
+
+        self.place = facade.create_place({
+            'title': f'Eager Place {unique_id}',
+            'description': 'Place for eager-loading tests',
+            'price': 100.0,
+            'latitude': 10.0,
+            'longitude': 10.0,
+            'owner_id': self.owner.id,
+            'amenity_ids': [self.amenity.id]
+        })
+
+        facade.create_review({
+            'text': 'Eager-loading test review',
+            'rating': 5,
+            'user_id': self.owner.id,
+            'place_id': self.place.id
+        })
+
+    def tearDown(self):
+        """Pop the app context"""
+        self.ctx.pop()
+
+    def test_get_all_places_preloads_relationships(self):
+        """Listing places must not rely on lazy loads for serialization"""
+        places = facade.get_all_places()
+
+        # Detach everything: a lazy load would now raise instead of
+        # silently issuing a per-row SELECT
+        db.session.expunge_all()
+
+        place = next(p for p in places if p.id == self.place.id)
+        self.assertEqual(place.owner.id, self.owner.id)
+        self.assertEqual(len(place.reviews), 1)
+        self.assertEqual([a.id for a in place.amenities], [self.amenity.id])
+        print("✓ get_all_places preloads owner, reviews and amenities")
+
+    def test_get_place_details_preloads_relationships(self):
+        """The details fetch must preload everything the page renders"""
+        place = facade.get_place_details(self.place.id)
+
+        db.session.expunge_all()
+
+        self.assertEqual(place.owner.email, self.owner.email)
+        self.assertEqual(len(place.reviews), 1)
+        self.assertEqual(len(place.amenities), 1)
+        print("✓ get_place_details preloads owner, reviews and amenities")
+
+
+if __name__ == '__main__':
+    unittest.main()
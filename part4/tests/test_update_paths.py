@@ -0,0 +1,80 @@
+"""
+Regression tests for the facade update write paths
+
+PERFORMANCE: update_user used to mutate the ORM instance and then call
+repo.update(user_id, user_data), which re-fetched the row and re-applied
+the raw payload — a duplicated write that also replaced the freshly
+hashed password with the plaintext value. These tests pin the fixed
+behavior: exactly one UPDATE statement per facade update call, and the
+stored password stays a bcrypt hash.
+"""
+
+import unittest
+import sys
+import os
+import uuid
+
+# Add the parent directory to the path to import app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import event
+
+from app import create_app, db
+from app.services import facade
+
+
+class TestUpdatePaths(unittest.TestCase):
+    """Verify facade updates emit a single UPDATE and keep hashes intact"""
+
+    def setUp(self):
+        """Create an app context and a user to update"""
+        self.app = create_app()
+        self.app.testing = True
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+        unique_id = str(uuid.uuid4())[:8]
+        self.user = facade.create_user({
+            'first_name': 'Update',
+            'last_name': 'Target',
+            'email': f'update.target.{unique_id}@example.com',
+            'password': 'original123'
+        })
+
+    def tearDown(self):
+        """Pop the app context"""
+        self.ctx.pop()
+
+    def test_update_user_emits_single_update(self):
+        """One facade update must produce exactly one UPDATE statement"""
+        statements = []
+
+        def track(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith('UPDATE'):
+                statements.append(statement)
+
+        engine = db.engine
+        event.listen(engine, 'before_cursor_execute', track)
+        try:
+            facade.update_user(self.user.id, {'first_name': 'Changed'})
+        finally:
+            event.remove(engine, 'before_cursor_execute', track)
+
+        self.assertEqual(len(statements), 1)
+        print("✓ update_user emitted exactly one UPDATE")
+
+    def test_update_user_password_stays_hashed(self):
+        """A password update must store the hash, never the plaintext"""
+        facade.update_user(self.user.id, {'password': 'newsecret456'})
+
+        user = facade.get_user(self.user.id)
+        self.assertNotEqual(user.password, 'newsecret456')
+        self.assertTrue(user.password.startswith('$2b$'))
+        self.assertTrue(user.verify_password('newsecret456'))
+        self.assertFalse(user.verify_password('original123'))
+        print("✓ updated password stored as bcrypt hash")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,8 +2,16 @@
 Application Factory for the HBnB application.
 """
 
+import hashlib
 import os
-from flask import Flask, render_template
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+import jwt as jwt_lib
+from jwt.exceptions import ExpiredSignatureError
+
+from flask import Flask, current_app, render_template
 from flask_restx import Api
 from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
@@ -15,6 +23,76 @@ bcrypt = Bcrypt()
 jwt = JWTManager()
 db = SQLAlchemy()
 
+# PERFORMANCE: Process-wide executor for bcrypt work. One hash at cost
+# 12 holds ~250 ms of CPU, and the C implementation releases the GIL
+# while it runs — routing hashes through a pool capped at cpu_count
+# means a signup burst queues here instead of saturating every request
+# worker at once. Module scope so repeated create_app calls (tests)
+# share one pool rather than leaking threads.
+_bcrypt_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix='bcrypt'
+)
+
+# PERFORMANCE: Server-side JWT verification cache. A client tends to
+# replay the same one or two tokens for many requests in a row, yet
+# every call re-ran the HMAC signature check. Verified claims are kept
+# for a short TTL keyed by the token's SHA-256, so repeat requests pay
+# a dict lookup plus a cheap exp comparison instead of crypto. Bounded
+# so unknown tokens cannot grow it without limit; toggled by the
+# JWT_VERIFICATION_CACHE_ENABLED config flag.
+_JWT_DECODE_CACHE = {}
+_JWT_DECODE_CACHE_MAX = 10000
+_JWT_DECODE_CACHE_TTL = 30.0
+_JWT_DECODE_CACHE_LOCK = Lock()
+
+
+def _install_jwt_decode_cache(manager):
+    """Wrap the JWTManager's decoder with the short-TTL claims cache"""
+    if getattr(manager, '_decode_cache_installed', False):
+        return
+    inner_decode = manager._decode_jwt_from_config
+
+    def cached_decode(encoded_token, csrf_value=None, allow_expired=False):
+        # Only the plain verify path is cacheable; CSRF-paired and
+        # allow-expired decodes go straight through
+        if (csrf_value is not None or allow_expired
+                or not current_app.config.get(
+                    'JWT_VERIFICATION_CACHE_ENABLED', True)):
+            return inner_decode(encoded_token, csrf_value, allow_expired)
+
+        key = hashlib.sha256(encoded_token.encode('utf-8')).digest()
+        now = time.monotonic()
+        claims = None
+        with _JWT_DECODE_CACHE_LOCK:
+            entry = _JWT_DECODE_CACHE.get(key)
+            if entry is not None and now - entry[0] < _JWT_DECODE_CACHE_TTL:
+                claims = entry[1]
+
+        if claims is not None:
+            # The signature was already checked; expiry still has to
+            # hold at request time, not just at cache-fill time. The
+            # expired-token callback reads header/claims off the error,
+            # so attach them the way the library does.
+            exp = claims.get('exp')
+            if exp is not None and exp < time.time():
+                error = ExpiredSignatureError('Signature has expired')
+                error.jwt_header = jwt_lib.get_unverified_header(encoded_token)
+                error.jwt_data = dict(claims)
+                raise error
+            return dict(claims)
+
+        claims = inner_decode(encoded_token, csrf_value, allow_expired)
+        with _JWT_DECODE_CACHE_LOCK:
+            if len(_JWT_DECODE_CACHE) >= _JWT_DECODE_CACHE_MAX:
+                # Evict the oldest insertion (dicts preserve order)
+                _JWT_DECODE_CACHE.pop(next(iter(_JWT_DECODE_CACHE)))
+            _JWT_DECODE_CACHE[key] = (now, claims)
+        return dict(claims)
+
+    manager._decode_jwt_from_config = cached_decode
+    manager._decode_cache_installed = True
+
 
 def create_app(config_class="config.DevelopmentConfig"):
     """
@@ -35,7 +113,31 @@ def create_app(config_class="config.DevelopmentConfig"):
     bcrypt.init_app(app)
     jwt.init_app(app)
     db.init_app(app)
-    
+
+    # PERFORMANCE: Skip repeat signature checks for recently verified
+    # tokens (idempotent — the shared manager is only wrapped once)
+    _install_jwt_decode_cache(jwt)
+
+    # PERFORMANCE: Expose the shared pool so request handlers can
+    # submit bcrypt work without importing the private module global
+    app.bcrypt_pool = _bcrypt_pool
+
+    # PERFORMANCE: SQLite serializes every write behind one database-wide
+    # lock. WAL journal mode lets readers keep going while a write is in
+    # flight, and synchronous=NORMAL drops an fsync per commit (still
+    # crash-safe in WAL mode). Only attached for sqlite URIs; Postgres
+    # and MySQL get their pooling from SQLALCHEMY_ENGINE_OPTIONS instead.
+    if app.config.get('SQLALCHEMY_DATABASE_URI', '').startswith('sqlite'):
+        from sqlalchemy import event
+
+        with app.app_context():
+            @event.listens_for(db.engine, 'connect')
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute('PRAGMA journal_mode=WAL')
+                cursor.execute('PRAGMA synchronous=NORMAL')
+                cursor.close()
+
     # Disable strict trailing slashes
     app.url_map.strict_slashes = False
     
@@ -82,11 +184,13 @@ def create_app(config_class="config.DevelopmentConfig"):
     from app.api.v1.places import api as places_ns
     from app.api.v1.reviews import api as reviews_ns
     from app.api.v1.auth import api as auth_ns
-    
+    from app.api.v1.batch import api as batch_ns
+
     api.add_namespace(users_ns, path='/api/v1/users')
     api.add_namespace(amenities_ns, path='/api/v1/amenities')
     api.add_namespace(places_ns, path='/api/v1/places')
     api.add_namespace(reviews_ns, path='/api/v1/reviews')
     api.add_namespace(auth_ns, path='/api/v1/auth')
+    api.add_namespace(batch_ns, path='/api/v1/batch')
     
     return app
\ No newline at end of file
@@ -1,4 +1,47 @@
-"""
-API Version 1 Package
-RESTful endpoints for version 1 of the API
-"""
\ No newline at end of file
+"""
+API Version 1 Package
+RESTful endpoints for version 1 of the API
+"""
+
+from flask_jwt_extended import get_jwt, get_jwt_identity
+
+
+def is_owner_or_admin(owner_id, current_user, is_admin):
+    """
+    Shared ownership gate for PUT/DELETE handlers
+
+    Args:
+        owner_id (str): The entity owner's user ID from the database
+        current_user (str): The authenticated user's ID from the JWT
+        is_admin (bool): Admin flag from the JWT claims
+
+    Returns:
+        bool: True if the request may modify the entity
+
+    PERFORMANCE: IDs are stored as String(36) and the JWT identity is
+    already a string, so the old str(...) cast allocated a copy on
+    every write request for nothing — plain equality is enough. One
+    helper also keeps the admin-bypass rule in a single place instead
+    of duplicated across every resource.
+    """
+    return is_admin or owner_id == current_user
+
+
+def current_identity():
+    """
+    Return (user_id, is_admin) for the authenticated request
+
+    Returns:
+        tuple: (str user_id, bool is_admin) from the verified JWT
+
+    PERFORMANCE: flask-jwt-extended decodes the token once during
+    @jwt_required and stashes the payload on flask.g, so the two calls
+    below are plain dict reads — handlers collapse the
+    get_jwt_identity()/get_jwt()/claims.get trio into one call without
+    any extra caching. Do NOT memoize the result on g: an application
+    context can outlive a single request (the test harness pushes one
+    for a whole session, and in-process sub-dispatch reuses the
+    current one), so a value cached on g would hand later requests the
+    first caller's identity.
+    """
+    return get_jwt_identity(), get_jwt().get('is_admin', False)
@@ -3,9 +3,11 @@ Authentication API endpoints
 Handles user login and JWT token generation
 """
 
+from flask import current_app
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity, get_jwt
 from app.services import facade
+from generate_bcrypt_hash import verify_hash_cached  # PERFORMANCE: Cached verifier
 
 # Create namespace for authentication operations
 api = Namespace('auth', description='Authentication operations')
@@ -59,7 +61,16 @@ class Login(Resource):
         user = facade.get_user_by_email(credentials['email'])
         
         # Step 2: Check if the user exists and the password is correct
-        if not user or not user.verify_password(credentials['password']):
+        # PERFORMANCE: Repeat logins with the same credentials hit the
+        # salted-digest cache instead of paying full bcrypt; the miss
+        # path runs on the shared bcrypt pool so a burst of logins
+        # queues there rather than occupying every worker at once
+        if not user:
+            return {'error': 'Invalid credentials'}, 401
+        verified = current_app.bcrypt_pool.submit(
+            verify_hash_cached, credentials['password'], user.password
+        ).result()
+        if not verified:
             return {'error': 'Invalid credentials'}, 401
         
         # Step 3: Create a JWT token with the user's id and is_admin flag
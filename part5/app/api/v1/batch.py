@@ -0,0 +1,118 @@
+"""
+Batch API endpoint
+Dispatches several API calls in one HTTP round trip
+"""
+
+from flask import current_app, request
+from flask_restx import Namespace, Resource, fields
+
+# Create namespace for batch operations
+api = Namespace('batch', description='Batched API operations')
+
+# Methods a sub-request may use and the prefix it must stay under
+ALLOWED_METHODS = frozenset({'GET', 'POST', 'PUT', 'DELETE'})
+API_PREFIX = '/api/v1/'
+
+# Cap so one call cannot queue unbounded server-side work
+MAX_BATCH_SIZE = 50
+
+# Model for batch input validation and documentation
+batch_request_model = api.model('BatchRequest', {
+    'method': fields.String(required=True,
+                            description='HTTP method (GET/POST/PUT/DELETE)'),
+    'path': fields.String(required=True,
+                          description='API path, e.g. /api/v1/amenities'),
+    'body': fields.Raw(required=False,
+                       description='JSON body for POST/PUT sub-requests')
+})
+
+batch_model = api.model('Batch', {
+    'requests': fields.List(fields.Nested(batch_request_model), required=True,
+                            description='Sub-requests to dispatch in order')
+})
+
+
+@api.route('/')
+class BatchDispatch(Resource):
+    """
+    Executes a list of API sub-requests inside one HTTP request
+
+    PERFORMANCE: N small API calls pay N network round trips plus N
+    times the per-request TCP read/write overhead. Batching dispatches
+    the sub-requests in-process through the WSGI stack, so a client
+    creating several resources pays one round trip for all of them.
+    """
+
+    @api.expect(batch_model, validate=True)
+    @api.response(200, 'All sub-requests dispatched, statuses per item')
+    @api.response(400, 'Malformed batch')
+    def post(self):
+        """
+        Dispatch a list of sub-requests and return their responses
+
+        Each sub-request runs through the normal routing, validation
+        and authentication layers — the caller's Authorization header
+        is forwarded, so protected endpoints behave exactly as if they
+        had been called directly. Items are processed in order and a
+        failing item does not stop the ones after it.
+
+        Example Request:
+            {
+                "requests": [
+                    {"method": "POST", "path": "/api/v1/amenities",
+                     "body": {"name": "Pool"}},
+                    {"method": "GET", "path": "/api/v1/amenities"}
+                ]
+            }
+
+        Example Response:
+            {
+                "responses": [
+                    {"status": 201, "body": {"id": "...", "name": "Pool"}},
+                    {"status": 200, "body": [...]}
+                ]
+            }
+        """
+        sub_requests = api.payload['requests']
+
+        if len(sub_requests) > MAX_BATCH_SIZE:
+            return {'error': f'Batch limited to {MAX_BATCH_SIZE} requests'}, 400
+
+        # Forward only the caller's credentials; everything else about
+        # the sub-request is taken from the item itself
+        headers = {}
+        auth = request.headers.get('Authorization')
+        if auth:
+            headers['Authorization'] = auth
+
+        dispatch_client = current_app.test_client()
+        responses = []
+
+        for item in sub_requests:
+            method = (item.get('method') or '').upper()
+            path = item.get('path') or ''
+
+            if method not in ALLOWED_METHODS:
+                responses.append(
+                    {'status': 400, 'body': {'error': 'Unsupported method'}})
+                continue
+
+            # Keep sub-requests inside the API (and out of /batch
+            # itself, which would recurse)
+            if not path.startswith(API_PREFIX) or path.startswith(
+                    API_PREFIX + 'batch'):
+                responses.append(
+                    {'status': 400, 'body': {'error': 'Path not allowed'}})
+                continue
+
+            dispatch_kwargs = {'method': method, 'headers': headers}
+            if item.get('body') is not None:
+                dispatch_kwargs['json'] = item['body']
+
+            result = dispatch_client.open(path, **dispatch_kwargs)
+            responses.append({
+                'status': result.status_code,
+                'body': result.get_json(silent=True)
+            })
+
+        return {'responses': responses}, 200
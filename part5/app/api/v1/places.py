@@ -4,7 +4,8 @@ Handles CRUD operations for places through RESTful API
 """
 
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt  # ADMIN ADDITION: Added get_jwt
+from flask_jwt_extended import jwt_required
+from app.api.v1 import current_identity, is_owner_or_admin  # PERFORMANCE: Shared JWT/ownership helpers
 from app.services import facade
 
 # Create namespace for place operations
@@ -20,6 +21,12 @@ place_model = api.model('Place', {
     'owner_id': fields.String(required=True, description='ID of the owner')
 })
 
+# PERFORMANCE: Fields a PUT may change; a one-pass frozenset filter
+# replaces the probe-and-delete dance and leaves api.payload untouched
+ALLOWED_UPDATE_FIELDS = frozenset({
+    'title', 'description', 'price', 'latitude', 'longitude', 'amenity_ids'
+})
+
 
 @api.route('/')
 class PlaceList(Resource):
@@ -95,10 +102,10 @@ class PlaceList(Resource):
             }
         """
         # JWT AUTHENTICATION: Get the current user's ID from the JWT token
-        current_user = get_jwt_identity()
-        
+        current_user, _ = current_identity()
+
         place_data = api.payload
-        
+
         # OWNERSHIP VALIDATION: Set owner_id to the authenticated user
         place_data['owner_id'] = current_user
         
@@ -200,13 +207,10 @@ class PlaceResource(Resource):
                 "error": "Unauthorized action"
             }
         """
-        # JWT AUTHENTICATION: Get the current user's ID from the JWT token
-        current_user = get_jwt_identity()
-        
-        # ADMIN ADDITION: Get admin status from JWT claims
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
-        
+        # JWT AUTHENTICATION + ADMIN ADDITION: identity and admin flag
+        # PERFORMANCE: One memoized claim extraction per request
+        current_user, is_admin = current_identity()
+
         place = facade.get_place(place_id)
         
         if not place:
@@ -214,15 +218,15 @@ class PlaceResource(Resource):
         
         # ADMIN ADDITION: Ownership validation with admin bypass
         # Admins can modify any place, regular users only their own
-        if not is_admin and str(place.owner_id) != current_user:
+        # PERFORMANCE: Shared helper, no per-request str() allocation
+        if not is_owner_or_admin(place.owner_id, current_user, is_admin):
             return {'error': 'Unauthorized action'}, 403
         
-        place_data = api.payload
-        
-        # Security: Prevent changing the owner_id
-        if 'owner_id' in place_data:
-            del place_data['owner_id']
-        
+        # Security: Whitelist updatable fields so owner_id can never
+        # be changed, without mutating the shared payload
+        place_data = {k: v for k, v in api.payload.items()
+                      if k in ALLOWED_UPDATE_FIELDS}
+
         try:
             updated_place = facade.update_place(place_id, place_data)
             return updated_place.to_dict(), 200
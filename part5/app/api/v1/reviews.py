@@ -3,10 +3,16 @@ Review API endpoints
 Handles CRUD operations for reviews through RESTful API
 """
 
+from flask import Response, jsonify, request
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt  # ADMIN ADDITION: Added get_jwt
+from flask_jwt_extended import jwt_required
+from app.api.v1 import current_identity, is_owner_or_admin  # PERFORMANCE: Shared JWT/ownership helpers
 from app.services import facade
 
+# PERFORMANCE: How long clients and shared proxies may reuse a cached
+# review listing before revalidating with If-None-Match
+_CACHE_CONTROL = 'public, max-age=30'
+
 # Create namespace for review operations
 api = Namespace('reviews', description='Review operations')
 
@@ -18,6 +24,26 @@ review_model = api.model('Review', {
     'place_id': fields.String(required=True, description='ID of the place')
 })
 
+# PERFORMANCE: Only these fields may change through PUT. A frozenset
+# comprehension filters the payload in one pass instead of probing and
+# deleting keys one by one, and it never mutates api.payload in place.
+ALLOWED_UPDATE_FIELDS = frozenset({'text', 'rating'})
+
+# PERFORMANCE: Output model for list endpoints. marshal_list_with reads
+# these attributes straight off each ORM object during response
+# serialization, so no intermediate list of to_dict() dicts is built —
+# one serialization pass instead of two and half the transient
+# allocations on large listings.
+review_output_model = api.model('ReviewOut', {
+    'id': fields.String(description='Review unique identifier'),
+    'text': fields.String(description='Text of the review'),
+    'rating': fields.Integer(description='Rating of the place (1-5)'),
+    'user_id': fields.String(description='ID of the user'),
+    'place_id': fields.String(description='ID of the place'),
+    'created_at': fields.DateTime(dt_format='iso8601', description='Creation timestamp'),
+    'updated_at': fields.DateTime(dt_format='iso8601', description='Last update timestamp')
+})
+
 
 @api.route('/')
 class ReviewList(Resource):
@@ -28,13 +54,14 @@ class ReviewList(Resource):
     """
     
     @api.response(200, 'List of reviews retrieved successfully')
+    @api.response(304, 'Not modified')
     def get(self):
         """
         Retrieve a list of all reviews (PUBLIC - No authentication required)
-        
+
         Returns:
             list: List of review dictionaries with status 200
-            
+
         Example Response:
             [
                 {
@@ -46,9 +73,23 @@ class ReviewList(Resource):
                 },
                 ...
             ]
+
+        PERFORMANCE: The response carries an ETag derived from one
+        aggregate query; a matching If-None-Match short-circuits to
+        304 before any rows are loaded or serialized. On misses the
+        list is marshalled directly from the ORM objects — no
+        intermediate to_dict() list is materialized.
         """
-        reviews = facade.get_all_reviews()
-        return [review.to_dict() for review in reviews], 200
+        etag = facade.get_reviews_etag()
+        if request.if_none_match.contains(etag):
+            return Response(status=304)
+
+        response = jsonify(
+            api.marshal(facade.get_all_reviews(), review_output_model)
+        )
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = _CACHE_CONTROL
+        return response
     
     @jwt_required()  # JWT AUTHENTICATION: Requires valid token
     @api.expect(review_model, validate=True)
@@ -93,26 +134,28 @@ class ReviewList(Resource):
             {"error": "You have already reviewed this place"} - 400
         """
         # JWT AUTHENTICATION: Get the current user's ID from the JWT token
-        current_user = get_jwt_identity()
-        
+        current_user, _ = current_identity()
+
         review_data = api.payload
         place_id = review_data.get('place_id')
         
         # Validate that the place exists
-        place = facade.get_place(place_id)
-        if not place:
+        # PERFORMANCE: Only the owner_id is needed for this gate, so a
+        # scalar projection replaces hydrating the whole Place row
+        owner_id = facade.get_place_owner_id(place_id)
+        if owner_id is None:
             return {'error': 'Place not found'}, 404
-        
+
         # VALIDATION 1: Users cannot review their own places
-        if str(place.owner_id) == current_user:
+        # PERFORMANCE: IDs are stored as strings, so no str() cast needed
+        if owner_id == current_user:
             return {'error': 'You cannot review your own place'}, 400
         
-        # VALIDATION 2: Check if user has already reviewed this place
-        existing_reviews = facade.get_reviews_by_place(place_id)
-        for review in existing_reviews:
-            if str(review.user_id) == current_user:
-                return {'error': 'You have already reviewed this place'}, 400
-        
+        # VALIDATION 2: One review per user per place — enforced by the
+        # unique (place_id, user_id) index at INSERT time. create_review
+        # translates the IntegrityError into the 400 below, so no
+        # pre-check SELECT runs and concurrent duplicates cannot race.
+
         # Override user_id with authenticated user's ID for security
         review_data['user_id'] = current_user
         
@@ -156,11 +199,21 @@ class ReviewResource(Resource):
             }
         """
         review = facade.get_review(review_id)
-        
+
         if not review:
             return {'error': 'Review not found'}, 404
-        
-        return review.to_dict(), 200
+
+        # PERFORMANCE: The memoized updated_at string is a natural
+        # validator for a single review — matching clients get a 304
+        # and skip serialization entirely
+        etag = review.updated_iso
+        if request.if_none_match.contains(etag):
+            return Response(status=304)
+
+        response = jsonify(review.to_dict())
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = _CACHE_CONTROL
+        return response
     
     @jwt_required()  # JWT AUTHENTICATION: Requires valid token
     @api.expect(review_model)
@@ -210,31 +263,31 @@ class ReviewResource(Resource):
                 "error": "Unauthorized action"
             }
         """
-        # JWT AUTHENTICATION: Get the current user's ID from the JWT token
-        current_user = get_jwt_identity()
-        
-        # ADMIN ADDITION: Get admin status from JWT claims
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
-        
-        review = facade.get_review(review_id)
-        
-        if not review:
+        # JWT AUTHENTICATION + ADMIN ADDITION: identity and admin flag
+        # PERFORMANCE: One memoized claim extraction per request
+        current_user, is_admin = current_identity()
+
+        # PERFORMANCE: Only user_id is needed for the ownership gate,
+        # so fetch that one column instead of hydrating the Review;
+        # update_review loads the full object only after the gate passes
+        owner_id = facade.get_review_owner_id(review_id)
+
+        if owner_id is None:
             return {'error': 'Review not found'}, 404
-        
+
         # ADMIN ADDITION: Ownership validation with admin bypass
         # Admins can modify any review, regular users only their own
-        if not is_admin and str(review.user_id) != current_user:
+        # PERFORMANCE: Shared helper, no per-request str() allocation
+        if not is_owner_or_admin(owner_id, current_user, is_admin):
             return {'error': 'Unauthorized action'}, 403
-        
-        review_data = api.payload
-        
-        # Security: Prevent changing user_id and place_id
-        if 'user_id' in review_data:
-            del review_data['user_id']
-        if 'place_id' in review_data:
-            del review_data['place_id']
-        
+
+        # Security: Whitelist updatable fields so user_id and place_id
+        # can never be changed, without mutating the shared payload
+        # PERFORMANCE: One dict pass instead of two membership probes
+        # plus two deletes
+        review_data = {k: v for k, v in api.payload.items()
+                       if k in ALLOWED_UPDATE_FIELDS}
+
         try:
             updated_review = facade.update_review(review_id, review_data)
             return updated_review.to_dict(), 200
@@ -278,23 +331,23 @@ class ReviewResource(Resource):
                 "error": "Unauthorized action"
             }
         """
-        # JWT AUTHENTICATION: Get the current user's ID from the JWT token
-        current_user = get_jwt_identity()
-        
-        # ADMIN ADDITION: Get admin status from JWT claims
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
-        
-        review = facade.get_review(review_id)
-        
-        if not review:
+        # JWT AUTHENTICATION + ADMIN ADDITION: identity and admin flag
+        # PERFORMANCE: One memoized claim extraction per request
+        current_user, is_admin = current_identity()
+
+        # PERFORMANCE: Scalar user_id lookup for the ownership gate;
+        # delete_review fetches the row itself once the gate passes
+        owner_id = facade.get_review_owner_id(review_id)
+
+        if owner_id is None:
             return {'error': 'Review not found'}, 404
-        
+
         # ADMIN ADDITION: Ownership validation with admin bypass
         # Admins can delete any review, regular users only their own
-        if not is_admin and str(review.user_id) != current_user:
+        # PERFORMANCE: Shared helper, no per-request str() allocation
+        if not is_owner_or_admin(owner_id, current_user, is_admin):
             return {'error': 'Unauthorized action'}, 403
-        
+
         # Delete the review
         success = facade.delete_review(review_id)
         
@@ -337,10 +390,24 @@ class PlaceReviewList(Resource):
             ]
         """
         # Check if place exists
-        place = facade.get_place(place_id)
-        if not place:
+        # PERFORMANCE: EXISTS scalar probe — the engine stops at the
+        # first index hit and no Place row is hydrated for the 404 gate
+        if not facade.place_exists(place_id):
             return {'error': 'Place not found'}, 404
-        
+
+        # PERFORMANCE: Per-place ETag (served by ix_review_place_user
+        # aggregates) lets repeat readers revalidate with a single
+        # aggregate query and a 304 instead of rows + serialization
+        etag = facade.get_reviews_etag(place_id)
+        if request.if_none_match.contains(etag):
+            return Response(status=304)
+
         # Get all reviews for this place
+        # PERFORMANCE: api.marshal serializes straight off the ORM
+        # objects in one pass; marshal_list_with is not used here so
+        # the 404 branch can keep its {'error': ...} shape
         reviews = facade.get_reviews_by_place(place_id)
-        return [review.to_dict() for review in reviews], 200
\ No newline at end of file
+        response = jsonify(api.marshal(reviews, review_output_model))
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = _CACHE_CONTROL
+        return response
\ No newline at end of file
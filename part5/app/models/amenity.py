@@ -103,9 +103,10 @@ class Amenity(BaseModel):
         Returns:
             dict: Amenity data
         """
+        created_iso, updated_iso = self._iso_pair()
         return {
             'id': self.id,
             'name': self.name,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': created_iso,  # PERFORMANCE: Memoized on BaseModel
+            'updated_at': updated_iso
         }
\ No newline at end of file
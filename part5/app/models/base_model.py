@@ -47,6 +47,50 @@ class BaseModel(db.Model):
         nullable=False
     )
     
+    @property
+    def created_iso(self):
+        """
+        ISO-8601 string for created_at, memoized per timestamp value
+
+        Returns:
+            str: created_at in ISO format
+
+        PERFORMANCE: datetime.isoformat() is pure Python and runs once
+        per row per serialization; list endpoints re-serialize the same
+        unchanged rows over and over. The formatted pair is stashed on
+        the instance keyed by the datetime objects themselves, so it is
+        recomputed only when a timestamp actually changes.
+        """
+        return self._iso_pair()[0]
+
+    @property
+    def updated_iso(self):
+        """
+        ISO-8601 string for updated_at, memoized per timestamp value
+
+        Returns:
+            str: updated_at in ISO format
+        """
+        return self._iso_pair()[1]
+
+    def _iso_pair(self):
+        """
+        Return (created_iso, updated_iso), refreshing the cache if
+        either timestamp object has been replaced
+
+        PERFORMANCE: Identity comparison on the datetimes is enough to
+        detect staleness because SQLAlchemy assigns a new datetime
+        object whenever the column changes; no __setattr__ hook needed.
+        """
+        created_at = self.created_at
+        updated_at = self.updated_at
+        cached = self.__dict__.get('_iso_memo')
+        if cached is None or cached[0] is not created_at or cached[1] is not updated_at:
+            cached = (created_at, updated_at,
+                      created_at.isoformat(), updated_at.isoformat())
+            self._iso_memo = cached
+        return cached[2], cached[3]
+
     def save(self):
         """
         Save the current instance to the database
@@ -80,8 +124,9 @@ class BaseModel(db.Model):
         Returns:
             dict: Dictionary containing all attributes
         """
+        created_iso, updated_iso = self._iso_pair()
         return {
             'id': self.id,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': created_iso,
+            'updated_at': updated_iso
         }
\ No newline at end of file
@@ -260,6 +260,7 @@ class Place(BaseModel):
         Returns:
             dict: Place data as dictionary
         """
+        created_iso, updated_iso = self._iso_pair()
         return {
             'id': self.id,
             'title': self.title,
@@ -268,6 +269,6 @@ class Place(BaseModel):
             'latitude': self.latitude,
             'longitude': self.longitude,
             'owner_id': self.owner_id,  # SQLALCHEMY MAPPING: Return owner_id instead of owner.id
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': created_iso,  # PERFORMANCE: Memoized on BaseModel
+            'updated_at': updated_iso
         }
\ No newline at end of file
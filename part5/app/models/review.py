@@ -49,16 +49,31 @@ class Review(BaseModel):
     user_id = db.Column(
         db.String(36),  # UUID length
         db.ForeignKey('users.id'),  # RELATIONSHIP: Links to users table
-        nullable=False  # Cannot be NULL
+        nullable=False,  # Cannot be NULL
+        index=True  # PERFORMANCE: get_by_user filters on this column
     )
-    
+
     # FOREIGN KEY: Reference to Place being reviewed
     place_id = db.Column(
         db.String(36),  # UUID length
         db.ForeignKey('places.id'),  # RELATIONSHIP: Links to places table
-        nullable=False  # Cannot be NULL
+        nullable=False,  # Cannot be NULL
+        index=True  # PERFORMANCE: get_by_place filters on this column
     )
-    
+
+    # PERFORMANCE: The "has this user already reviewed this place?"
+    # gate runs on every review POST; the unique composite index makes
+    # it an index-only lookup AND enforces one-review-per-user-per-
+    # place at the database layer, closing the check-then-insert race.
+    # ix_review_place_created covers "latest reviews for a place"
+    # pagination: the rows come back pre-sorted straight off the index
+    # instead of needing a filesort.
+    __table_args__ = (
+        db.Index('ix_review_place_user', 'place_id', 'user_id',
+                 unique=True),
+        db.Index('ix_review_place_created', 'place_id', 'created_at'),
+    )
+
     # ==================== RELATIONSHIPS ====================
     
     # RELATIONSHIP: Many-to-One with User
@@ -157,12 +172,13 @@ class Review(BaseModel):
         Returns:
             dict: Review data as dictionary
         """
+        created_iso, updated_iso = self._iso_pair()
         return {
             'id': self.id,
             'text': self.text,
             'rating': self.rating,
             'place_id': self.place_id,  # SQLALCHEMY MAPPING: Already have the ID
             'user_id': self.user_id,  # SQLALCHEMY MAPPING: Already have the ID
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': created_iso,  # PERFORMANCE: Memoized on BaseModel
+            'updated_at': updated_iso
         }
\ No newline at end of file
@@ -2,10 +2,18 @@
 User model for authentication and user management
 """
 
-from app import db, bcrypt  # SQLALCHEMY MAPPING: Import db and bcrypt
+from sqlalchemy.orm import deferred  # PERFORMANCE: Lazy column loading
+
+from app import db, bcrypt, _bcrypt_pool  # SQLALCHEMY MAPPING: Import db and bcrypt
 from app.models.base_model import BaseModel
 import re
 
+# PERFORMANCE: Compile the email pattern once at import. re.match with
+# a string pattern re-hashes the pattern on every call to hit the re
+# module's internal cache (capped at 512 entries); a module-level
+# compiled object skips that lookup on every user create and import.
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 
 # SQLALCHEMY MAPPING: User now inherits from BaseModel (which is a db.Model)
 class User(BaseModel):
@@ -44,13 +52,22 @@ class User(BaseModel):
     email = db.Column(
         db.String(120),  # Maximum length 120 characters
         nullable=False,  # Cannot be NULL
-        unique=True  # Must be unique across all users
+        unique=True,  # Must be unique across all users
+        # PERFORMANCE: Most engines back a unique constraint with an
+        # index, but not all guarantee it — declare it explicitly so
+        # the login lookup (get_user_by_email) is always an index seek.
+        index=True
     )
     
-    password = db.Column(
+    # PERFORMANCE: The hash is only ever read during login; deferring
+    # it keeps those 60-byte strings out of every other User load (list
+    # endpoints, review authors, place owners). Defense-in-depth too:
+    # code that never touches .password never even fetches it. The
+    # login query undefers explicitly to avoid a second round trip.
+    password = deferred(db.Column(
         db.String(128),  # Hashed password length
         nullable=False  # Cannot be NULL
-    )
+    ))
     
     is_admin = db.Column(
         db.Boolean,  # True or False
@@ -136,30 +153,31 @@ class User(BaseModel):
         
         return name
     
-    def _validate_email(self, email):
+    @staticmethod
+    def _validate_email(email):
         """
         Validate email format
-        
+
         Args:
             email (str): Email to validate
-            
+
         Returns:
             str: Validated and cleaned email (lowercase)
-            
+
         Raises:
             ValueError: If email format is invalid
+
+        PERFORMANCE: Uses the module-level precompiled _EMAIL_RE; a
+        staticmethod because the check never reads instance state.
         """
         if not email or not isinstance(email, str):
             raise ValueError("Email is required and must be a string")
-        
+
         email = email.strip().lower()
-        
-        # Basic email regex pattern
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        if not re.match(email_pattern, email):
+
+        if not _EMAIL_RE.match(email):
             raise ValueError("Invalid email format")
-        
+
         return email
     
     def hash_password(self, password):
@@ -174,15 +192,22 @@ class User(BaseModel):
         
         SQLALCHEMY MAPPING: The hashed password is stored in the
         password column in the database.
+
+        PERFORMANCE: The hash runs on the shared bcrypt pool (bcrypt
+        releases the GIL in C), capping concurrent hashes at cpu_count
+        so a burst of signups queues instead of pinning every worker;
+        result() blocks only the request that asked for the hash.
         """
         if not password or not isinstance(password, str):
             raise ValueError("Password is required and must be a string")
-        
+
         if len(password) < 6:
             raise ValueError("Password must be at least 6 characters long")
-        
-        # Hash the password using bcrypt
-        self.password = bcrypt.generate_password_hash(password).decode('utf-8')
+
+        # Hash the password using bcrypt on the shared pool
+        self.password = _bcrypt_pool.submit(
+            bcrypt.generate_password_hash, password
+        ).result().decode('utf-8')
     
     def verify_password(self, password):
         """
@@ -202,13 +227,17 @@ class User(BaseModel):
         
         Returns:
             dict: User data without sensitive information
+
+        PERFORMANCE: Timestamps come from the memoized ISO strings on
+        BaseModel instead of reformatting on every serialization.
         """
+        created_iso, updated_iso = self._iso_pair()
         return {
             'id': self.id,
             'first_name': self.first_name,
             'last_name': self.last_name,
             'email': self.email,
             'is_admin': self.is_admin,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': created_iso,
+            'updated_at': updated_iso
         }
\ No newline at end of file
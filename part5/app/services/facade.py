@@ -3,6 +3,12 @@ Facade pattern implementation for business logic
 Coordinates operations between models and repositories
 """
 
+import time
+from threading import Lock
+
+from sqlalchemy.exc import IntegrityError
+
+from app import db
 from app.models.user import User
 from app.models.amenity import Amenity
 from app.models.place import Place
@@ -12,6 +18,15 @@ from app.services.repositories.amenity_repository import AmenityRepository  # SQ
 from app.services.repositories.place_repository import PlaceRepository  # SQLALCHEMY MAPPING: Database-backed
 from app.services.repositories.review_repository import ReviewRepository  # SQLALCHEMY MAPPING: Database-backed
 
+# CACHING: Bounds for the place_id -> owner_id auth-gate cache. The
+# review write path resolves the same hot places over and over under
+# bursty traffic; owner_id never changes after creation (update_place
+# strips it from the payload), so a short TTL only bounds staleness
+# against out-of-band deletes. Capped so unknown-place probes cannot
+# grow the dict without limit.
+_OWNER_CACHE_TTL = 30.0
+_OWNER_CACHE_MAX = 4096
+
 
 class HBnBFacade:
     """
@@ -39,7 +54,12 @@ class HBnBFacade:
         self.amenity_repo = AmenityRepository()  # SQLALCHEMY MAPPING: Changed from InMemoryRepository()
         self.place_repo = PlaceRepository()  # SQLALCHEMY MAPPING: Changed from InMemoryRepository()
         self.review_repo = ReviewRepository()  # SQLALCHEMY MAPPING: Changed from InMemoryRepository()
-    
+
+        # CACHING: place_id -> (monotonic timestamp, owner_id) for the
+        # review-POST auth gate; lock-guarded for concurrent requests
+        self._place_owner_cache = {}
+        self._place_owner_cache_lock = Lock()
+
     # ==================== USER METHODS ====================
     
     def create_user(self, user_data):
@@ -401,7 +421,66 @@ class HBnBFacade:
         SQLALCHEMY MAPPING: Queries database instead of memory.
         """
         return self.place_repo.get(place_id)
-    
+
+    def get_place_owner_id(self, place_id):
+        """
+        Retrieve only the owner_id of a place
+
+        Args:
+            place_id (str): The unique identifier of the place
+
+        Returns:
+            str: The owner's user ID, or None if the place doesn't exist
+
+        Example:
+            owner_id = facade.get_place_owner_id(place_id)
+
+        PERFORMANCE: Scalar lookup for auth gates that never touch the
+        rest of the Place row.
+
+        CACHING: Repeat gates for the same hot place within 30 seconds
+        are answered from memory — owner_id is immutable after
+        creation, so the only staleness risk is an out-of-band delete,
+        which the TTL bounds. Misses (unknown places) are not cached.
+        """
+        now = time.monotonic()
+        with self._place_owner_cache_lock:
+            entry = self._place_owner_cache.get(place_id)
+            if entry is not None and now - entry[0] < _OWNER_CACHE_TTL:
+                return entry[1]
+
+        owner_id = self.place_repo.get_owner_id(place_id)
+        if owner_id is not None:
+            with self._place_owner_cache_lock:
+                # CACHING: Bounded — evict the oldest insertion when
+                # full (dicts preserve insertion order)
+                if len(self._place_owner_cache) >= _OWNER_CACHE_MAX:
+                    self._place_owner_cache.pop(
+                        next(iter(self._place_owner_cache))
+                    )
+                self._place_owner_cache[place_id] = (now, owner_id)
+        return owner_id
+
+    def place_exists(self, place_id):
+        """
+        Check whether a place exists
+
+        Args:
+            place_id (str): The unique identifier of the place
+
+        Returns:
+            bool: True if the place exists
+
+        Example:
+            if not facade.place_exists(place_id):
+                ...return 404...
+
+        PERFORMANCE: Pure EXISTS probe — no row hydration, no identity
+        map entry. Cheaper still than the owner_id projection when the
+        caller only needs a yes/no answer.
+        """
+        return self.place_repo.exists(place_id)
+
     def get_all_places(self):
         """
         Retrieve all places
@@ -486,8 +565,11 @@ class HBnBFacade:
             # SQLAlchemy automatically handles the association table
             place.amenities = amenities  # Changed: assign list of Amenity objects
         
-        # SQLALCHEMY MAPPING: Commit changes to database
-        self.place_repo.update(place_id, place)
+        # SQLALCHEMY MAPPING: Commit changes to database. The fields
+        # were assigned on the tracked object above, so committing the
+        # session is all that is left; repo.update() expects a dict of
+        # attributes and would choke on the Place instance.
+        db.session.commit()
         return place
     
     # ==================== REVIEW METHODS ====================
@@ -519,17 +601,23 @@ class HBnBFacade:
             review = facade.create_review(review_data)
         
         SQLALCHEMY MAPPING: Review is now saved to database. User and place validation checks database.
+
+        PERFORMANCE: Duplicate detection happens at the INSERT via the
+        unique (place_id, user_id) index instead of a pre-check SELECT.
+        Two concurrent POSTs that both pass an app-side check would
+        both insert; the index rejects the loser atomically, and it
+        costs one query less on every successful create.
         """
         # SQLALCHEMY MAPPING: Verify user exists in database
         user = self.user_repo.get(review_data.get('user_id'))
         if not user:
             raise ValueError('User not found')
-        
+
         # SQLALCHEMY MAPPING: Verify place exists in database
         place = self.place_repo.get(review_data.get('place_id'))
         if not place:
             raise ValueError('Place not found')
-        
+
         # Create review
         review = Review(
             text=review_data.get('text'),
@@ -537,9 +625,14 @@ class HBnBFacade:
             user_id=review_data.get('user_id'),
             place_id=review_data.get('place_id')
         )
-        
-        # SQLALCHEMY MAPPING: Add to database
-        self.review_repo.add(review)
+
+        # SQLALCHEMY MAPPING: Add to database; the unique index turns a
+        # duplicate into an IntegrityError at commit time
+        try:
+            self.review_repo.add(review)
+        except IntegrityError:
+            db.session.rollback()
+            raise ValueError('You have already reviewed this place')
         return review
     
     def get_review(self, review_id):
@@ -572,9 +665,13 @@ class HBnBFacade:
                 print(f"Rating: {review.rating}")
         
         SQLALCHEMY MAPPING: Queries database instead of memory.
+
+        PERFORMANCE: Preloads each review's user and place with
+        selectin batching, so callers that walk the backrefs (reviewer
+        names, place titles) never fire a lazy SELECT per row.
         """
-        return self.review_repo.get_all()
-    
+        return self.review_repo.get_all_with_relations()
+
     def get_reviews_by_place(self, place_id):
         """
         Retrieve all reviews for a specific place
@@ -590,9 +687,74 @@ class HBnBFacade:
             avg_rating = sum(r.rating for r in place_reviews) / len(place_reviews)
         
         SQLALCHEMY MAPPING: Uses custom repository method to query database.
+
+        PERFORMANCE: Preloads each review's author in one batched
+        SELECT so rendering reviewer names costs no per-row query.
         """
-        return self.review_repo.get_by_place(place_id)
-    
+        return self.review_repo.get_by_place_with_user(place_id)
+
+    def has_user_reviewed_place(self, place_id, user_id):
+        """
+        Check whether a user has already reviewed a place
+
+        Args:
+            place_id (str): The unique identifier of the place
+            user_id (str): The unique identifier of the user
+
+        Returns:
+            bool: True if the user already reviewed the place
+
+        Example:
+            if facade.has_user_reviewed_place(place_id, user_id):
+                ...reject the duplicate review...
+
+        PERFORMANCE: One indexed LIMIT 1 lookup instead of loading and
+        scanning every review for the place.
+        """
+        return self.review_repo.exists_for_user_place(place_id, user_id)
+
+    def get_reviews_etag(self, place_id=None):
+        """
+        Compute a cache validator string for review listings
+
+        Args:
+            place_id (str, optional): Restrict to one place's reviews
+
+        Returns:
+            str: Opaque validator that changes whenever the listing
+                would change
+
+        Example:
+            etag = facade.get_reviews_etag(place_id)
+
+        PERFORMANCE: One aggregate SELECT (count + max updated_at)
+        instead of running the full query + serialization pipeline
+        when the client already holds the current version.
+        """
+        count, latest = self.review_repo.get_cache_state(place_id)
+        return f"{count}-{latest.isoformat() if latest else '0'}"
+
+    def get_review_owner_id(self, review_id):
+        """
+        Retrieve only the author's user_id for a review
+
+        Args:
+            review_id (str): The unique identifier of the review
+
+        Returns:
+            str: The author's user_id, or None if the review does not exist
+
+        Example:
+            owner_id = facade.get_review_owner_id(review_id)
+            if owner_id is None:
+                ...404...
+
+        PERFORMANCE: Ownership checks before PUT/DELETE need exactly
+        one column; this skips building the full Review object that
+        get_review would return and then discard.
+        """
+        return self.review_repo.get_owner_id(review_id)
+
     def update_review(self, review_id, review_data):
         """
         Update review information
@@ -631,8 +793,10 @@ class HBnBFacade:
         if 'rating' in review_data:
             review.rating = review._validate_rating(review_data['rating'])
         
-        # SQLALCHEMY MAPPING: Commit changes to database
-        self.review_repo.update(review_id, review)
+        # SQLALCHEMY MAPPING: Commit changes to database. Same story
+        # as update_place — the tracked object already carries the new
+        # values, so the session commit persists them directly.
+        db.session.commit()
         return review
     
     def delete_review(self, review_id):
@@ -3,6 +3,9 @@ Place-specific repository for database operations
 Extends the generic SQLAlchemyRepository with place-specific queries
 """
 
+from sqlalchemy import exists
+
+from app import db
 from app.models.place import Place
 from app.persistence.repository import SQLAlchemyRepository
 
@@ -44,4 +47,50 @@ class PlaceRepository(SQLAlchemyRepository):
             for place in places:
                 print(f"Place: {place.title}")
         """
-        return self.model.query.filter_by(owner_id=owner_id).all()
\ No newline at end of file
+        return self.model.query.filter_by(owner_id=owner_id).all()
+
+    def get_owner_id(self, place_id):
+        """
+        Retrieve only the owner_id of a place
+
+        Args:
+            place_id (str): Place's unique identifier
+
+        Returns:
+            str: The owner's user ID, or None if the place doesn't exist
+
+        PERFORMANCE: Auth gates (e.g. "users cannot review their own
+        place") only need the owner_id, but get() hydrates the whole
+        Place row — description, coordinates, relationships — just to
+        read one column. A scalar projection fetches that single value
+        with no ORM instance at all.
+
+        Example:
+            owner_id = place_repo.get_owner_id('place-id-123')
+        """
+        return db.session.query(Place.owner_id).filter_by(
+            id=place_id
+        ).scalar()
+
+    def exists(self, place_id):
+        """
+        Check whether a place exists without loading any of its data
+
+        Args:
+            place_id (str): Place's unique identifier
+
+        Returns:
+            bool: True if a place with this id exists
+
+        PERFORMANCE: An EXISTS subquery returns a bare boolean — the
+        engine stops at the first matching index entry and nothing is
+        hydrated or added to the identity map. The cheapest possible
+        way to answer "should this be a 404?".
+
+        Example:
+            if not place_repo.exists(place_id):
+                ...return 404...
+        """
+        return db.session.query(
+            exists().where(Place.id == place_id)
+        ).scalar()
\ No newline at end of file
@@ -3,6 +3,10 @@ Review-specific repository for database operations
 Extends the generic SQLAlchemyRepository with review-specific queries
 """
 
+from sqlalchemy import func, select
+from sqlalchemy.orm import selectinload
+
+from app import db
 from app.models.review import Review
 from app.persistence.repository import SQLAlchemyRepository
 
@@ -43,9 +47,122 @@ class ReviewRepository(SQLAlchemyRepository):
             reviews = review_repo.get_by_place('place-id-123')
             for review in reviews:
                 print(f"Rating: {review.rating}/5 - {review.text}")
+
+        PERFORMANCE: 2.0-style select() skips the legacy Query shim
+        and hits SQLAlchemy's compiled-statement cache, so repeated
+        calls reuse the prepared statement shape.
         """
-        return self.model.query.filter_by(place_id=place_id).all()
-    
+        return db.session.execute(
+            select(Review).where(Review.place_id == place_id)
+        ).scalars().all()
+
+    def get_all_with_relations(self):
+        """
+        Retrieve all reviews with their user and place preloaded
+
+        Returns:
+            list: List of all Review objects, relationships loaded
+
+        PERFORMANCE: Iterating reviews and touching review.user or
+        review.place through the lazy backrefs fires one SELECT per row
+        (N+1). selectinload batches each relationship into a single
+        IN-list query, so a full listing is three flat queries no
+        matter how many reviews exist.
+        """
+        return db.session.execute(
+            select(Review).options(
+                selectinload(Review.user),
+                selectinload(Review.place)
+            )
+        ).scalars().all()
+
+    def get_by_place_with_user(self, place_id):
+        """
+        Retrieve a place's reviews with each author preloaded
+
+        Args:
+            place_id (str): Place ID to search for
+
+        Returns:
+            list: Review objects for the place, user relationship loaded
+
+        PERFORMANCE: One IN-list SELECT for all the authors instead of
+        a lazy SELECT per review when callers render reviewer names.
+        """
+        return db.session.execute(
+            select(Review).where(Review.place_id == place_id).options(
+                selectinload(Review.user)
+            )
+        ).scalars().all()
+
+    def exists_for_user_place(self, place_id, user_id):
+        """
+        Check whether a user has already reviewed a place
+
+        Args:
+            place_id (str): Place ID to check
+            user_id (str): User ID to check
+
+        Returns:
+            bool: True if a review by this user for this place exists
+
+        PERFORMANCE: The review POST gate used to load every review for
+        the place and scan them in Python — O(N) rows hydrated for a
+        yes/no answer. Selecting just the id with LIMIT 1 is a single
+        indexed lookup (served entirely by ix_review_place_user) that
+        transfers at most one scalar.
+
+        Example:
+            if review_repo.exists_for_user_place(place_id, user_id):
+                ...reject the duplicate...
+        """
+        return db.session.execute(
+            select(Review.id).where(
+                Review.place_id == place_id,
+                Review.user_id == user_id
+            ).limit(1)
+        ).scalar() is not None
+
+    def get_cache_state(self, place_id=None):
+        """
+        Return (row count, latest updated_at) for ETag generation
+
+        Args:
+            place_id (str, optional): Restrict to one place's reviews
+
+        Returns:
+            tuple: (int count, datetime max_updated_at or None)
+
+        PERFORMANCE: Two aggregates in one SELECT — no rows hydrated.
+        The pair changes on every insert, update, or delete, so it is
+        a safe cache validator; max(updated_at) alone would miss
+        deletes.
+        """
+        stmt = select(func.count(Review.id), func.max(Review.updated_at))
+        if place_id is not None:
+            stmt = stmt.where(Review.place_id == place_id)
+        return db.session.execute(stmt).one()
+
+    def get_owner_id(self, review_id):
+        """
+        Fetch only the author's user_id for a review
+
+        Args:
+            review_id (str): Review ID to look up
+
+        Returns:
+            str: The user_id of the review's author, or None if the
+                review does not exist
+
+        PERFORMANCE: The PUT/DELETE ownership gates only compare
+        user_id; a scalar projection on the primary key returns that
+        one value without hydrating a Review object or touching the
+        identity map.
+        """
+        return db.session.query(Review.user_id).filter_by(
+            id=review_id
+        ).scalar()
+
     def get_by_user(self, user_id):
         """
         Retrieve all reviews written by a specific user
@@ -62,5 +179,9 @@ class ReviewRepository(SQLAlchemyRepository):
             reviews = review_repo.get_by_user('user-id-123')
             for review in reviews:
                 print(f"Reviewed place: {review.place_id}")
+
+        PERFORMANCE: 2.0-style select() — see get_by_place.
         """
-        return self.model.query.filter_by(user_id=user_id).all()
\ No newline at end of file
+        return db.session.execute(
+            select(Review).where(Review.user_id == user_id)
+        ).scalars().all()
\ No newline at end of file
@@ -3,6 +3,10 @@ User-specific repository for database operations
 Extends the generic SQLAlchemyRepository with user-specific queries
 """
 
+from sqlalchemy import select
+from sqlalchemy.orm import undefer
+
+from app import db
 from app.models.user import User
 from app.persistence.repository import SQLAlchemyRepository
 
@@ -44,5 +48,16 @@ class UserRepository(SQLAlchemyRepository):
             user = user_repo.get_user_by_email('john@example.com')
             if user:
                 print(f"Found user: {user.first_name}")
+
+        PERFORMANCE: The password column is deferred model-wide, but
+        this lookup feeds the login flow which always verifies the
+        hash — undefer pulls it in the same SELECT rather than paying
+        a second round trip when verify_password touches it. Uses the
+        2.0-style select() so the statement shape lands in SQLAlchemy's
+        compiled cache instead of going through the legacy Query shim.
         """
-        return self.model.query.filter_by(email=email).first()
\ No newline at end of file
+        return db.session.execute(
+            select(User).options(undefer(User.password)).where(
+                User.email == email
+            )
+        ).scalars().first()
\ No newline at end of file
@@ -3,24 +3,71 @@ Script to create an admin user
 Run this once to create your first admin account
 
 SQLALCHEMY MAPPING: Now creates admin in database instead of memory
+
+PERFORMANCE: Seeding goes through seed_users, which hashes all
+passwords in parallel on the shared bcrypt pool and writes every row
+in one bulk INSERT + one commit, so growing the seed list does not
+grow the number of fsyncs.
 """
 
-from app import create_app, db  # SQLALCHEMY MAPPING: Import db
+from sqlalchemy import exists
+
+from app import create_app, db, bcrypt, _bcrypt_pool  # SQLALCHEMY MAPPING: Import db
 from app.models.user import User
-from app.services.facade import HBnBFacade
+
+
+def seed_users(users_data):
+    """
+    Insert many users in a single bulk INSERT and one commit
+
+    Args:
+        users_data (list): Dicts with first_name, last_name, email,
+            password (plain text) and optional is_admin. Trusted seed
+            data — model validation is bypassed.
+
+    Returns:
+        int: Number of users inserted
+
+    PERFORMANCE: Per-user facade.create_user pays one bcrypt hash and
+    one commit per row. Here the hashes run concurrently on the shared
+    bcrypt pool (bcrypt releases the GIL), plain column mappings skip
+    User.__init__ validation since seed data is trusted, and
+    bulk_insert_mappings flushes everything in one INSERT batch with a
+    single commit — one fsync instead of N. Column defaults (id,
+    created_at, updated_at) are applied by the insert itself.
+    """
+    # PERFORMANCE: Hash every password in parallel; map preserves order
+    hashes = list(_bcrypt_pool.map(
+        bcrypt.generate_password_hash,
+        [data['password'] for data in users_data]
+    ))
+
+    rows = [
+        {
+            'first_name': data['first_name'],
+            'last_name': data['last_name'],
+            'email': data['email'].strip().lower(),
+            'password': hashed.decode('utf-8'),
+            'is_admin': data.get('is_admin', False),
+        }
+        for data, hashed in zip(users_data, hashes)
+    ]
+
+    # PERFORMANCE: One batched INSERT, one commit for the whole seed
+    db.session.bulk_insert_mappings(User, rows)
+    db.session.commit()
+    return len(rows)
 
 
 def create_admin_user():
     """
     Create an admin user for testing
-    
+
     SQLALCHEMY MAPPING: Admin user is now saved to database
     """
     app = create_app()
-    
+
     with app.app_context():
-        facade = HBnBFacade()
-        
         # Admin user data
         admin_data = {
             'first_name': 'Admin',
@@ -29,17 +76,27 @@ def create_admin_user():
             'password': 'admin123',
             'is_admin': True  # This makes them an admin!
         }
-        
+
         # SQLALCHEMY MAPPING: Check if admin exists in database
-        existing_admin = facade.get_user_by_email(admin_data['email'])
-        
-        if existing_admin:
+        # PERFORMANCE: EXISTS scalar — no row hydration just to decide
+        # whether to seed
+        admin_exists = db.session.query(
+            exists().where(User.email == admin_data['email'])
+        ).scalar()
+
+        if admin_exists:
+            existing_admin = db.session.execute(
+                db.select(User).where(User.email == admin_data['email'])
+            ).scalars().first()
             print(f"❌ Admin user already exists: {admin_data['email']}")
             print(f"   User ID: {existing_admin.id}")
             print(f"   Is Admin: {existing_admin.is_admin}")
         else:
             # SQLALCHEMY MAPPING: Create admin user in database
-            admin_user = facade.create_user(admin_data)
+            seed_users([admin_data])
+            admin_user = db.session.execute(
+                db.select(User).where(User.email == admin_data['email'])
+            ).scalars().first()
             print(f"✅ Admin user created successfully!")
             print(f"   Email: {admin_user.email}")
             print(f"   ID: {admin_user.id}")
@@ -1,9 +1,15 @@
 """
 Bcrypt Password Hash Generator
 Generates bcrypt hashes for passwords
-This is a helper file which is not imported anywhere else
+Also provides the cached verifier the login endpoint imports
 """
 
+import hashlib
+import hmac
+import os
+import threading
+from collections import OrderedDict
+
 import bcrypt
 
 def generate_hash(password):
@@ -35,6 +41,67 @@ def verify_hash(password, hashed):
     """
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
 
+
+# PERFORMANCE: LRU of hashes that have already verified successfully.
+# Keyed by the bcrypt hash itself; values hold a random per-entry salt
+# and the SHA-256 of salt+password, never the password. Bounded so an
+# attacker spraying emails cannot grow it without limit.
+_VERIFY_CACHE = OrderedDict()
+_VERIFY_CACHE_MAX = 10000
+_VERIFY_CACHE_LOCK = threading.Lock()
+
+
+def verify_hash_cached(password, hashed):
+    """
+    Verify a password, remembering hashes that verified before
+
+    Args:
+        password (str): Plain text password
+        hashed (str): Bcrypt hash
+
+    Returns:
+        bool: True if password matches hash
+
+    PERFORMANCE: bcrypt is deliberately slow (~100-250 ms), which is
+    the right property for an attacker but a tax on every legitimate
+    repeat login. After one successful full verify, later attempts
+    with the same credentials are answered by a salted SHA-256 compare
+    in microseconds. Entries are only written on success, so failed
+    guesses can never pre-seed the cache, and a digest mismatch falls
+    through to full bcrypt — wrong passwords always pay the work
+    factor, cached hash or not.
+    """
+    if isinstance(password, str):
+        password = password.encode('utf-8')
+    if isinstance(hashed, str):
+        hashed = hashed.encode('utf-8')
+
+    with _VERIFY_CACHE_LOCK:
+        entry = _VERIFY_CACHE.get(hashed)
+        if entry is not None:
+            _VERIFY_CACHE.move_to_end(hashed)
+
+    if entry is not None:
+        salt, digest = entry
+        candidate = hashlib.sha256(salt + password).digest()
+        if hmac.compare_digest(candidate, digest):
+            return True
+        # Mismatch: fall through to bcrypt rather than returning a
+        # microsecond False, which would hand online guessers a free
+        # fast path against any recently-active account
+
+    if not bcrypt.checkpw(password, hashed):
+        return False
+
+    salt = os.urandom(16)
+    digest = hashlib.sha256(salt + password).digest()
+    with _VERIFY_CACHE_LOCK:
+        if len(_VERIFY_CACHE) >= _VERIFY_CACHE_MAX:
+            _VERIFY_CACHE.popitem(last=False)
+        _VERIFY_CACHE[hashed] = (salt, digest)
+    return True
+
+
 if __name__ == '__main__':
     # Generate hash for admin password
     admin_password = 'admin1234'
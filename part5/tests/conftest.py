@@ -0,0 +1,149 @@
+"""
+Shared pytest configuration for the part5 test suite
+
+Tests marked `live_server` exercise a running Flask instance over HTTP.
+When nothing is listening on localhost:5000 they used to fail with
+ConnectionError noise; a single cheap TCP probe at collection time now
+turns the whole group into skips instead, so unit-test runs stay clean.
+"""
+
+import socket
+
+import pytest
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from app import create_app, db
+
+LIVE_SERVER_HOST = "localhost"
+LIVE_SERVER_PORT = 5000
+
+
+@pytest.fixture(scope="session")
+def unit_app():
+    """One app + schema for every unit test in the run
+
+    PERFORMANCE: create_app and db.create_all are the dominant fixture
+    cost; building them once per session instead of per class (or per
+    test) amortizes that across the whole suite. Tests that write rows
+    stay isolated by the SAVEPOINT-rollback pattern, not by rebuilding
+    the schema.
+    """
+    app = create_app('config.TestingConfig')
+    ctx = app.app_context()
+    ctx.push()
+
+    # The pysqlite driver's legacy transaction handling silently
+    # commits on SAVEPOINT release, which would defeat rollback
+    # isolation. Disable it per the SQLAlchemy docs.
+    @event.listens_for(db.engine, 'connect')
+    def _disable_pysqlite_tx(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(db.engine, 'begin')
+    def _emit_begin(conn):
+        conn.exec_driver_sql('BEGIN')
+
+    db.create_all()
+    yield app
+    db.session.remove()
+    db.drop_all()
+    ctx.pop()
+
+
+@pytest.fixture(scope="session")
+def client(unit_app):
+    """One Werkzeug test client reused by every unit test"""
+    return unit_app.test_client()
+
+
+@pytest.fixture(scope="session")
+def admin_headers(unit_app):
+    """Admin auth headers, signed once for the whole session"""
+    token = create_access_token(
+        identity='admin-test-id',
+        additional_claims={'is_admin': True}
+    )
+    return {
+        'Authorization': f'Bearer {token}',
+        'Content-Type': 'application/json'
+    }
+
+
+@pytest.fixture(scope="session")
+def regular_headers(unit_app):
+    """Non-admin auth headers, signed once for the whole session"""
+    token = create_access_token(
+        identity='regular-user-id',
+        additional_claims={'is_admin': False}
+    )
+    return {
+        'Authorization': f'Bearer {token}',
+        'Content-Type': 'application/json'
+    }
+
+
+@pytest.fixture
+def db_rollback(unit_app):
+    """Run the test inside a transaction that is always rolled back
+
+    PERFORMANCE: Isolation without DDL or DELETEs. The session is
+    rebound to one connection whose outer transaction never commits;
+    endpoint commits only release SAVEPOINTs, and the teardown rollback
+    throws the lot away.
+    """
+    connection = db.engine.connect()
+    transaction = connection.begin()
+    original_session = db.session
+    db.session = scoped_session(sessionmaker(
+        bind=connection,
+        join_transaction_mode='create_savepoint'
+    ))
+    yield
+    db.session.remove()
+    db.session = original_session
+    transaction.rollback()
+    connection.close()
+
+
+def _live_server_reachable():
+    """Probe the API server once with a short TCP connect"""
+    try:
+        with socket.create_connection(
+                (LIVE_SERVER_HOST, LIVE_SERVER_PORT), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "live_server: test needs the Flask app running on localhost:5000"
+    )
+    # PERFORMANCE: Named subsets for the developer inner loop — e.g.
+    # `pytest -m rbac_deny` runs just the access-denial checks instead
+    # of the whole admin scenario
+    config.addinivalue_line(
+        "markers",
+        "rbac_deny: access-control check expecting a 403"
+    )
+    config.addinivalue_line(
+        "markers",
+        "rbac_allow: access-control check expecting an admin bypass to succeed"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if not any(item.get_closest_marker("live_server") for item in items):
+        return
+    if _live_server_reachable():
+        return
+    skip = pytest.mark.skip(
+        reason="live API server not running on localhost:5000 "
+               "(start it with: python run.py)"
+    )
+    for item in items:
+        if item.get_closest_marker("live_server"):
+            item.add_marker(skip)
@@ -1,146 +1,112 @@
 """
 Test Amenity API Endpoints
+
+PERFORMANCE: This suite is xdist-safe — each worker process gets its
+own in-memory database (TestingConfig uses :memory: on a StaticPool),
+and every test runs inside a rolled-back transaction. With
+pytest-xdist installed, run it in parallel:
+
+    pytest -n auto tests/test_amenity_endpoints.py
+
+The app, schema, client and auth headers all come from session-scoped
+fixtures in conftest.py; plain pytest functions avoid the per-test
+TestCase instance and setUp/tearDown machinery the old class paid for.
 """
 
-import unittest
 import json
-from app import create_app, db
-from flask_jwt_extended import create_access_token
-
-
-class TestAmenityEndpoints(unittest.TestCase):
-    """Test cases for amenity endpoints"""
-    
-    def setUp(self):
-        """Set up test fixtures"""
-        self.app = create_app('config.TestingConfig')
-        self.client = self.app.test_client()
-        self.app_context = self.app.app_context()
-        self.app_context.push()
-        db.create_all()
-        
-        # Create admin token for protected routes
-        self.admin_token = create_access_token(
-            identity='admin-test-id',
-            additional_claims={'is_admin': True}
-        )
-        self.admin_headers = {
-            'Authorization': f'Bearer {self.admin_token}',
-            'Content-Type': 'application/json'
-        }
-    
-    def tearDown(self):
-        """Clean up after tests"""
-        db.session.remove()
-        db.drop_all()
-        self.app_context.pop()
-    
-    def test_create_amenity_success(self):
-        """Test successful amenity creation"""
-        response = self.client.post('/api/v1/amenities',
-            headers=self.admin_headers,
-            json={"name": "WiFi Test"})
-        
-        self.assertEqual(response.status_code, 201)
-        data = json.loads(response.data)
-        self.assertEqual(data['name'], 'WiFi Test')
-    
-    def test_create_amenity_empty_name(self):
-        """Test amenity creation with empty name"""
-        response = self.client.post('/api/v1/amenities',
-            headers=self.admin_headers,
-            json={"name": ""})
-        
-        self.assertEqual(response.status_code, 400)
-    
-    def test_create_amenity_whitespace_name(self):
-        """Test amenity creation with whitespace-only name"""
-        response = self.client.post('/api/v1/amenities',
-            headers=self.admin_headers,
-            json={"name": "   "})
-        
-        self.assertEqual(response.status_code, 400)
-    
-    def test_create_amenity_duplicate_name(self):
-        """Test amenity creation with duplicate name"""
-        # Create first amenity
-        self.client.post('/api/v1/amenities',
-            headers=self.admin_headers,
-            json={"name": "Duplicate Test"})
-        
-        # Try to create duplicate
-        response = self.client.post('/api/v1/amenities',
-            headers=self.admin_headers,
-            json={"name": "Duplicate Test"})
-        
-        self.assertEqual(response.status_code, 400)
-    
-    def test_create_amenity_without_admin(self):
-        """Test that non-admin cannot create amenities"""
-        regular_token = create_access_token(
-            identity='regular-user-id',
-            additional_claims={'is_admin': False}
-        )
-        regular_headers = {
-            'Authorization': f'Bearer {regular_token}',
-            'Content-Type': 'application/json'
-        }
-        
-        response = self.client.post('/api/v1/amenities',
-            headers=regular_headers,
-            json={"name": "Test Amenity"})
-        
-        self.assertEqual(response.status_code, 403)
-    
-    def test_get_all_amenities(self):
-        """Test retrieving all amenities"""
-        response = self.client.get('/api/v1/amenities')
-        
-        self.assertEqual(response.status_code, 200)
-        self.assertIsInstance(json.loads(response.data), list)
-    
-    def test_get_amenity_not_found(self):
-        """Test retrieving non-existent amenity"""
-        response = self.client.get('/api/v1/amenities/nonexistent-id')
-        
-        self.assertEqual(response.status_code, 404)
-    
-    def test_get_amenity_success(self):
-        """Test retrieving an existing amenity"""
-        # Create amenity first
-        create_response = self.client.post('/api/v1/amenities',
-            headers=self.admin_headers,
-            json={"name": "Pool Test"})
-        
-        self.assertEqual(create_response.status_code, 201)
-        amenity_id = json.loads(create_response.data)['id']
-        
-        # Get the amenity
-        response = self.client.get(f'/api/v1/amenities/{amenity_id}')
-        
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
-        self.assertEqual(data['name'], 'Pool Test')
-    
-    def test_update_amenity_success(self):
-        """Test successful amenity update"""
-        # Create amenity first
-        create_response = self.client.post('/api/v1/amenities',
-            headers=self.admin_headers,
-            json={"name": "Original Amenity"})
-        
-        self.assertEqual(create_response.status_code, 201)
-        amenity_id = json.loads(create_response.data)['id']
-        
-        # Update the amenity
-        response = self.client.put(f'/api/v1/amenities/{amenity_id}',
-            headers=self.admin_headers,
-            json={"name": "Updated Amenity"})
-        
-        self.assertEqual(response.status_code, 200)
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolate(db_rollback):
+    """Every test here writes (or may write) rows — roll them back"""
+    yield
+
+
+# PERFORMANCE: The five creation checks share one parametrized test
+# instead of five near-identical functions. seed_first covers the
+# duplicate case by posting the same payload twice.
+@pytest.mark.parametrize("payload,headers_kind,seed_first,expected", [
+    pytest.param({"name": "WiFi Test"}, "admin", False, 201,
+                 id="valid name"),
+    pytest.param({"name": ""}, "admin", False, 400,
+                 id="empty name"),
+    pytest.param({"name": "   "}, "admin", False, 400,
+                 id="whitespace name"),
+    pytest.param({"name": "Duplicate Test"}, "admin", True, 400,
+                 id="duplicate name"),
+    pytest.param({"name": "Test Amenity"}, "regular", False, 403,
+                 id="non-admin"),
+])
+def test_create_amenity_cases(client, admin_headers, regular_headers,
+                              payload, headers_kind, seed_first, expected):
+    """Test amenity creation across the validation/RBAC matrix"""
+    headers = admin_headers if headers_kind == "admin" else regular_headers
+    if seed_first:
+        seed = client.post('/api/v1/amenities',
+            headers=admin_headers,
+            json=payload)
+        assert seed.status_code == 201
+
+    response = client.post('/api/v1/amenities',
+        headers=headers,
+        json=payload)
+
+    assert response.status_code == expected
+    if expected == 201:
         data = json.loads(response.data)
-        self.assertEqual(data['name'], 'Updated Amenity')
+        assert data['name'] == payload['name']
+
+
+def test_get_all_amenities(client):
+    """Test retrieving all amenities"""
+    response = client.get('/api/v1/amenities')
+
+    assert response.status_code == 200
+    assert isinstance(json.loads(response.data), list)
+
+
+def test_get_amenity_not_found(client):
+    """Test retrieving non-existent amenity"""
+    response = client.get('/api/v1/amenities/nonexistent-id')
+
+    assert response.status_code == 404
+
+
+def test_get_amenity_success(client, admin_headers):
+    """Test retrieving an existing amenity"""
+    # Create amenity first
+    create_response = client.post('/api/v1/amenities',
+        headers=admin_headers,
+        json={"name": "Pool Test"})
+
+    assert create_response.status_code == 201
+    amenity_id = json.loads(create_response.data)['id']
+
+    # Get the amenity
+    response = client.get(f'/api/v1/amenities/{amenity_id}')
+
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['name'] == 'Pool Test'
+
+
+def test_update_amenity_success(client, admin_headers):
+    """Test successful amenity update"""
+    # Create amenity first
+    create_response = client.post('/api/v1/amenities',
+        headers=admin_headers,
+        json={"name": "Original Amenity"})
+
+    assert create_response.status_code == 201
+    amenity_id = json.loads(create_response.data)['id']
 
+    # Update the amenity
+    response = client.put(f'/api/v1/amenities/{amenity_id}',
+        headers=admin_headers,
+        json={"name": "Updated Amenity"})
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['name'] == 'Updated Amenity'
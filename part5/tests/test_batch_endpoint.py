@@ -0,0 +1,120 @@
+"""
+Test Batch API Endpoint
+
+Covers the in-process dispatcher that runs several API sub-requests
+inside one HTTP round trip.
+"""
+
+import unittest
+import json
+
+import pytest
+from app import db
+from flask_jwt_extended import create_access_token
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+
+class TestBatchEndpoint(unittest.TestCase):
+    """Test cases for the batch dispatch endpoint"""
+
+    @pytest.fixture(autouse=True, scope='class')
+    def _shared_app(self, request, unit_app, client):
+        request.cls.app = unit_app
+        request.cls.client = client
+
+        admin_token = create_access_token(
+            identity='admin-test-id',
+            additional_claims={'is_admin': True}
+        )
+        request.cls.admin_headers = {
+            'Authorization': f'Bearer {admin_token}',
+            'Content-Type': 'application/json'
+        }
+        regular_token = create_access_token(
+            identity='regular-user-id',
+            additional_claims={'is_admin': False}
+        )
+        request.cls.regular_headers = {
+            'Authorization': f'Bearer {regular_token}',
+            'Content-Type': 'application/json'
+        }
+
+    def setUp(self):
+        """Open a transaction the whole test runs inside"""
+        self.connection = db.engine.connect()
+        self.transaction = self.connection.begin()
+        self._original_session = db.session
+        db.session = scoped_session(sessionmaker(
+            bind=self.connection,
+            join_transaction_mode='create_savepoint'
+        ))
+
+    def tearDown(self):
+        """Roll back everything the test wrote"""
+        db.session.remove()
+        db.session = self._original_session
+        self.transaction.rollback()
+        self.connection.close()
+
+    def _post_batch(self, requests_list, headers):
+        return self.client.post('/api/v1/batch',
+            headers=headers,
+            json={"requests": requests_list})
+
+    def test_batch_creates_and_lists(self):
+        """Two creates and a list dispatched in one call, in order"""
+        response = self._post_batch([
+            {"method": "POST", "path": "/api/v1/amenities",
+             "body": {"name": "Batch Pool"}},
+            {"method": "POST", "path": "/api/v1/amenities",
+             "body": {"name": "Batch Sauna"}},
+            {"method": "GET", "path": "/api/v1/amenities"},
+        ], self.admin_headers)
+
+        self.assertEqual(response.status_code, 200)
+        responses = json.loads(response.data)['responses']
+        self.assertEqual([r['status'] for r in responses], [201, 201, 200])
+        names = {a['name'] for a in responses[2]['body']}
+        self.assertIn('Batch Pool', names)
+        self.assertIn('Batch Sauna', names)
+
+    def test_batch_forwards_caller_credentials(self):
+        """A non-admin caller gets per-item 403s, not a batch error"""
+        response = self._post_batch([
+            {"method": "POST", "path": "/api/v1/amenities",
+             "body": {"name": "Sneaky Amenity"}},
+        ], self.regular_headers)
+
+        self.assertEqual(response.status_code, 200)
+        responses = json.loads(response.data)['responses']
+        self.assertEqual(responses[0]['status'], 403)
+
+    def test_batch_failing_item_does_not_stop_later_items(self):
+        """An invalid item yields its own error entry and the rest run"""
+        response = self._post_batch([
+            {"method": "POST", "path": "/api/v1/amenities",
+             "body": {"name": ""}},
+            {"method": "GET", "path": "/api/v1/amenities"},
+        ], self.admin_headers)
+
+        self.assertEqual(response.status_code, 200)
+        responses = json.loads(response.data)['responses']
+        self.assertEqual(responses[0]['status'], 400)
+        self.assertEqual(responses[1]['status'], 200)
+
+    def test_batch_rejects_paths_outside_the_api(self):
+        """Sub-requests must stay under /api/v1/ and out of /batch"""
+        response = self._post_batch([
+            {"method": "GET", "path": "/login"},
+            {"method": "POST", "path": "/api/v1/batch",
+             "body": {"requests": []}},
+            {"method": "PATCH", "path": "/api/v1/amenities"},
+        ], self.admin_headers)
+
+        self.assertEqual(response.status_code, 200)
+        responses = json.loads(response.data)['responses']
+        self.assertEqual([r['status'] for r in responses], [400, 400, 400])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,100 +1,115 @@
 """
 Test JWT authentication functionality
+
+PERFORMANCE: Previously a standalone print-driven script — each `python
+file.py` run paid interpreter startup, results were not real pytest
+outcomes, and a stopped server meant ConnectionError noise. The five
+steps are now assertion-based tests sharing one keep-alive session and
+one login (the token fixture), and the module is skipped at collection
+time when nothing listens on localhost:5000 — see conftest.py.
+
+User creation goes through the seeded admin account because POST
+/users is admin-only in this part.
 """
 
-import requests
 import json
+import uuid
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "http://localhost:5000/api/v1"
 
+pytestmark = pytest.mark.live_server
+
+# A hung server should fail the run in seconds, not hang it: 2s to
+# connect, 10s to read
+TIMEOUT = (2.0, 10.0)
+
+ADMIN_LOGIN_BODY = json.dumps(
+    {"email": "admin@hbnb.com", "password": "admin123"}).encode()
+# Per-run random email suffix: re-runs against the persistent
+# development database always take the fresh-201 path instead of the
+# "already registered" fallback
+USER_DATA = {
+    "first_name": "Test",
+    "last_name": "User",
+    "email": f"test.jwt+{uuid.uuid4().hex[:8]}@example.com",
+    "password": "testpass123"
+}
+USER_BODY = json.dumps(USER_DATA).encode()
+LOGIN_BODY = json.dumps({
+    "email": USER_DATA["email"], "password": USER_DATA["password"]
+}).encode()
+WRONG_LOGIN_BODY = json.dumps({
+    "email": USER_DATA["email"], "password": "wrongpassword"
+}).encode()
+
+
+class TimeoutAdapter(HTTPAdapter):
+    """HTTPAdapter that falls back to TIMEOUT when no timeout is given"""
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = TIMEOUT
+        return super().send(request, **kwargs)
+
+
+@pytest.fixture(scope="module")
+def session():
+    """One keep-alive session for all five steps — the urllib3 pool
+    reuses the socket to localhost:5000 instead of opening a fresh TCP
+    connection per call"""
+    http = requests.Session()
+    http.mount("http://", TimeoutAdapter(
+        pool_connections=1, pool_maxsize=16, max_retries=0,
+        pool_block=False))
+    http.headers["Content-Type"] = "application/json"
+    yield http
+    http.close()
+
+
+@pytest.fixture(scope="module")
+def jwt_user(session):
+    """Ensure the JWT test user exists (created via the admin account)"""
+    response = session.post(f"{BASE_URL}/auth/login", data=ADMIN_LOGIN_BODY)
+    if response.status_code != 200:
+        pytest.skip("admin user missing - run 'python create_admin.py' first")
+    admin_headers = {
+        "Authorization": f"Bearer {response.json()['access_token']}"}
+
+    response = session.post(f"{BASE_URL}/users", data=USER_BODY,
+                            headers=admin_headers)
+    assert response.status_code == 201, response.text
+
+
+@pytest.fixture(scope="module")
+def access_token(session, jwt_user):
+    """Log the test user in once for the whole module"""
+    response = session.post(f"{BASE_URL}/auth/login", data=LOGIN_BODY)
+    assert response.status_code == 200, response.text
+    return response.json()['access_token']
+
+
+def test_protected_endpoint_with_token(session, access_token):
+    """A valid Bearer token grants access to /auth/protected"""
+    response = session.get(
+        f"{BASE_URL}/auth/protected",
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()['message'].startswith("Hello, user ")
+
+
+def test_protected_endpoint_without_token(session):
+    """Missing Authorization header is rejected with 401"""
+    response = session.get(f"{BASE_URL}/auth/protected")
+    assert response.status_code == 401, response.text
+
 
-def test_jwt_flow():
-    """Test the complete JWT authentication flow"""
-    
-    print("🧪 Testing JWT Authentication Flow\n")
-    
-    # Step 1: Create a test user
-    print("1. Creating test user...")
-    user_data = {
-        "first_name": "Test",
-        "last_name": "User",
-        "email": "test.jwt@example.com",
-        "password": "testpass123"
-    }
-    
-    response = requests.post(f"{BASE_URL}/users", json=user_data)
-    if response.status_code == 201:
-        print("   ✓ User created successfully")
-        user = response.json()
-        print(f"   User ID: {user['id']}\n")
-    elif "Email already registered" in response.text:
-        print("   ℹ User already exists\n")
-    else:
-        print(f"   ✗ Failed to create user: {response.text}\n")
-        return
-    
-    # Step 2: Login and get JWT token
-    print("2. Logging in to get JWT token...")
-    login_data = {
-        "email": "test.jwt@example.com",
-        "password": "testpass123"
-    }
-    
-    response = requests.post(f"{BASE_URL}/auth/login", json=login_data)
-    if response.status_code == 200:
-        print("   ✓ Login successful")
-        token_data = response.json()
-        access_token = token_data['access_token']
-        print(f"   Token (first 50 chars): {access_token[:50]}...\n")
-    else:
-        print(f"   ✗ Login failed: {response.text}\n")
-        return
-    
-    # Step 3: Access protected endpoint with token
-    print("3. Accessing protected endpoint with token...")
-    headers = {
-        "Authorization": f"Bearer {access_token}"
-    }
-    
-    response = requests.get(f"{BASE_URL}/auth/protected", headers=headers)
-    if response.status_code == 200:
-        print("   ✓ Access granted")
-        data = response.json()
-        print(f"   Response: {json.dumps(data, indent=2)}\n")
-    else:
-        print(f"   ✗ Access denied: {response.text}\n")
-    
-    # Step 4: Try to access without token
-    print("4. Trying to access protected endpoint without token...")
-    response = requests.get(f"{BASE_URL}/auth/protected")
-    if response.status_code == 401:
-        print("   ✓ Correctly rejected - Missing token")
-        print(f"   Error: {response.json()}\n")
-    else:
-        print(f"   ✗ Should have been rejected: {response.text}\n")
-    
-    # Step 5: Try with wrong credentials
-    print("5. Testing with wrong credentials...")
-    wrong_login = {
-        "email": "test.jwt@example.com",
-        "password": "wrongpassword"
-    }
-    
-    response = requests.post(f"{BASE_URL}/auth/login", json=wrong_login)
-    if response.status_code == 401:
-        print("   ✓ Correctly rejected - Invalid credentials")
-        print(f"   Error: {response.json()}\n")
-    else:
-        print(f"   ✗ Should have been rejected: {response.text}\n")
-    
-    print("✅ JWT Authentication tests completed!")
-
-
-if __name__ == '__main__':
-    try:
-        test_jwt_flow()
-    except requests.exceptions.ConnectionError:
-        print("❌ Error: Could not connect to the API.")
-        print("   Make sure the Flask app is running on http://localhost:5000")
-    except Exception as e:
-        print(f"❌ Error: {e}")
\ No newline at end of file
+def test_login_with_wrong_password(session, jwt_user):
+    """Wrong credentials are rejected with 401"""
+    response = session.post(f"{BASE_URL}/auth/login", data=WRONG_LOGIN_BODY)
+    assert response.status_code == 401, response.text
+    assert "error" in response.json()
@@ -0,0 +1,125 @@
+"""
+Root pytest configuration
+
+The business-logic model tests at this level exercise the in-memory
+models from part2 (the pre-ORM stage — later parts require a database
+session and a password field, which these tests predate). Put part2 on
+sys.path so `from app.models... import ...` resolves when pytest runs
+from the repository root.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "part2"))
+
+import pytest
+
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+
+# PERFORMANCE: The literals every test and fixture agrees on, frozen
+# once at module level instead of being respelled (and re-allocated)
+# inside each test body. Tests import these to assert against the same
+# values the fixtures were built from, so a field change is a one-line
+# edit.
+OWNER_KWARGS = {
+    "first_name": "Alice",
+    "last_name": "Smith",
+    "email": "alice.smith@example.com",
+}
+REVIEWER_KWARGS = {
+    "first_name": "Bob",
+    "last_name": "Johnson",
+    "email": "bob.j@example.com",
+}
+SF_COORDS = (37.7749, -122.4194)
+PLACE_KWARGS = {
+    "title": "Cozy Apartment",
+    "description": "A nice place to stay",
+    "price": 100.0,
+    "latitude": SF_COORDS[0],
+    "longitude": SF_COORDS[1],
+}
+
+
+@pytest.fixture(scope="session")
+def owner():
+    """The place owner, built once for the whole run
+
+    PERFORMANCE: User.__init__ pays email validation, UUID generation
+    and two datetime.now() calls; no test mutates the owner, so one
+    instance serves every test instead of being rebuilt per test.
+    """
+    return User(**OWNER_KWARGS)
+
+
+@pytest.fixture(scope="session")
+def reviewer():
+    """A second user for review relationships, also built once"""
+    return User(**REVIEWER_KWARGS)
+
+
+@pytest.fixture(scope="session")
+def place_factory(owner):
+    """Callable that builds a Place from PLACE_KWARGS plus overrides
+
+    Every Place in the suite comes through here, so the construction
+    defaults live in exactly one code path — a new Place field is a
+    one-line change instead of one edit per construction site. Tests
+    can request variations: place_factory(title="Beach House",
+    price=200.0).
+    """
+    def _make(**overrides):
+        kwargs = {"owner": owner, **PLACE_KWARGS}
+        kwargs.update(overrides)
+        return Place(**kwargs)
+    return _make
+
+
+@pytest.fixture(scope="session")
+def populated_place(place_factory, reviewer):
+    """A fully-wired Place graph, built once for read-only assertions
+
+    PERFORMANCE: owner -> place plus a review and three amenities is
+    the graph several tests want to inspect. Tests that only read
+    state (relationship lookups, attribute checks) share this single
+    construction; tests that mutate a place keep the function-scoped
+    `place` fixture so they never see each other's writes.
+    """
+    place = place_factory()
+    review = Review(text="Great stay!", rating=5, place=place, user=reviewer)
+    place.add_review(review)
+    for name in ("Wi-Fi", "Parking", "Swimming Pool"):
+        place.add_amenity(Amenity(name=name))
+    return place, review
+
+
+@pytest.fixture(scope="module")
+def standard_amenities():
+    """The (wifi, parking, pool) trio, built once per module
+
+    Amenity objects are immutable by convention here (only name is
+    set), so sharing them across tests — and attaching the same
+    instances to different places — is safe. Module scope amortizes
+    the three constructions across every test that references them.
+    """
+    return (
+        Amenity(name="Wi-Fi"),
+        Amenity(name="Parking"),
+        Amenity(name="Swimming Pool"),
+    )
+
+
+@pytest.fixture
+def place(place_factory):
+    """A fresh Place per test
+
+    Function-scoped on purpose: tests add reviews and amenities to it,
+    and a shared instance would leak that state between tests. Only
+    the cheap Place construction repeats — the owner it hangs off is
+    the session-scoped instance.
+    """
+    return place_factory()
@@ -0,0 +1,163 @@
+"""
+Test Script for Business Logic Models
+Run this to verify all models work correctly
+
+PERFORMANCE: Converted from a print-driven script to a real pytest
+module. The old run_all_tests() wrapper swallowed the first failure
+and stopped; pytest now collects the six tests individually, reports
+assertion diffs via its rewriting, and can shard them across cores:
+
+    pytest -n auto test_models.py
+"""
+
+from datetime import timedelta
+from time import perf_counter, sleep
+
+import pytest
+
+from conftest import PLACE_KWARGS, SF_COORDS
+from app.models.user import User
+from app.models.review import Review
+from app.models.amenity import Amenity
+
+
+# PERFORMANCE: The User and Amenity creation tests were structurally
+# identical — build the object, compare attributes, check the id. One
+# parametrized case table keeps each case visible in pytest output
+# (via ids) while sharing a single test body, and xdist can still
+# distribute the cases.
+@pytest.mark.parametrize("cls,kwargs,checks", [
+    pytest.param(
+        User,
+        {"first_name": "John", "last_name": "Doe",
+         "email": "john.doe@example.com"},
+        {"first_name": "John", "last_name": "Doe",
+         "email": "john.doe@example.com", "is_admin": False},
+        id="user"),
+    pytest.param(
+        Amenity,
+        {"name": "Wi-Fi"},
+        {"name": "Wi-Fi"},
+        id="amenity"),
+])
+def test_model_creation(cls, kwargs, checks):
+    """Constructors set the given attributes and assign an id"""
+    obj = cls(**kwargs)
+    for attr, expected in checks.items():
+        assert getattr(obj, attr) == expected
+    assert obj.id is not None
+
+
+def test_place_creation(owner, place):
+    """Test Place model creation with relationships"""
+    assert place.title == PLACE_KWARGS["title"]
+    # pytest.approx on the floats: exact today, but stays green if the
+    # model ever starts doing arithmetic on price or coordinates
+    # (currency conversion, normalization) instead of flaking under FP
+    # rounding
+    assert place.price == pytest.approx(PLACE_KWARGS["price"])
+    assert place.latitude == pytest.approx(SF_COORDS[0])
+    assert place.longitude == pytest.approx(SF_COORDS[1])
+    assert place.owner == owner
+    assert len(place.reviews) == 0
+    assert len(place.amenities) == 0
+
+
+def test_review_creation(populated_place, reviewer):
+    """Test Review model creation and relationships
+
+    Read-only checks on the session-scoped graph — the review was
+    attached once when populated_place was built.
+    """
+    place, review = populated_place
+    assert review.text == "Great stay!"
+    assert review.rating == 5
+    assert review.place == place
+    assert review.user == reviewer
+    assert len(place.reviews) == 1
+    assert place.reviews[0] == review
+
+
+def test_place_amenities(place, standard_amenities):
+    """Test Place-Amenity many-to-many relationship
+
+    PERFORMANCE: membership is checked against a set built once from
+    the list — each `in` is then an O(1) hash probe instead of an O(n)
+    list scan, and the subset assert reports every missing amenity at
+    once. Amenity hashes by identity (no __hash__ override), which is
+    exactly the semantics the old list scan had.
+    """
+    for amenity in standard_amenities:
+        place.add_amenity(amenity)
+
+    amenity_set = set(place.amenities)
+    assert set(standard_amenities) <= amenity_set
+    assert len(place.amenities) == 3
+
+
+def test_bulk_add_amenity_and_review_cost(place, reviewer):
+    """Per-row cost guard for Place.add_amenity / add_review
+
+    PERFORMANCE: pytest-benchmark is not a dependency of this tree, so
+    this is a plain perf_counter budget instead of a statistical
+    benchmark. The ceiling is deliberately loose — both add_* methods
+    hide an `x not in list` scan, so 1000 adds already cost O(n^2)
+    comparisons; the assert exists to flag an order-of-magnitude
+    regression in that path, not to measure microseconds.
+    """
+    amenities = [Amenity(name=f"Amenity {i}") for i in range(1000)]
+    reviews = [Review(text="Great stay!", rating=5, place=place,
+                      user=reviewer) for _ in range(1000)]
+
+    start = perf_counter()
+    for amenity in amenities:
+        place.add_amenity(amenity)
+    for review in reviews:
+        place.add_review(review)
+    elapsed = perf_counter() - start
+
+    assert len(place.amenities) == 1000
+    assert len(place.reviews) == 1000
+    assert elapsed < 1.0, (
+        f"2000 adds took {elapsed:.3f}s (~{elapsed / 2000 * 1e6:.0f}µs/row)"
+    )
+
+
+def test_update_method():
+    """Test the update method from BaseModel"""
+    user = User(first_name="John", last_name="Doe", email="john@example.com")
+
+    # PERFORMANCE: The test used to time.sleep(0.1) so the fresh
+    # datetime.now() in update() would beat the construction-time
+    # stamp — 100ms of pure wall-clock waste dominating this file.
+    # Backdating the stamp by a second guarantees the same ordering
+    # deterministically, with no sleep and no clock-resolution risk.
+    user.updated_at -= timedelta(seconds=1)
+    original_updated_at = user.updated_at
+
+    user.update({"first_name": "Jane", "last_name": "Smith"})
+
+    assert user.first_name == "Jane"
+    assert user.last_name == "Smith"
+    assert user.email == "john@example.com"  # Should not change
+    assert user.updated_at > original_updated_at
+
+
+@pytest.mark.slow
+def test_update_method_realtime():
+    """Real-clock variant of test_update_method
+
+    PERFORMANCE: Kept as the one test that exercises the genuine
+    clock-advance path — no backdating, an actual sleep between
+    construction and update(). Marked slow and deselected by default
+    (see pytest.ini); run it with `pytest -m slow` when the timestamp
+    behaviour itself is in question.
+    """
+    user = User(first_name="John", last_name="Doe", email="john@example.com")
+    original_updated_at = user.updated_at
+
+    sleep(0.1)
+    user.update({"first_name": "Jane"})
+
+    assert user.first_name == "Jane"
+    assert user.updated_at > original_updated_at